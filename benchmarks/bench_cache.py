@@ -0,0 +1,47 @@
+"""
+İkili önbellek benchmark'ı: CSV okuma vs önbellek derleme vs mmap ile açılış
+
+    python3 benchmarks/bench_cache.py --students 1000000 --firms 2000
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+from common import write_synthetic_csv
+
+from stajyer_cache import load_cached_store
+from stajyer_core import load_store
+
+
+def timed(label, func):
+    start = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<24} {elapsed * 1000:>10.1f} ms")
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="İkili önbellek açılış süresini ölç")
+    parser.add_argument('--students', type=int, default=200000)
+    parser.add_argument('--firms', type=int, default=2000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        students_path, firms_path = write_synthetic_csv(tmp, args.students, args.firms)
+        print(f"{args.students} öğrenci, {args.firms} firma")
+
+        timed("CSV -> CompactStore", lambda: load_store(students_path, firms_path))
+        timed("önbellek derleme", lambda: load_cached_store(students_path, firms_path,
+                                                             rebuild=True))
+        store = timed("mmap ile açılış", lambda: load_cached_store(students_path, firms_path))
+        timed("ilk tam tarama", lambda: sum(store.prefs))
+
+        os.utime(students_path)
+        timed("açılış (mtime değişti)", lambda: load_cached_store(students_path, firms_path))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""
+Çalıştırma geçmişi benchmark'ı: kayıt, iki çalıştırmanın farkı ve özet sorgu süreleri
+
+    python3 benchmarks/bench_history.py --students 50000 --firms 2000 --runs 2000
+
+Büyük sentetik veri setinde greedy ve heuristic sonuçları kaydedilir ve farkları alınır.
+Özet sorguları için depodaki küçük veri setinde (students.csv) --runs çalıştırma kaydedilir.
+Veritabanı geçici bir klasörde oluşturulur.
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+from common import ROOT, write_synthetic_csv
+
+from stajyer_core import ALGORITHMS, LOG_OFF, PlacementState, load_store
+from stajyer_history import RunStore
+from stajyer_report import PlacementReport
+
+
+def timed(function, *args, **kwargs):
+    start = time.perf_counter()
+    result = function(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+def report(label, seconds):
+    print(f"{label:<40} {seconds * 1000:>10.1f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Çalıştırma geçmişi sorgu süreleri")
+    parser.add_argument('--students', type=int, default=50000)
+    parser.add_argument('--firms', type=int, default=2000)
+    parser.add_argument('--runs', type=int, default=2000, help="Özet için küçük çalıştırma sayısı")
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        students_path, firms_path = write_synthetic_csv(tmp, args.students, args.firms,
+                                                        seed=args.seed)
+        big = load_store(students_path, firms_path, cache=False)
+        history = RunStore(os.path.join(tmp, "history.db"))
+
+        print(f"{args.students} öğrenci, {args.firms} firma")
+        _, elapsed = timed(history.dataset_id, big)
+        report("veri seti kaydı (öğrenci/firma id'leri)", elapsed)
+
+        state = PlacementState(big)
+        runs = []
+        for algorithm in ('greedy', 'heuristic'):
+            metrics = ALGORITHMS[algorithm](big, state, None, random.Random(1), LOG_OFF)
+            placements = PlacementReport(state)
+            run, elapsed = timed(history.record, big, state, metrics, algorithm, 1,
+                                 report=placements)
+            report(f"kayıt: {algorithm}", elapsed)
+            runs.append(run)
+        diff, elapsed = timed(history.diff, runs[0], runs[1], limit=100)
+        report(f"fark ({diff['changed']} öğrenci değişti)", elapsed)
+
+        small = load_store(os.path.join(ROOT, "students.csv"), os.path.join(ROOT, "firms.csv"))
+        state = PlacementState(small)
+        start = time.perf_counter()
+        for i in range(args.runs):
+            algorithm = 'heuristic' if i % 2 else 'greedy'
+            params = {'rejection_probability': (i % 5) / 10}
+            metrics = ALGORITHMS[algorithm](small, state, None, random.Random(i), LOG_OFF,
+                                            params=params)
+            history.record(small, state, metrics, algorithm, i, params)
+        elapsed = time.perf_counter() - start
+        print(f"\n{args.runs} küçük çalıştırma kaydedildi ({elapsed:.1f} sn, algoritmalar dahil)")
+
+        for by in (('algorithm',), ('algorithm', 'params')):
+            rows, elapsed = timed(history.aggregate, small, by)
+            report(f"özet: {' / '.join(by)} ({len(rows)} grup)", elapsed)
+        _, elapsed = timed(history.runs, small, 'heuristic', seed=args.runs - 1)
+        report("çalıştırma: algoritma + seed", elapsed)
+        _, elapsed = timed(history.student_history, small.student_ids[0], 50)
+        report("öğrenci geçmişi (son 50)", elapsed)
+        history.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,57 @@
+"""
+Yerel arama iyileştirmesi benchmark'ı: greedy/heuristic sonrası kazanç ve süre
+
+    python3 benchmarks/bench_improve.py --students 100000 --firms 2000 --budget 5
+"""
+
+import argparse
+import random
+import tempfile
+
+from common import write_synthetic_csv
+
+from stajyer_core import ALGORITHMS, LOG_OFF, PlacementState, load_store
+from stajyer_improve import MOVE_KINDS, improve_placement
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Yerel arama kazancını ve süresini ölç")
+    parser.add_argument('--students', type=int, default=100000)
+    parser.add_argument('--firms', type=int, default=2000)
+    parser.add_argument('--slack', type=float, default=1.15)
+    parser.add_argument('--budget', type=float, default=5.0, help="Süre sınırı (sn)")
+    parser.add_argument('-a', '--algorithms', nargs='+', default=['greedy', 'heuristic'],
+                        choices=['greedy', 'heuristic'])
+    parser.add_argument('--optimal', action='store_true',
+                        help="Optimal skoru da hesapla (büyük veride yavaş)")
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        students_path, firms_path = write_synthetic_csv(tmp, args.students, args.firms,
+                                                        seed=args.seed, slack=args.slack)
+        store = load_store(students_path, firms_path)
+    print(f"{args.students} öğrenci, {args.firms} firma, süre sınırı {args.budget} sn")
+
+    if args.optimal:
+        metrics = ALGORITHMS['optimal'](store, PlacementState(store), None, None, LOG_OFF)
+        print(f"optimal memnuniyet: {metrics['satisfaction_score']}")
+
+    for algorithm in args.algorithms:
+        state = PlacementState(store)
+        metrics = ALGORITHMS[algorithm](store, state, None, random.Random(args.seed), LOG_OFF)
+        result = improve_placement(state, args.budget)
+        print(f"\n{algorithm}: {metrics['satisfaction_score']} -> {result['satisfaction_score']} "
+              f"(+{result['gain']}), algoritma {metrics['total_time']:.2f} sn, "
+              f"yerel arama {result['total_time']:.2f} sn "
+              f"(kurulum {result['setup_time_ns'] / 1e9:.2f} sn), "
+              f"{result['passes']} geçiş, {result['stopped']}")
+        print(f"  {'hamle':<10} {'sayı':>8} {'kazanç':>8} {'süre (sn)':>10} {'kazanç/sn':>11}")
+        for kind in MOVE_KINDS:
+            row = result['by_kind'][kind]
+            print(f"  {kind:<10} {row['moves']:>8} {row['gain']:>8} "
+                  f"{row['time_ns'] / 1e9:>10.3f} {row['gain_per_second']:>11.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+Artımlı yeniden eşleştirme benchmark'ı: tek değişiklik vs baştan çalıştırma
+
+    python3 benchmarks/bench_incremental.py --students 100000 --firms 2000 --edits 200
+"""
+
+import argparse
+import random
+import statistics
+import tempfile
+import time
+
+from common import write_synthetic_csv
+
+from stajyer_core import LOG_OFF, PlacementState, load_store, run_deferred
+from stajyer_incremental import IncrementalMatcher
+
+
+def random_delta(kind, matcher, rng, firm_ids, counter):
+    """Verilen türde rastgele bir değişiklik"""
+    if kind == 'add':
+        return ('add', f"YENI{counter}", rng.sample(firm_ids, 5), round(rng.uniform(2.0, 4.0), 2))
+    if kind == 'remove':
+        return ('remove', rng.choice(matcher.store.student_ids))
+    if kind == 'capacity':
+        firm = rng.randrange(len(firm_ids))
+        change = rng.choice((-2, -1, 1, 2))
+        return ('capacity', firm_ids[firm], max(0, matcher.store.capacity[firm] + change))
+    return ('preferences', rng.choice(matcher.store.student_ids), rng.sample(firm_ids, 5))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Artımlı yeniden eşleştirme süresini ölç")
+    parser.add_argument('--students', type=int, default=100000)
+    parser.add_argument('--firms', type=int, default=2000)
+    parser.add_argument('--edits', type=int, default=200, help="Tür başına değişiklik sayısı")
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        students_path, firms_path = write_synthetic_csv(tmp, args.students, args.firms,
+                                                        seed=args.seed)
+        store = load_store(students_path, firms_path)
+    print(f"{args.students} öğrenci, {args.firms} firma")
+
+    start = time.perf_counter()
+    run_deferred(store, PlacementState(store), rng=random.Random(args.seed), log_level=LOG_OFF)
+    print(f"{'baştan çalıştırma':<24} {(time.perf_counter() - start) * 1000:>10.1f} ms")
+
+    start = time.perf_counter()
+    matcher = IncrementalMatcher(store, rng=random.Random(args.seed))
+    print(f"{'kurulum (+ilk eşleşme)':<24} {(time.perf_counter() - start) * 1000:>10.1f} ms")
+
+    rng = random.Random(args.seed)
+    firm_ids = store.firm_ids
+    counter = 0
+    print(f"\n{'değişiklik':<12} {'medyan':>9} {'p99':>9} {'max':>9} {'ort. fark':>10}  (ms)")
+    for kind in ('add', 'remove', 'capacity', 'preferences'):
+        times = []
+        changed = []
+        for _ in range(args.edits):
+            counter += 1
+            delta = random_delta(kind, matcher, rng, firm_ids, counter)
+            if kind in ('remove', 'preferences') and delta[1] not in matcher.student_index:
+                continue
+            start = time.perf_counter()
+            diff = matcher.apply([delta])
+            times.append((time.perf_counter() - start) * 1000)
+            changed.append(len(diff))
+        times.sort()
+        p99 = times[min(len(times) - 1, int(len(times) * 0.99))]
+        print(f"{kind:<12} {statistics.median(times):>9.3f} {p99:>9.3f} {times[-1]:>9.3f} "
+              f"{statistics.mean(changed):>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+CSV okuma benchmark'ı: satır/sn ve bellek tepe değeri
+
+    python3 benchmarks/bench_load.py --students 1000000 --firms 2000
+"""
+
+import argparse
+import csv
+import gc
+import tempfile
+import time
+import tracemalloc
+
+from common import write_synthetic_csv
+
+from stajyer_core import Student, iter_student_chunks, load_firms, load_students, load_store
+
+
+def dictreader_objects(students_path):
+    """Eski yöntem: DictReader ile tüm dosyayı Student listesine oku"""
+    students = []
+    with open(students_path, 'r', encoding='utf-8') as f:
+        for row in csv.DictReader(f):
+            students.append(Student(row['student_id'], row['preferences'].split(','),
+                                    float(row['gno'])))
+    return students
+
+
+def stream_only(students_path, firms):
+    """Sadece akışlı okuma ve doğrulama (sonuç tutulmaz)"""
+    rows = 0
+    for chunk in iter_student_chunks(students_path, firms):
+        rows += len(chunk)
+    return rows
+
+
+def measure(label, loader, n_students):
+    """Süre ve bellek ayrı çalıştırmalarda ölçülür (tracemalloc okumayı yavaşlatır)"""
+    gc.collect()
+    start = time.perf_counter()
+    data = loader()
+    elapsed = time.perf_counter() - start
+    del data
+
+    gc.collect()
+    tracemalloc.start()
+    data = loader()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:<22} {n_students / elapsed:>12,.0f} satır/sn {elapsed:>7.2f} sn "
+          f"tepe {peak / 1e6:>8.1f} MB")
+    return data
+
+
+def main():
+    parser = argparse.ArgumentParser(description="students.csv okuma hızını ölç")
+    parser.add_argument('--students', type=int, default=500000)
+    parser.add_argument('--firms', type=int, default=2000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        students_path, firms_path = write_synthetic_csv(tmp, args.students, args.firms)
+        firms = load_firms(firms_path)
+        print(f"{args.students} öğrenci, {args.firms} firma")
+
+        measure("DictReader -> nesneler", lambda: dictreader_objects(students_path),
+                args.students)
+        measure("load_students", lambda: load_students(students_path, firms=firms),
+                args.students)
+        measure("akışlı (doğrulama)", lambda: stream_only(students_path, firms), args.students)
+        measure("akışlı -> CompactStore", lambda: load_store(students_path, firms_path),
+                args.students)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""
+Bellek benchmark'ı: Student/Firm nesneleri vs CompactStore
+
+    python3 benchmarks/bench_memory.py --students 200000 --firms 2000
+"""
+
+import argparse
+import gc
+import tempfile
+import time
+import tracemalloc
+
+from common import write_synthetic_csv
+
+from stajyer_core import load_students, load_firms, load_store
+
+
+def measure(label, loader, n_students):
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    data = loader()
+    elapsed = time.perf_counter() - start
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:<14} {current / 1e6:>9.1f} MB {current / n_students:>8.0f} B/öğrenci "
+          f"{elapsed:>7.2f} sn")
+    return data
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Veri yapılarının bellek kullanımını ölç")
+    parser.add_argument('--students', type=int, default=200000)
+    parser.add_argument('--firms', type=int, default=2000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        students_path, firms_path = write_synthetic_csv(tmp, args.students, args.firms)
+        print(f"{args.students} öğrenci, {args.firms} firma")
+
+        objects = measure("nesneler", lambda: (load_firms(firms_path), load_students(students_path)),
+                          args.students)
+        del objects
+        store = measure("CompactStore", lambda: load_store(students_path, firms_path),
+                        args.students)
+        print(f"CompactStore.nbytes(): {store.nbytes() / 1e6:.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+"""
+Canlı ilerleme benchmark'ı: event_callback açıkken algoritma süresi (başsız çalıştırmaya göre)
+
+GUI'deki yol tkinter olmadan taklit edilir: algoritma thread'i IterationDelta kayıtlarını
+SimpleQueue'ya koyar, tüketici thread LOG_DRAIN_INTERVAL_MS'de bir kuyruğu boşaltıp
+ProgressModel'e uygular ve REDRAW_INTERVAL_MS'de bir sütun oranlarını hesaplar (çizim).
+
+    python3 benchmarks/bench_progress.py --students 100000 --firms 2000 --repeat 9
+"""
+
+import argparse
+import queue
+import random
+import statistics
+import tempfile
+import threading
+import time
+
+from common import write_synthetic_csv
+
+from stajyer_core import ALGORITHMS, LOG_OFF, PlacementState, load_store
+from stajyer_progress import REDRAW_INTERVAL_MS, ProgressModel
+from stajyer_simulator import LOG_DRAIN_INTERVAL_MS
+
+SCREEN_COLUMNS = 220  # 900 piksel genişliğindeki pencerede COLUMN_WIDTH=4 ile sütun sayısı
+
+
+def consume(events, model, done, stats):
+    """
+    GUI'nin drain_log/drain_progress döngüsü: aralıklarla boşalt, kısıtlı çiz
+    stats['work']: tüketicinin uyku dışında harcadığı süre (algoritmayla GIL'i paylaşır)
+    """
+    drawn_at = 0.0
+    while True:
+        finished = done.is_set()
+        start = time.perf_counter()
+        try:
+            while True:
+                model.apply(events.get_nowait())
+        except queue.Empty:
+            pass
+        now = time.perf_counter()
+        if finished or (now - drawn_at) * 1000 >= REDRAW_INTERVAL_MS:
+            model.columns(SCREEN_COLUMNS)
+            model.status_line()
+            stats['redraws'] += 1
+            drawn_at = now
+        stats['work'] += time.perf_counter() - start
+        if finished:
+            return
+        time.sleep(LOG_DRAIN_INTERVAL_MS / 1000)
+
+
+def run_once(store, algorithm, seed, live):
+    """Algoritmayı bir kez çalıştır; (süre, model veya None, tüketici istatistikleri)"""
+    state = PlacementState(store)
+    run = ALGORITHMS[algorithm]
+    if not live:
+        start = time.perf_counter()
+        run(store, state, None, random.Random(seed), LOG_OFF)
+        return time.perf_counter() - start, None, None
+
+    events = queue.SimpleQueue()
+    model = ProgressModel(store)
+    done = threading.Event()
+    stats = {'redraws': 0, 'work': 0.0}
+    consumer = threading.Thread(target=consume, args=(events, model, done, stats))
+    consumer.start()
+    start = time.perf_counter()
+    run(store, state, None, random.Random(seed), LOG_OFF, event_callback=events.put)
+    elapsed = time.perf_counter() - start
+    done.set()
+    consumer.join()
+
+    # Kayıtlardan kurulan doluluk son durumla aynı olmalı
+    expected = [cap - left for cap, left in zip(store.capacity, state.remaining)]
+    assert list(model.fill) == expected, "kayıtlardan kurulan doluluk hatalı"
+    assert model.unplaced == len(state.unplaced)
+    return elapsed, model, stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Canlı ilerleme kayıtlarının ek yükünü ölç")
+    parser.add_argument('--students', type=int, default=100000)
+    parser.add_argument('--firms', type=int, default=2000)
+    parser.add_argument('--slack', type=float, default=1.15)
+    parser.add_argument('--repeat', type=int, default=9, help="Her ölçümün tekrar sayısı")
+    parser.add_argument('-a', '--algorithms', nargs='+', default=['greedy', 'heuristic'],
+                        choices=list(ALGORITHMS))
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        students_path, firms_path = write_synthetic_csv(tmp, args.students, args.firms,
+                                                        seed=args.seed, slack=args.slack)
+        store = load_store(students_path, firms_path)
+    print(f"{args.students} öğrenci, {args.firms} firma, {args.repeat} tekrar (medyan)")
+    print(f"{'algoritma':<10} {'başsız (sn)':>12} {'canlı (sn)':>11} {'ek yük':>8} "
+          f"{'tüketici':>9} {'kayıt':>6} {'çizim':>6}")
+
+    for algorithm in args.algorithms:
+        headless, live, ratios, work = [], [], [], []
+        # Ölçümler çift çift yapılır (sıra her tekrarda değişir); makine gürültüsüne
+        # (diğer işlemler, tek çekirdek) karşı çift oranlarının medyanı raporlanır
+        for repeat in range(args.repeat):
+            pair = {}
+            for mode in ((False, True) if repeat % 2 == 0 else (True, False)):
+                elapsed, result, stats = run_once(store, algorithm, args.seed, mode)
+                pair[mode] = elapsed
+                if mode:
+                    model, redraws = result, stats['redraws']
+                    work.append(stats['work'] / elapsed)
+            headless.append(pair[False])
+            live.append(pair[True])
+            ratios.append(pair[True] / pair[False])
+        print(f"{algorithm:<10} {statistics.median(headless):>12.3f} "
+              f"{statistics.median(live):>11.3f} {(statistics.median(ratios) - 1) * 100:>7.1f}% "
+              f"{statistics.median(work) * 100:>8.1f}% {model.deltas:>6} {redraws:>6}")
+
+if __name__ == "__main__":
+    main()
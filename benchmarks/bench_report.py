@@ -0,0 +1,70 @@
+"""
+Raporlama benchmark'ı: satır satır rapor vs tek geçişli dizi raporu (stajyer_report)
+
+    python3 benchmarks/bench_report.py --students 1000000 --firms 2000
+"""
+
+import argparse
+import csv
+import os
+import random
+import tempfile
+import time
+
+from common import write_synthetic_csv
+
+import stajyer_report
+from stajyer_core import LOG_OFF, PlacementState, get_placement_details, load_store, run_deferred
+from stajyer_report import PlacementReport
+
+
+def timed(label, func):
+    start = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<32} {elapsed * 1000:>10.1f} ms")
+    return result
+
+
+def write_rows(filepath, state):
+    """Eski CLI yolu: iter_placements + satır başına writerow"""
+    with open(filepath, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(['student_id', 'firma_id', 'tercih_sirasi'])
+        for student_id, firm_id, pref_num in state.iter_placements():
+            writer.writerow([student_id, firm_id, pref_num if pref_num is not None else ''])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Rapor ve yerleştirme çıktısı süresini ölç")
+    parser.add_argument('--students', type=int, default=200000)
+    parser.add_argument('--firms', type=int, default=2000)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        students_path, firms_path = write_synthetic_csv(tmp, args.students, args.firms,
+                                                        seed=args.seed)
+        store = load_store(students_path, firms_path)
+        state = PlacementState(store)
+        print(f"{args.students} öğrenci, {args.firms} firma")
+        timed("eşleştirme (deferred)", lambda: run_deferred(
+            store, state, rng=random.Random(args.seed), log_level=LOG_OFF))
+
+        timed("satisfaction_score (satır satır)", state.satisfaction_score)
+        timed("get_placement_details", lambda: get_placement_details(state))
+        timed("CSV (satır satır)", lambda: write_rows(os.path.join(tmp, 'eski.csv'), state))
+
+        report = timed("PlacementReport (NumPy)", lambda: PlacementReport(state))
+        numpy = stajyer_report.np
+        stajyer_report.np = None
+        try:
+            timed("PlacementReport (saf Python)", lambda: PlacementReport(state))
+        finally:
+            stajyer_report.np = numpy
+        timed("GUI sayfası (1000 satır)", lambda: report.page(0))
+        timed("CSV (toplu)", lambda: report.write_csv(os.path.join(tmp, 'yeni.csv')))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,203 @@
+"""
+Ölçeklenme benchmark'ı: greedy vs heuristic vs ertelenmiş kabul vs optimal, sentetik veri ızgarası üzerinde
+
+Her yapılandırma (öğrenci, firma, kontenjan payı, Zipf eğimi) için aşama süreleri
+ölçülür: load_students, load_firms, greedy_algorithm, heuristic_algorithm,
+deferred_algorithm, optimal_algorithm, calculate_satisfaction_score. Veri ve rastgelelik tohumlanmıştır; aynı
+parametrelerle farklı commit'lerin sonuçları karşılaştırılabilir.
+
+    python3 benchmarks/bench_scaling.py --students 1000 10000 100000 --firms 200 \\
+        --slack 1.0 1.15 --skew 0 1.0 -o sonuc.json --csv sonuc.csv
+    python3 benchmarks/bench_scaling.py ... --compare onceki.json
+"""
+
+import argparse
+import csv
+import itertools
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+
+from common import ROOT, write_synthetic_csv
+
+from stajyer_core import (
+    calculate_satisfaction_score, deferred_algorithm, greedy_algorithm, heuristic_algorithm,
+    load_firms, load_students, optimal_algorithm, reset_data,
+)
+
+ALGORITHMS = (('greedy', greedy_algorithm), ('heuristic', heuristic_algorithm),
+              ('deferred', deferred_algorithm), ('optimal', optimal_algorithm))
+STAGES = ('load_students', 'load_firms', 'greedy', 'greedy_satisfaction',
+          'heuristic', 'heuristic_satisfaction', 'deferred', 'deferred_satisfaction',
+          'optimal', 'optimal_satisfaction')
+
+
+def git_revision():
+    """Depo commit'i (git yoksa None)"""
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def best_of(repeat, func, setup=None):
+    """func'ı repeat kez çalıştır; en kısa süreyi ve son sonucu döndür"""
+    best = None
+    result = None
+    for _ in range(repeat):
+        if setup:
+            setup()
+        start = time.perf_counter()
+        result = func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def run_config(directory, n_students, n_firms, slack, skew, repeat, seed):
+    """Tek bir yapılandırmayı ölç; aşama süreleri ve algoritma metrikleri döndür"""
+    students_path, firms_path = write_synthetic_csv(directory, n_students, n_firms,
+                                                    seed=seed, slack=slack, skew=skew)
+    timings = {}
+    timings['load_students'], students = best_of(repeat, lambda: load_students(students_path))
+    timings['load_firms'], firms = best_of(repeat, lambda: load_firms(firms_path))
+
+    record = {
+        'students': n_students, 'firms': n_firms, 'slack': slack, 'skew': skew,
+        'seed': seed, 'timings': timings,
+    }
+    for name, algorithm in ALGORITHMS:
+        timings[name], metrics = best_of(
+            repeat,
+            lambda: algorithm(students, firms, rng=random.Random(seed)),
+            setup=lambda: reset_data(students, firms),
+        )
+        timings[f'{name}_satisfaction'], score = best_of(
+            repeat, lambda: calculate_satisfaction_score(students))
+        record[name] = {
+            'satisfaction_score': score,
+            'total_iterations': metrics['total_iterations'],
+            'total_operations': metrics['total_operations'],
+            'rejections': metrics['rejections'],
+            'phase_changes': metrics['phase_changes'],
+        }
+    return record
+
+
+def write_csv(filepath, records):
+    """Her (yapılandırma, aşama) için bir satır"""
+    with open(filepath, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(['students', 'firms', 'slack', 'skew', 'stage', 'seconds',
+                         'satisfaction_score', 'total_iterations'])
+        for r in records:
+            for stage in STAGES:
+                algorithm = r.get(stage, {})
+                writer.writerow([r['students'], r['firms'], r['slack'], r['skew'], stage,
+                                 f"{r['timings'][stage]:.6f}",
+                                 algorithm.get('satisfaction_score', ''),
+                                 algorithm.get('total_iterations', '')])
+
+
+def config_key(record):
+    return (record['students'], record['firms'], record['slack'], record['skew'])
+
+
+def compare(baseline_path, records, threshold, min_delta):
+    """
+    Önceki bir JSON sonucuyla karşılaştır
+    Süresi threshold oranından ve min_delta saniyeden fazla artan aşamaları ve
+    değişen skorları raporla (milisaniye altı ölçüm gürültüsü gerileme sayılmaz)
+    Önceki sonuçta bulunmayan aşamalar (ör. sonradan eklenen algoritmalar) atlanır
+    Dönüş: gerileme sayısı
+    """
+    with open(baseline_path, 'r', encoding='utf-8') as f:
+        baseline = json.load(f)
+    previous = {config_key(r): r for r in baseline['results']}
+    regressions = 0
+    print(f"\nKarşılaştırma: {baseline.get('git_revision')} -> {git_revision()}")
+    for r in records:
+        old = previous.get(config_key(r))
+        if old is None:
+            continue
+        for stage in STAGES:
+            if stage not in old['timings']:
+                continue
+            before, after = old['timings'][stage], r['timings'][stage]
+            ratio = after / before if before > 0 else 1.0
+            if ratio > 1 + threshold and after - before > min_delta:
+                regressions += 1
+                print(f"  GERİLEME {config_key(r)} {stage}: "
+                      f"{before * 1000:.1f} ms -> {after * 1000:.1f} ms (×{ratio:.2f})")
+        for name, _ in ALGORITHMS:
+            if name in old and old[name]['satisfaction_score'] != r[name]['satisfaction_score']:
+                print(f"  SKOR DEĞİŞTİ {config_key(r)} {name}: "
+                      f"{old[name]['satisfaction_score']} -> {r[name]['satisfaction_score']}")
+    if not regressions:
+        print("  Gerileme yok")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Greedy, heuristic, ertelenmiş kabul ve optimal ölçeklenme benchmark'ı")
+    parser.add_argument('--students', type=int, nargs='+', default=[1000, 10000])
+    parser.add_argument('--firms', type=int, nargs='+', default=[200])
+    parser.add_argument('--slack', type=float, nargs='+', default=[1.15],
+                        help="Toplam kontenjan / öğrenci sayısı")
+    parser.add_argument('--skew', type=float, nargs='+', default=[1.0],
+                        help="Firma popülerliğinin Zipf üssü (0 = tekdüze)")
+    parser.add_argument('--repeat', type=int, default=3,
+                        help="Her aşamanın tekrar sayısı (en kısa süre raporlanır)")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('-o', '--output', default=None, help="JSON çıktı dosyası")
+    parser.add_argument('--csv', default=None, help="CSV çıktı dosyası")
+    parser.add_argument('--compare', default=None, help="Karşılaştırılacak önceki JSON sonucu")
+    parser.add_argument('--threshold', type=float, default=0.25,
+                        help="Gerileme eşiği (0.25 = %%25 yavaşlama)")
+    parser.add_argument('--min-delta', type=float, default=0.005,
+                        help="Gerileme sayılması için en az yavaşlama (sn)")
+    args = parser.parse_args()
+
+    records = []
+    print(f"{'öğrenci':>8} {'firma':>6} {'pay':>5} {'eğim':>5} "
+          f"{'okuma':>9} {'greedy':>9} {'heuristic':>10} {'deferred':>9} {'optimal':>9} "
+          f"{'memnuniyet':>10}  (sn)")
+    for n_students, n_firms, slack, skew in itertools.product(
+            args.students, args.firms, args.slack, args.skew):
+        with tempfile.TemporaryDirectory() as tmp:
+            record = run_config(tmp, n_students, n_firms, slack, skew, args.repeat, args.seed)
+        records.append(record)
+        t = record['timings']
+        print(f"{n_students:>8} {n_firms:>6} {slack:>5.2f} {skew:>5.2f} "
+              f"{t['load_students']:>9.4f} {t['greedy']:>9.4f} {t['heuristic']:>10.4f} "
+              f"{t['deferred']:>9.4f} {t['optimal']:>9.4f} "
+              f"{sum(t[f'{name}_satisfaction'] for name, _ in ALGORITHMS):>10.4f}")
+
+    output = {
+        'git_revision': git_revision(),
+        'python': sys.version.split()[0],
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'repeat': args.repeat,
+        'results': records,
+    }
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(output, f, ensure_ascii=False, indent=2)
+    if args.csv:
+        write_csv(args.csv, records)
+    if args.compare:
+        return 1 if compare(args.compare, records, args.threshold, args.min_delta) else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
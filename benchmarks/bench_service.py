@@ -0,0 +1,180 @@
+"""
+Eşleştirme servisi yük testi: istek/sn ve gecikme yüzdelikleri (p50, p90, p99)
+
+    python3 benchmarks/bench_service.py --students 5000 --firms 200 -c 8 -n 400 -j 4
+
+Servis ayrı bir süreçte rastgele bir portta başlatılır. Her istemci tek bir keep-alive
+bağlantısı üzerinden sırayla istek gönderir. İstekler greedy, heuristic ve greedy +
+kapasite değişikliği (what-if) arasında dönüşümlü seçilir; en sonda akışlı bir isteğin
+olay sayısı ve ilk olaya kadar geçen süre ölçülür.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import signal
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+from common import ROOT, write_synthetic_csv
+
+
+# ==================== İSTEMCİ ====================
+
+async def read_response(reader):
+    """(durum, [JSON nesneleri]) - Content-Length veya chunked NDJSON yanıtı"""
+    status = int((await reader.readline()).split()[1])
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b'\r\n', b''):
+            break
+        name, _, value = line.decode('latin-1').partition(':')
+        headers[name.strip().lower()] = value.strip()
+    if headers.get('transfer-encoding') == 'chunked':
+        events = []
+        while True:
+            size = int(await reader.readline(), 16)
+            data = await reader.readexactly(size + 2)
+            if not size:
+                return status, events
+            events.append(json.loads(data))
+    return status, [json.loads(await reader.readexactly(int(headers['content-length'])))]
+
+
+async def post(reader, writer, path, payload):
+    data = json.dumps(payload).encode('utf-8')
+    writer.write(f"POST {path} HTTP/1.1\r\nHost: localhost\r\nContent-Type: application/json\r\n"
+                 f"Content-Length: {len(data)}\r\n\r\n".encode('latin-1') + data)
+    await writer.drain()
+    return await read_response(reader)
+
+
+# ==================== YÜK TESTİ ====================
+
+def make_payloads(count, firm_ids, seed):
+    rng = random.Random(seed)
+    payloads = []
+    for i in range(count):
+        kind = i % 3
+        payload = {'dataset': 'bench', 'seed': rng.randrange(1 << 30)}
+        if kind == 0:
+            payload['algorithm'] = 'greedy'
+        elif kind == 1:
+            payload['algorithm'] = 'heuristic'
+        else:
+            payload['algorithm'] = 'greedy'
+            payload['capacity'] = {rng.choice(firm_ids): rng.randint(0, 20)}
+        payloads.append(payload)
+    return payloads
+
+
+async def client(host, port, payloads, latencies, errors):
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        for payload in payloads:
+            start = time.perf_counter()
+            status, _ = await post(reader, writer, '/runs', payload)
+            latencies.append(time.perf_counter() - start)
+            if status != 200:
+                errors.append(status)
+    finally:
+        writer.close()
+
+
+async def load_test(host, port, payloads, concurrency):
+    latencies = []
+    errors = []
+    start = time.perf_counter()
+    await asyncio.gather(*(client(host, port, payloads[i::concurrency], latencies, errors)
+                           for i in range(concurrency)))
+    return time.perf_counter() - start, latencies, errors
+
+
+async def stream_test(host, port):
+    """Akışlı istek: (olay sayısı, ilk olaya kadar süre, toplam süre)"""
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        start = time.perf_counter()
+        data = json.dumps({'dataset': 'bench', 'algorithm': 'heuristic', 'seed': 1,
+                           'stream': True, 'log_level': 'debug'}).encode('utf-8')
+        writer.write(f"POST /runs HTTP/1.1\r\nHost: localhost\r\n"
+                     f"Content-Length: {len(data)}\r\n\r\n".encode('latin-1') + data)
+        await writer.drain()
+        await reader.readline()
+        while await reader.readline() not in (b'\r\n', b''):
+            pass
+        first = None
+        events = 0
+        while True:
+            size = int(await reader.readline(), 16)
+            await reader.readexactly(size + 2)
+            if not size:
+                break
+            if first is None:
+                first = time.perf_counter() - start
+            events += 1
+        return events, first, time.perf_counter() - start
+    finally:
+        writer.close()
+
+
+def percentile(values, fraction):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Eşleştirme servisi yük testi")
+    parser.add_argument('--students', type=int, default=5000)
+    parser.add_argument('--firms', type=int, default=200)
+    parser.add_argument('-n', '--requests', type=int, default=300)
+    parser.add_argument('-c', '--concurrency', type=int, default=8)
+    parser.add_argument('-j', '--workers', type=int, default=None, help="Servis süreç sayısı")
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        students_path, firms_path = write_synthetic_csv(tmp, args.students, args.firms,
+                                                        seed=args.seed)
+        command = [sys.executable, os.path.join(ROOT, 'stajyer_service.py'), '--port', '0',
+                   '--no-cache', '--dataset', f"bench={students_path},{firms_path}"]
+        if args.workers:
+            command += ['-j', str(args.workers)]
+        server = subprocess.Popen(command, stdout=subprocess.PIPE, text=True, cwd=ROOT)
+        try:
+            for line in server.stdout:
+                print(line.rstrip())
+                if line.startswith("Dinleniyor: "):
+                    host, port = line.split("//", 1)[1].split()[0].rsplit(':', 1)
+                    break
+            else:
+                sys.exit("Servis başlatılamadı")
+
+            firm_ids = [f"Firma{i}" for i in range(args.firms)]
+            payloads = make_payloads(args.requests, firm_ids, args.seed)
+            elapsed, latencies, errors = asyncio.run(
+                load_test(host, int(port), payloads, args.concurrency))
+            events, first, total = asyncio.run(stream_test(host, int(port)))
+        finally:
+            server.send_signal(signal.SIGINT)
+            server.wait()
+
+    print(f"\n{args.requests} istek, {args.concurrency} eşzamanlı istemci, "
+          f"{args.students} öğrenci, {args.firms} firma")
+    print(f"istek/sn           {len(latencies) / elapsed:>10.1f}")
+    for label, fraction in (('p50', 0.50), ('p90', 0.90), ('p99', 0.99)):
+        print(f"gecikme {label}        {percentile(latencies, fraction) * 1000:>10.1f} ms")
+    print(f"gecikme maks       {max(latencies) * 1000:>10.1f} ms")
+    print(f"ortalama           {statistics.mean(latencies) * 1000:>10.1f} ms")
+    print(f"hata               {len(errors):>10}")
+    print(f"akış: {events} olay, ilk olay {first * 1000:.1f} ms, toplam {total * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
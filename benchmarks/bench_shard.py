@@ -0,0 +1,53 @@
+"""
+Parçalı eşleştirme benchmark'ı: bölgesel veride global çalıştırma vs parçalı çalıştırma
+
+    python3 benchmarks/bench_shard.py --students 400000 --firms 4000 --regions 16 -j 4
+"""
+
+import argparse
+import random
+import tempfile
+import time
+
+from common import write_synthetic_csv
+
+from stajyer_core import ALGORITHMS, LOG_OFF, PlacementState, load_store
+from stajyer_shard import SHARD_ALGORITHMS, component_shards, run_sharded
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Parçalı ve global eşleştirme süresini ölç")
+    parser.add_argument('--students', type=int, default=200000)
+    parser.add_argument('--firms', type=int, default=4000)
+    parser.add_argument('--regions', type=int, default=16)
+    parser.add_argument('-j', '--workers', type=int, nargs='+', default=[1, 2, 4])
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        students_path, firms_path = write_synthetic_csv(tmp, args.students, args.firms,
+                                                        seed=args.seed, regions=args.regions)
+        store = load_store(students_path, firms_path)
+    print(f"{args.students} öğrenci, {args.firms} firma, {args.regions} bölge")
+
+    start = time.perf_counter()
+    _, _, n_components = component_shards(store)
+    print(f"bağlı bileşenler: {n_components} ({(time.perf_counter() - start) * 1000:.1f} ms)\n")
+
+    print(f"{'algoritma':<10} {'mod':<12} {'süre (ms)':>10} {'parçalar (ms)':>14} "
+          f"{'memnuniyet':>11}")
+    for algorithm in SHARD_ALGORITHMS:
+        state = PlacementState(store)
+        metrics = ALGORITHMS[algorithm](store, state, None, random.Random(args.seed), LOG_OFF)
+        print(f"{algorithm:<10} {'global':<12} {metrics['total_time'] * 1000:>10.1f} "
+              f"{'':>14} {metrics['satisfaction_score']:>11}")
+        for workers in args.workers:
+            metrics = run_sharded(store, state, None, random.Random(args.seed), LOG_OFF,
+                                  algorithm, workers=workers)
+            print(f"{algorithm:<10} {f'parçalı j={workers}':<12} "
+                  f"{metrics['total_time'] * 1000:>10.1f} {metrics['shard_time'] * 1000:>14.1f} "
+                  f"{metrics['satisfaction_score']:>11}")
+
+
+if __name__ == "__main__":
+    main()
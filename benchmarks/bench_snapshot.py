@@ -0,0 +1,59 @@
+"""
+Tekrarlı çalıştırma benchmark'ı: deepcopy + nesne algoritması vs paylaşılan depo + reset
+
+    python3 benchmarks/bench_snapshot.py --students 20000 --firms 500 --runs 20
+"""
+
+import argparse
+import tempfile
+import time
+from copy import deepcopy
+
+from common import write_synthetic_csv
+
+from stajyer_core import (
+    PlacementState, greedy_algorithm, load_firms, load_store, load_students, run_greedy,
+)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="deepcopy ile durum sıfırlamayı karşılaştır")
+    parser.add_argument('--students', type=int, default=20000)
+    parser.add_argument('--firms', type=int, default=500)
+    parser.add_argument('--runs', type=int, default=20)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        students_path, firms_path = write_synthetic_csv(tmp, args.students, args.firms)
+        students = load_students(students_path)
+        firms = load_firms(firms_path)
+        store = load_store(students_path, firms_path)
+
+    copy_time = 0.0
+    start = time.perf_counter()
+    for _ in range(args.runs):
+        t0 = time.perf_counter()
+        s, f = deepcopy(students), deepcopy(firms)
+        copy_time += time.perf_counter() - t0
+        greedy_algorithm(s, f)
+    deepcopy_total = time.perf_counter() - start
+
+    # run_greedy verilen durumu kendisi sıfırlar
+    state = PlacementState(store)
+    start = time.perf_counter()
+    for _ in range(args.runs):
+        run_greedy(store, state)
+    reset_total = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(args.runs):
+        state.reset()
+    run_time = time.perf_counter() - start
+
+    print(f"{args.runs} çalıştırma, {args.students} öğrenci, {args.firms} firma")
+    print(f"deepcopy + greedy_algorithm: {deepcopy_total:.3f} sn (kopyalama {copy_time:.3f} sn)")
+    print(f"reset + run_greedy:          {reset_total:.3f} sn (sıfırlama {run_time:.3f} sn)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+"""
+Açılış süresi benchmark'ı: stajyer_simulator'ın içe aktarma süresi (python -X importtime)
+ve soğuk başlangıçtan ilk çizime kadar geçen süre
+
+    python3 benchmarks/bench_startup.py --repeat 7
+    python3 benchmarks/bench_startup.py --students 200000   # büyük veri yüklenirken ilk çizim
+
+Her ölçüm yeni bir yorumlayıcı sürecinde yapılır (modül önbelleği yok, .pyc'ler derlenmiş).
+İlk çizim için ekran gerekir ($DISPLAY); yoksa bu ölçüm atlanır. Hedefler aşılırsa çıkış
+kodu 1'dir.
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+from common import ROOT, write_synthetic_csv
+
+TARGET_IMPORT_MS = 100       # import stajyer_simulator (importtime kümülatif)
+TARGET_FIRST_PAINT_MS = 400  # Süreç başlangıcından pencerenin ilk çizimine
+
+# GUI açılırken sonradan yüklenen modüller (açılışta içe aktarılmamalı)
+DEFERRED_MODULES = ('tkinter', 'stajyer_report', 'numpy')
+
+# Alt süreçte çalışır: pencere ilk çizildiğinde ve veriler yüklendiğinde satır yazar
+PAINT_SCRIPT = """
+import sys
+import stajyer_simulator
+try:
+    app = stajyer_simulator.SimulatorGUI(sys.argv[1], sys.argv[2])
+except stajyer_simulator.tk.TclError:
+    print("nodisplay", flush=True)
+    sys.exit(0)
+painted = []
+def on_expose(event):
+    if not painted:
+        painted.append(True)
+        print("paint", flush=True)
+def check_loaded():
+    if app.loader.is_alive():
+        app.root.after(10, check_loaded)
+    else:
+        print("ready", flush=True)
+        app.root.destroy()
+app.root.bind("<Expose>", on_expose, add="+")
+app.root.after(10, check_loaded)
+app.run()
+"""
+
+
+def child_env():
+    env = dict(os.environ)
+    env['PYTHONPATH'] = ROOT + os.pathsep + env.get('PYTHONPATH', '')
+    return env
+
+
+def import_profile(module):
+    """python -X importtime çıktısından {modül: kümülatif µs} (her modülün ilk satırı)"""
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+                            capture_output=True, text=True, env=child_env(), check=True)
+    cumulative = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative_us, name = line.split('|', 2)
+        cumulative.setdefault(name.strip(), int(cumulative_us))
+    return cumulative
+
+
+def first_paint(students_path, firms_path):
+    """Süreç başlangıcından (ilk çizim, veri hazır) süreleri ms; ekran yoksa None"""
+    start = time.perf_counter()
+    process = subprocess.Popen([sys.executable, '-c', PAINT_SCRIPT, students_path, firms_path],
+                               stdout=subprocess.PIPE, text=True, env=child_env(), cwd=ROOT)
+    times = {}
+    for line in process.stdout:
+        times[line.strip()] = (time.perf_counter() - start) * 1000
+    process.wait()
+    if 'nodisplay' in times or 'paint' not in times:
+        return None
+    return times['paint'], times.get('ready')
+
+
+def report(label, value, target=None):
+    status = ""
+    if target is not None:
+        status = "  OK" if value <= target else f"  HEDEF AŞILDI (hedef {target} ms)"
+    print(f"{label:<36} {value:>9.1f} ms{status}")
+    return target is None or value <= target
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Simülatörün açılış süresini ölç")
+    parser.add_argument('--repeat', type=int, default=5, help="Ölçüm tekrarı (medyan alınır)")
+    parser.add_argument('--students', type=int, default=0,
+                        help="Sentetik öğrenci sayısı (0 = depodaki students.csv)")
+    parser.add_argument('--firms', type=int, default=2000)
+    args = parser.parse_args()
+
+    profiles = [import_profile('stajyer_simulator') for _ in range(args.repeat)]
+    ok = True
+
+    print(f"python -X importtime, {args.repeat} tekrarın medyanı")
+    total = statistics.median(profile['stajyer_simulator'] for profile in profiles) / 1000
+    ok &= report("import stajyer_simulator", total, TARGET_IMPORT_MS)
+    for module in ('stajyer_core', 'stajyer_store', 'queue', 'threading'):
+        values = [profile[module] for profile in profiles if module in profile]
+        if values:
+            report(f"  {module}", statistics.median(values) / 1000)
+    loaded = [module for module in DEFERRED_MODULES if module in profiles[0]]
+    if loaded:
+        print(f"UYARI: açılışta yüklenmemesi gereken modüller yüklendi: {', '.join(loaded)}")
+        ok = False
+
+    # Ertelenen modüllerin maliyeti: GUI açılırken / ilk çalıştırmada ödenir
+    deferred = import_profile('tkinter.ttk, tkinter.scrolledtext, stajyer_report')
+    for module in ('tkinter', 'stajyer_report', 'numpy'):
+        if module in deferred:
+            report(f"  ertelenen: {module}", deferred[module] / 1000)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        if args.students:
+            students_path, firms_path = write_synthetic_csv(tmp, args.students, args.firms)
+        else:
+            students_path = os.path.join(ROOT, "students.csv")
+            firms_path = os.path.join(ROOT, "firms.csv")
+        runs = [first_paint(students_path, firms_path) for _ in range(args.repeat)]
+
+    print()
+    if any(run is None for run in runs):
+        print("İlk çizim ölçülemedi (ekran yok: $DISPLAY tanımlı değil veya Tk açılamadı)")
+    else:
+        ok &= report("soğuk başlangıç -> ilk çizim", statistics.median(run[0] for run in runs),
+                     TARGET_FIRST_PAINT_MS)
+        report("soğuk başlangıç -> veriler hazır", statistics.median(run[1] for run in runs))
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
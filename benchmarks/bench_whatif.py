@@ -0,0 +1,70 @@
+"""
+Kapasite what-if benchmark'ı: paylaşılan temel çalıştırma vs bağımsız greedy çalıştırmaları
+
+    python3 benchmarks/bench_whatif.py --students 100000 --firms 2000 --scenarios 40
+"""
+
+import argparse
+import collections
+import random
+import tempfile
+import time
+
+from common import write_synthetic_csv
+
+from stajyer_core import LOG_OFF, PlacementState, load_store, run_greedy
+from stajyer_whatif import CapacityWhatIf
+
+
+def main():
+    parser = argparse.ArgumentParser(description="What-if senaryolarının süresini ölç")
+    parser.add_argument('--students', type=int, default=100000)
+    parser.add_argument('--firms', type=int, default=2000)
+    parser.add_argument('--scenarios', type=int, default=40, help="Rastgele firma sayısı")
+    parser.add_argument('--seats', type=int, default=2, help="Firma başına eklenen kontenjan")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--no-independent', action='store_true',
+                        help="Bağımsız çalıştırmaları atla (sadece what-if süresi)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        students_path, firms_path = write_synthetic_csv(tmp, args.students, args.firms,
+                                                        seed=args.seed)
+        store = load_store(students_path, firms_path)
+    firms = random.Random(args.seed).sample(store.firm_ids, min(args.scenarios, store.n_firms))
+    print(f"{args.students} öğrenci, {args.firms} firma, "
+          f"{len(firms)} firma × {args.seats} kontenjan = {len(firms) * args.seats} senaryo")
+
+    start = time.perf_counter()
+    whatif = CapacityWhatIf(store, args.seed)
+    print(f"{'temel çalıştırma + kayıt':<26} {time.perf_counter() - start:>8.2f} sn "
+          f"({len(whatif.trace.checkpoints)} kontrol noktası)")
+
+    scenarios = [{fid: store.capacity[store.firm_index[fid]] + k}
+                 for fid in firms for k in range(1, args.seats + 1)]
+    start = time.perf_counter()
+    results = whatif.evaluate(scenarios)
+    print(f"{'what-if (toplu)':<26} {time.perf_counter() - start:>8.2f} sn")
+    groups = collections.defaultdict(list)
+    for result in results:
+        label = ('temel sonuç' if result['resumed_at'] is None
+                 else f"iterasyon {result['resumed_at'][0]}")
+        groups[label].append(result['time'])
+    for label, times in sorted(groups.items()):
+        print(f"  {label:<24} {len(times):>5} senaryo, "
+              f"ortalama {sum(times) / len(times) * 1000:>8.1f} ms")
+
+    if not args.no_independent:
+        start = time.perf_counter()
+        for scenario, result in zip(scenarios, results):
+            changes = {store.firm_index[fid]: cap for fid, cap in scenario.items()}
+            scenario_store = store.with_capacity(changes)
+            metrics = run_greedy(scenario_store, PlacementState(scenario_store),
+                                 rng=random.Random(args.seed), log_level=LOG_OFF)
+            assert metrics['satisfaction_score'] == result['satisfaction_score']
+        print(f"{'bağımsız çalıştırmalar':<26} {time.perf_counter() - start:>8.2f} sn "
+              f"(sonuçlar aynı)")
+
+
+if __name__ == "__main__":
+    main()
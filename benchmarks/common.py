@@ -0,0 +1,67 @@
+"""
+Benchmark yardımcıları - sentetik CSV üretimi ve ortak ayarlar
+"""
+
+import csv
+import itertools
+import os
+import random
+import sys
+
+# Benchmark betikleri depo kökündeki modülleri import edebilsin
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+
+def write_synthetic_csv(directory, n_students, n_firms, seed=0, slack=1.15, skew=1.0,
+                        regions=1):
+    """
+    students.csv / firms.csv biçiminde sentetik veri yaz
+    Firma popülerliği Zipf dağılımlıdır: i. firmanın ağırlığı 1 / (i + 1) ** skew
+    (skew=0 tekdüze, büyüdükçe tercihler birkaç popüler firmada yoğunlaşır)
+    Toplam kontenjan öğrenci sayısı × slack
+    regions > 1: i. firma ve i. öğrenci (i mod regions) bölgesindedir; öğrenciler sadece kendi
+    bölgelerindeki firmaları tercih eder. regions.csv (firma_id, bolge) de yazılır.
+    """
+    rng = random.Random(seed)
+    firm_ids = [f"Firma{i}" for i in range(n_firms)]
+    cum_weights = list(itertools.accumulate(1.0 / (i + 1) ** skew for i in range(n_firms)))
+    total_capacity = int(n_students * slack)
+    # Bölge -> (firma id'leri, kümülatif ağırlıklar); tek bölgede tüm firmalar
+    pools = [(firm_ids[r::regions], cum_weights if regions == 1 else list(itertools.accumulate(
+        1.0 / (i + 1) ** skew for i in range(len(firm_ids[r::regions])))))
+        for r in range(regions)]
+
+    os.makedirs(directory, exist_ok=True)
+    firms_path = os.path.join(directory, "firms.csv")
+    students_path = os.path.join(directory, "students.csv")
+
+    with open(firms_path, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(['firma_id', 'kapasite'])
+        for i, firm_id in enumerate(firm_ids):
+            writer.writerow([firm_id, total_capacity // n_firms + (1 if i < total_capacity % n_firms else 0)])
+
+    with open(students_path, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(['student_id', 'preferences', 'gno'])
+        for i in range(n_students):
+            pool, pool_weights = pools[i % regions]
+            prefs = []
+            while len(prefs) < min(5, len(pool)):
+                # cum_weights ile seçim O(log m); aynı tohumla weights ile aynı sonucu verir
+                firm_id = rng.choices(pool, cum_weights=pool_weights)[0]
+                if firm_id not in prefs:
+                    prefs.append(firm_id)
+            writer.writerow([f"S{i + 1}", ",".join(prefs), f"{rng.uniform(2.0, 4.0):.2f}"])
+
+    if regions > 1:
+        with open(os.path.join(directory, "regions.csv"), 'w', encoding='utf-8',
+                  newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(['firma_id', 'bolge'])
+            for i, firm_id in enumerate(firm_ids):
+                writer.writerow([firm_id, f"B{i % regions}"])
+
+    return students_path, firms_path
@@ -0,0 +1,272 @@
+"""
+Stajyer Yerleştirme Simülatörü - İkili Veri Önbelleği
+CSV'lerden bir kez derlenen ikili dosya; sonraki açılışlarda mmap ile kopyasız eşlenir
+
+Dosya düzeni (tüm bölümler 8 byte hizalı, yerel byte sırası):
+    başlık    : sihirli değer, sürüm, byte sırası, tercih genişliği, n, m
+    kaynaklar : students.csv ve firms.csv için (boyut, mtime_ns, sha256)
+    bölümler  : (ofset, uzunluk) tablosu
+    capacity  : int32[m]
+    gno       : float64[n]
+    prefs     : int32[n × width]
+    gno_order : int32[n]   (GNO'ya göre sıralı öğrenci indeksleri)
+    gno_rank  : int32[n]
+    firm_ids / student_ids : int64 ofsetler + UTF-8 metin bloğu
+
+Dosya açıldığında sadece başlık ve firma id'leri okunur; diziler salt okunur
+memoryview'lar olarak eşlenir, öğrenci id'leri erişildikçe çözülür. Aynı dosyayı
+eşleyen süreçler (ör. Monte Carlo işçileri) bellek sayfalarını paylaşır.
+"""
+
+import hashlib
+import mmap
+import os
+import struct
+import sys
+from array import array
+
+from stajyer_store import CompactStore
+
+CACHE_MAGIC = b'STJCACHE'
+CACHE_VERSION = 1
+CACHE_SUFFIX = '.stjcache'
+
+_HEADER = struct.Struct('<8sI6sHqq')          # sihirli, sürüm, byte sırası, width, n, m
+_SOURCE = struct.Struct('<qq32s')              # boyut, mtime_ns, sha256
+_SECTION = struct.Struct('<qq')                # ofset, uzunluk
+_SECTIONS = ('capacity', 'gno', 'prefs', 'gno_order', 'gno_rank',
+             'firm_offsets', 'firm_blob', 'student_offsets', 'student_blob')
+_PREAMBLE_SIZE = _HEADER.size + 2 * _SOURCE.size + len(_SECTIONS) * _SECTION.size
+
+
+class StringTable:
+    """
+    Ofset dizisi + UTF-8 bloktan oluşan salt okunur string dizisi
+    Elemanlar erişildikçe çözülür (liste gibi indekslenir ve dolaşılır)
+    """
+
+    __slots__ = ('_offsets', '_blob')
+
+    def __init__(self, offsets, blob):
+        self._offsets = offsets
+        self._blob = blob
+
+    def __len__(self):
+        return len(self._offsets) - 1
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += len(self)
+        offsets = self._offsets
+        return str(self._blob[offsets[index]:offsets[index + 1]], 'utf-8')
+
+    def __iter__(self):
+        offsets = self._offsets
+        blob = self._blob
+        for i in range(len(offsets) - 1):
+            yield str(blob[offsets[i]:offsets[i + 1]], 'utf-8')
+
+
+# ==================== KAYNAK KONTROLÜ ====================
+
+def file_fingerprint(path, with_hash=True):
+    """Dosyanın (boyut, mtime_ns, sha256) parmak izi"""
+    st = os.stat(path)
+    digest = b'\0' * 32
+    if with_hash:
+        h = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(1 << 20), b''):
+                h.update(block)
+        digest = h.digest()
+    return st.st_size, st.st_mtime_ns, digest
+
+
+def _source_matches(recorded, path):
+    """
+    Önbellek kaydı kaynak dosyayla eşleşiyor mu - eşleşmiyorsa None, eşleşiyorsa
+    güncel kayıt (boyut, mtime_ns, sha256)
+    Boyut ve mtime aynıysa dosya okunmaz; mtime değişmiş ama boyut aynıysa
+    (ör. git checkout, touch) içerik sha256 ile karşılaştırılır ve eşleşirse yeni
+    mtime'lı kayıt döner (bkz. cache_is_fresh)
+    """
+    size, mtime_ns, digest = recorded
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    if st.st_size != size:
+        return None
+    if st.st_mtime_ns == mtime_ns:
+        return recorded
+    current = file_fingerprint(path)
+    return current if current[0] == size and current[2] == digest else None
+
+
+def default_cache_path(students_path):
+    """students.csv -> students.stjcache (CSV ile aynı klasörde)"""
+    return os.path.splitext(students_path)[0] + CACHE_SUFFIX
+
+
+# ==================== YAZMA ====================
+
+def _string_table(strings):
+    encoded = [s.encode('utf-8') for s in strings]
+    offsets = array('q', [0])
+    total = 0
+    for item in encoded:
+        total += len(item)
+        offsets.append(total)
+    return offsets.tobytes(), b''.join(encoded)
+
+
+def write_cache(store, path, students_path, firms_path, sources=None):
+    """
+    Depoyu ikili önbellek dosyasına yaz
+    sources: CSV'ler okunmadan önce alınan (öğrenci, firma) parmak izleri; okuma
+    sırasında değişen bir CSV böylece yeni içerikle eşleşmiş gibi kaydedilmez.
+    Verilmezse şimdi alınır (depo dosyaların güncel içeriğinden kurulmuş olmalıdır).
+    Dosya önce geçici isimle yazılır ve atomik olarak yerine taşınır
+    """
+    if sources is None:
+        sources = (file_fingerprint(students_path), file_fingerprint(firms_path))
+    firm_offsets, firm_blob = _string_table(store.firm_ids)
+    student_offsets, student_blob = _string_table(store.student_ids)
+    payloads = {
+        'capacity': bytes(store.capacity),
+        'gno': bytes(store.gno),
+        'prefs': bytes(store.prefs),
+        'gno_order': bytes(store.gno_order()),
+        'gno_rank': bytes(store.gno_rank()),
+        'firm_offsets': firm_offsets,
+        'firm_blob': firm_blob,
+        'student_offsets': student_offsets,
+        'student_blob': student_blob,
+    }
+
+    sections = []
+    offset = _PREAMBLE_SIZE
+    for name in _SECTIONS:
+        offset = (offset + 7) & ~7
+        sections.append((offset, len(payloads[name])))
+        offset += len(payloads[name])
+
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(_HEADER.pack(CACHE_MAGIC, CACHE_VERSION, sys.byteorder.encode().ljust(6),
+                                 store.width, store.n_students, store.n_firms))
+            for source in sources:
+                f.write(_SOURCE.pack(*source))
+            for section in sections:
+                f.write(_SECTION.pack(*section))
+            for name, (section_offset, _) in zip(_SECTIONS, sections):
+                f.write(b'\0' * (section_offset - f.tell()))
+                f.write(payloads[name])
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+# ==================== OKUMA ====================
+
+def _read_preamble(buffer):
+    magic, version, byteorder, width, n, m = _HEADER.unpack_from(buffer, 0)
+    if magic != CACHE_MAGIC or version != CACHE_VERSION:
+        raise ValueError("Geçersiz veya eski sürüm önbellek dosyası")
+    if byteorder.rstrip() != sys.byteorder.encode():
+        raise ValueError("Önbellek dosyası farklı byte sırasına sahip bir sistemde yazılmış")
+    position = _HEADER.size
+    sources = []
+    for _ in range(2):
+        sources.append(_SOURCE.unpack_from(buffer, position))
+        position += _SOURCE.size
+    sections = {}
+    for name in _SECTIONS:
+        sections[name] = _SECTION.unpack_from(buffer, position)
+        position += _SECTION.size
+    return width, n, m, sources, sections
+
+
+def open_cache(path):
+    """Önbellek dosyasını mmap ile eşle ve salt okunur bir CompactStore döndür"""
+    with open(path, 'rb') as f:
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    view = memoryview(mapped)
+    width, n, m, _, sections = _read_preamble(view)
+
+    def section(name, fmt=None):
+        offset, length = sections[name]
+        part = view[offset:offset + length]
+        return part.cast(fmt) if fmt else part
+
+    store = CompactStore(width)
+    store.capacity = section('capacity', 'i')
+    store.gno = section('gno', 'd')
+    store.prefs = section('prefs', 'i')
+    store._gno_order = section('gno_order', 'i')
+    store._gno_rank = section('gno_rank', 'i')
+    store.firm_ids = [sys.intern(fid) for fid in
+                      StringTable(section('firm_offsets', 'q'), section('firm_blob'))]
+    store.firm_index = {fid: i for i, fid in enumerate(store.firm_ids)}
+    store.student_ids = StringTable(section('student_offsets', 'q'), section('student_blob'))
+    store.mapped_path = os.path.abspath(path)
+    return store
+
+
+def cache_is_fresh(path, students_path, firms_path):
+    """
+    Önbellek dosyası var ve iki CSV ile eşleşiyor mu
+    Bir CSV'nin sadece mtime'ı değişmişse (içerik aynı) başlıktaki kayıt yeni mtime ile
+    güncellenir; sonraki açılışlar dosyayı yeniden okumaz. Güncelleme yazılamazsa
+    (ör. salt okunur klasör) atlanır.
+    """
+    try:
+        with open(path, 'rb') as f:
+            preamble = f.read(_PREAMBLE_SIZE)
+        _, _, _, sources, _ = _read_preamble(preamble)
+    except (OSError, ValueError, struct.error):
+        return False
+    current = [_source_matches(sources[0], students_path),
+               _source_matches(sources[1], firms_path)]
+    if None in current:
+        return False
+    if current != sources:
+        try:
+            # Sadece kaynak kayıtları yerinde yazılır; eşlenmiş bölümler değişmez
+            with open(path, 'r+b') as f:
+                f.seek(_HEADER.size)
+                for source in current:
+                    f.write(_SOURCE.pack(*source))
+        except OSError:
+            pass
+    return True
+
+
+def load_cached_store(students_path="students.csv", firms_path="firms.csv", cache_path=None,
+                      rebuild=False):
+    """
+    CSV'leri ikili önbellek üzerinden yükle
+    Önbellek güncelse mmap ile açılır; yoksa veya CSV'ler değişmişse CSV'ler okunup
+    önbellek yeniden yazılır. Önbellek yazılamazsa (ör. salt okunur klasör) CSV'den
+    okunan depo döndürülür.
+    """
+    if cache_path is None:
+        cache_path = default_cache_path(students_path)
+    if not rebuild and cache_is_fresh(cache_path, students_path, firms_path):
+        return open_cache(cache_path)
+
+    from stajyer_core import load_firms, load_students
+    # Parmak izleri okumadan önce alınır: okuma sırasında değişen CSV bir sonraki
+    # açılışta eski kayıtla eşleşmez ve önbellek yeniden kurulur
+    sources = (file_fingerprint(students_path), file_fingerprint(firms_path))
+    store = CompactStore()
+    load_firms(firms_path, store)
+    load_students(students_path, store)
+    try:
+        write_cache(store, cache_path, students_path, firms_path, sources)
+    except OSError:
+        return store
+    return open_cache(cache_path)
@@ -0,0 +1,133 @@
+"""
+Stajyer Yerleştirme Simülatörü - Komut Satırı
+GUI olmadan (headless) toplu çalıştırma: yerleştirmeleri ve metrikleri dosyaya yazar
+
+Açılış süresi için stajyer_report (NumPy) sadece yerleştirme yazılırken veya geçmişe
+kaydedilirken içe aktarılır (--help, --no-placements NumPy yüklemez).
+
+Örnek:
+    python3 stajyer_cli.py -a greedy heuristic --seeds 1 2 3 -o sonuclar
+    python3 stajyer_cli.py -a heuristic --seeds 1 2 3 --history stajyer_history.db
+    python3 stajyer_cli.py -a greedy heuristic --improve 2
+"""
+
+import argparse
+import contextlib
+import os
+import random
+import sys
+
+from stajyer_core import ALGORITHMS, LOG_DEBUG, LOG_INFO, PlacementState, load_store
+from stajyer_history import RunStore
+from stajyer_improve import improve_placement, summarize
+from stajyer_profiling import profile_run, write_jsonl
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Stajyer yerleştirme algoritmalarını GUI olmadan çalıştır"
+    )
+    parser.add_argument('-a', '--algorithms', nargs='+', default=['greedy'],
+                        choices=sorted(ALGORITHMS), help="Çalıştırılacak algoritmalar")
+    parser.add_argument('--students', default="students.csv", help="Öğrenci CSV dosyası")
+    parser.add_argument('--firms', default="firms.csv", help="Firma CSV dosyası")
+    parser.add_argument('--no-cache', action='store_true',
+                        help="İkili veri önbelleğini kullanma, CSV'leri her seferinde oku")
+    parser.add_argument('--seeds', nargs='+', type=int, default=[None],
+                        help="Her algoritma için kullanılacak rastgelelik tohumları")
+    parser.add_argument('-o', '--output-dir', default="sonuclar", help="Çıktı klasörü")
+    parser.add_argument('--no-placements', action='store_true',
+                        help="Yerleştirme dosyalarını yazma (sadece metrikler)")
+    parser.add_argument('--format', choices=['csv', 'parquet'], default='csv',
+                        help="Yerleştirme dosyası biçimi (parquet için pyarrow gerekir)")
+    parser.add_argument('-v', '--verbose', action='store_true',
+                        help="Algoritma loglarını stderr'e yaz")
+    parser.add_argument('--log-level', choices=['debug', 'info'], default='debug',
+                        help="-v ile yazılacak loglar: debug (iterasyon ayrıntıları) veya "
+                             "info (sadece özet)")
+    parser.add_argument('--profile', action='store_true',
+                        help="cProfile ile en pahalı fonksiyonları metriklere ekle")
+    parser.add_argument('--trace-memory', action='store_true',
+                        help="tracemalloc ile bellek tepe değerini metriklere ekle")
+    parser.add_argument('--history', default=None, metavar='DB',
+                        help="Her çalıştırmayı bu SQLite geçmişine de kaydet (stajyer_history)")
+    parser.add_argument('--improve', type=float, default=None, metavar='SANIYE',
+                        help="Her çalıştırmadan sonra bu süre sınırıyla yerel arama "
+                             "iyileştirmesi uygula (stajyer_improve)")
+    args = parser.parse_args(argv)
+    if args.format == 'parquet' and not args.no_placements:
+        from stajyer_report import parquet_available
+        if not parquet_available():
+            parser.error("--format parquet için pyarrow gerekli (pip install pyarrow)")
+    return args
+
+
+def write_placements(filepath, state, fmt='csv'):
+    """Yerleştirmeleri toplu olarak yaz (stajyer_report); raporu döndür"""
+    from stajyer_report import PlacementReport  # NumPy ilk yazmada yüklenir
+
+    report = PlacementReport(state)
+    report.write(filepath, fmt)
+    return report
+
+
+def run_configuration(algorithm, seed, store, state, log_callback=None,
+                      cprofile=False, trace_memory=False, log_level=LOG_DEBUG):
+    """Tek bir (algoritma, tohum) yapılandırmasını çalıştır"""
+    rng = random.Random(seed) if seed is not None else None
+    metrics = profile_run(ALGORITHMS[algorithm], store, state, log_callback, rng,
+                          cprofile=cprofile, trace_memory=trace_memory, log_level=log_level)
+    metrics['algorithm'] = algorithm
+    metrics['seed'] = seed
+    return metrics
+
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    # Veriler bir kez okunur; tek bir durum her çalıştırmada sıfırlanarak kullanılır
+    store = load_store(args.students, args.firms, cache=not args.no_cache)
+    state = PlacementState(store)
+
+    os.makedirs(args.output_dir, exist_ok=True)
+    log_callback = (lambda msg: print(msg, file=sys.stderr)) if args.verbose else None
+    log_level = LOG_INFO if args.log_level == 'info' else LOG_DEBUG
+
+    # Geçmiş bağlantısı hata veya Ctrl-C'de de kapanır (RunStore bağlam yöneticisidir)
+    history_context = RunStore(args.history) if args.history else contextlib.nullcontext()
+    with history_context as history:
+        metrics_path = os.path.join(args.output_dir, "metrics.jsonl")
+        with open(metrics_path, 'w', encoding='utf-8') as metrics_file:
+            for algorithm in args.algorithms:
+                for run_index, seed in enumerate(args.seeds):
+                    metrics = run_configuration(algorithm, seed, store, state, log_callback,
+                                                args.profile, args.trace_memory, log_level)
+                    if args.improve is not None:
+                        # Yazılan yerleştirmeler ve skor iyileştirilmiş durumu gösterir
+                        improvement = improve_placement(state, args.improve, log_callback,
+                                                        log_level)
+                        metrics['improvement'] = summarize(improvement)
+                        metrics['satisfaction_score'] = improvement['satisfaction_score']
+                    write_jsonl(metrics_file, metrics)
+
+                    report = None
+                    if not args.no_placements:
+                        label = f"seed{seed}" if seed is not None else f"run{run_index}"
+                        report = write_placements(
+                            os.path.join(args.output_dir,
+                                         f"{algorithm}_{label}_placements.{args.format}"),
+                            state, args.format
+                        )
+                    if history is not None:
+                        # Yazılan rapor varsa atamalar tekrar hesaplanmaz
+                        history.record(store, state, metrics, algorithm, seed, report=report)
+
+                    print(f"{algorithm:<10} seed={seed} "
+                          f"memnuniyet={metrics['satisfaction_score']} "
+                          f"iterasyon={metrics['total_iterations']} "
+                          f"süre={metrics['total_time']:.4f}sn")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
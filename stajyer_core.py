@@ -0,0 +1,1813 @@
+"""
+Stajyer Yerleştirme Simülatörü - Çekirdek
+Veri yapıları, CSV okuma ve algoritmalar (tkinter bağımlılığı yoktur)
+"""
+
+import collections
+import csv
+import heapq
+import itertools
+import operator
+import random
+import sys
+import time
+from array import array
+
+from stajyer_store import CompactStore, NO_FIRM
+
+# ==================== PARAMETRELER ====================
+
+GNO_WEIGHT = 0.4              # Eşleşme skorunda GNO ağırlığı
+PREF_WEIGHT = 0.3             # Tercih sırası ağırlığı
+COMPAT_WEIGHT = 0.3           # Uygunluk (firma boşluğu) ağırlığı
+REJECTION_PROBABILITY = 0.30  # Firma reddetme olasılığı
+
+# run_greedy / run_heuristic params sözlüğünün varsayılanları
+DEFAULT_PARAMS = {
+    'gno_weight': GNO_WEIGHT,
+    'pref_weight': PREF_WEIGHT,
+    'compat_weight': COMPAT_WEIGHT,
+    'rejection_probability': REJECTION_PROBABILITY,
+}
+
+def resolve_params(params=None):
+    """
+    params sözlüğünü varsayılanlarla tamamla ve doğrula
+    Ağırlıklar negatif olamaz (heuristic'in sıralama varsayımları); red olasılığı [0, 1)
+    aralığında olmalıdır (1 olursa hiçbir yerleşme kalıcı olmaz)
+    """
+    if not params:
+        return DEFAULT_PARAMS
+    unknown = set(params) - set(DEFAULT_PARAMS)
+    if unknown:
+        raise ValueError(f"Bilinmeyen parametre: {', '.join(sorted(unknown))}")
+    resolved = dict(DEFAULT_PARAMS, **params)
+    for name in ('gno_weight', 'pref_weight', 'compat_weight'):
+        if resolved[name] < 0:
+            raise ValueError(f"{name} negatif olamaz: {resolved[name]}")
+    if not 0 <= resolved['rejection_probability'] < 1:
+        raise ValueError(f"rejection_probability [0, 1) aralığında olmalı: "
+                         f"{resolved['rejection_probability']}")
+    return resolved
+
+# ==================== VERİ YAPILARI ====================
+
+class Student:
+    __slots__ = ('id', 'preferences', 'gno', 'assigned_firm', 'is_placed')
+
+    def __init__(self, student_id, preferences, gno):
+        self.id = student_id
+        self.preferences = preferences  # 5 firma tercihi listesi
+        self.gno = gno
+        self.assigned_firm = None
+        self.is_placed = False
+
+class Firm:
+    __slots__ = ('id', 'capacity', 'current_capacity', 'assigned_students')
+
+    def __init__(self, firm_id, capacity):
+        self.id = firm_id
+        self.capacity = capacity
+        self.current_capacity = capacity
+        self.assigned_students = []
+
+# ==================== CSV OKUMA ====================
+
+STUDENT_CHUNK_SIZE = 50000  # Akışlı okumada parça başına satır sayısı
+
+def iter_student_chunks(filepath="students.csv", firms=None, chunk_size=STUDENT_CHUNK_SIZE,
+                        strict=False, stats=None):
+    """
+    students.csv dosyasını parça parça oku (generator)
+    Her parça (student_id, tercihler, gno) demetlerinden oluşan bir listedir;
+    dosyanın tamamı belleğe alınmaz.
+    firms: bilinen firma id'leri (load_firms sözlüğü, store.firm_index veya küme);
+      verilirse tercihler okunurken doğrulanır
+    strict: bilinmeyen firma tercihinde ValueError fırlat (satır numarasıyla); aksi halde
+      bilinmeyen tercihler olduğu gibi bırakılır (depoda NO_FIRM olur)
+    Eksik sütunlu veya GNO'su sayı olmayan satırlar her zaman ValueError verir.
+    stats: verilirse okunan satır sayısı ve bilinmeyen firmalar buraya yazılır
+    """
+    known = None if firms is None else set(firms)
+    if stats is not None:
+        stats.setdefault('rows', 0)
+        stats.setdefault('unknown_preferences', 0)
+        stats.setdefault('unknown_firms', set())
+
+    with open(filepath, 'r', encoding='utf-8', newline='') as f:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if header is None:
+            return
+        try:
+            id_col = header.index('student_id')
+            pref_col = header.index('preferences')
+            gno_col = header.index('gno')
+        except ValueError:
+            raise ValueError(f"{filepath}: student_id, preferences ve gno sütunları gerekli "
+                             f"(bulunan: {header})") from None
+
+        line = 1
+        while True:
+            chunk = []
+            for row in itertools.islice(reader, chunk_size):
+                line += 1
+                try:
+                    record = (row[id_col], row[pref_col].split(','), float(row[gno_col]))
+                except (IndexError, ValueError) as e:
+                    raise ValueError(f"{filepath}:{line}: hatalı satır ({e})") from None
+                if known is not None and not known.issuperset(record[1]):
+                    unknown = [p for p in record[1] if p not in known]
+                    if strict:
+                        raise ValueError(f"{filepath}:{line}: {record[0]} bilinmeyen firma "
+                                         f"tercihi: {', '.join(unknown)}")
+                    if stats is not None:
+                        stats['unknown_preferences'] += len(unknown)
+                        stats['unknown_firms'].update(unknown)
+                chunk.append(record)
+            if not chunk:
+                return
+            if stats is not None:
+                stats['rows'] += len(chunk)
+            yield chunk
+
+def load_students(filepath="students.csv", store=None, firms=None, strict=False):
+    """
+    students.csv dosyasını oku
+    store (CompactStore) verilirse öğrenciler parça parça doğrudan depoya yazılır ve depo
+    döndürülür; firmalar önce load_firms ile aynı depoya yüklenmiş olmalıdır
+    firms / strict: tercih doğrulaması (bkz. iter_student_chunks)
+    """
+    if store is not None:
+        if firms is None and strict:
+            firms = store.firm_index
+        for chunk in iter_student_chunks(filepath, firms, strict=strict):
+            store.add_students(chunk)
+        return store
+
+    students = []
+    for chunk in iter_student_chunks(filepath, firms, strict=strict):
+        for student_id, prefs, gno in chunk:
+            # Firma id'leri intern edilir: aynı firma tek bir string nesnesi olur
+            students.append(Student(student_id, [sys.intern(p) for p in prefs], gno))
+    return students
+
+def load_firms(filepath="firms.csv", store=None):
+    """
+    firms.csv dosyasını oku
+    store (CompactStore) verilirse firmalar doğrudan depoya yazılır ve depo döndürülür
+    """
+    firms = {}
+    with open(filepath, 'r', encoding='utf-8') as f:
+        reader = csv.DictReader(f)
+        if store is not None:
+            for row in reader:
+                store.add_firm(row['firma_id'].strip(), int(row['kapasite']))
+            return store
+
+        for row in reader:
+            firm_id = sys.intern(row['firma_id'].strip())
+            firm = Firm(
+                firm_id=firm_id,
+                capacity=int(row['kapasite'])
+            )
+            firms[firm_id] = firm
+    return firms
+
+def load_store(students_path="students.csv", firms_path="firms.csv", cache=False):
+    """
+    İki CSV dosyasını doğrudan kompakt depoya oku
+    cache=True ise ikili önbellek kullanılır (bkz. stajyer_cache.load_cached_store):
+    CSV'ler değişmediyse tekrar ayrıştırılmaz, önbellek mmap ile eşlenir
+    """
+    if cache:
+        from stajyer_cache import load_cached_store
+        return load_cached_store(students_path, firms_path)
+
+    store = CompactStore()
+    load_firms(firms_path, store)
+    load_students(students_path, store)
+    return store
+
+# ==================== YARDIMCI FONKSİYONLAR ====================
+
+def reset_data(students, firms):
+    """Verileri başlangıç durumuna sıfırla"""
+    for s in students:
+        s.assigned_firm = None
+        s.is_placed = False
+    for f in firms.values():
+        f.current_capacity = f.capacity
+        f.assigned_students = []
+
+def get_unplaced_students(students):
+    """Yerleşmemiş öğrencileri döndür"""
+    return [s for s in students if not s.is_placed]
+
+def get_available_firms(firms):
+    """Boş kontenjanı olan firmaları döndür"""
+    return {fid: f for fid, f in firms.items() if f.current_capacity > 0}
+
+def _remove_recent(items, item):
+    """
+    Listeden elemanı sondan arayarak sil
+    Aynı iterasyonda eklenen öğrenciler listenin sonundadır, bu yüzden arama kısa sürer
+    """
+    for i in range(len(items) - 1, -1, -1):
+        if items[i] == item:
+            del items[i]
+            return
+
+def place_student(student, firm):
+    """Öğrenciyi firmaya yerleştir"""
+    student.assigned_firm = firm.id
+    student.is_placed = True
+    firm.current_capacity -= 1
+    firm.assigned_students.append(student.id)
+
+def firm_rejection(students, firms, placed_this_iteration, rng=None,
+                   probability=REJECTION_PROBABILITY):
+    """
+    Firma reddetme mekanizması - varsayılan %30 red olasılığı
+    Reddedilen öğrenciler tekrar yerleşmemiş olur
+    rng: random.Random örneği (verilmezse global random modülü)
+    """
+    rng = rng or random
+    by_id = {s.id: s for s in students}
+
+    rejected = []
+    for student_id in placed_this_iteration:
+        if rng.random() < probability:
+            student = by_id[student_id]
+            firm = firms[student.assigned_firm]
+
+            # Reddet
+            student.is_placed = False
+            student.assigned_firm = None
+            firm.current_capacity += 1
+            _remove_recent(firm.assigned_students, student_id)
+            rejected.append(student_id)
+
+    return rejected
+
+def calculate_satisfaction_score(students):
+    """
+    Memnuniyet skoru hesapla
+    1. tercih = 5 puan, 2. tercih = 4 puan, ..., 5. tercih = 1 puan
+    Tercih dışı yerleşme = 0 puan
+    """
+    total_score = 0
+    for s in students:
+        if s.is_placed and s.assigned_firm:
+            if s.assigned_firm in s.preferences:
+                pref_index = s.preferences.index(s.assigned_firm)
+                total_score += (5 - pref_index)  # 1. tercih = 5, 5. tercih = 1
+            # Tercih dışı = 0 puan
+    return total_score
+
+# ==================== YERLEŞTİRME DURUMU ====================
+
+class PlacementState:
+    """
+    Yerleştirme durumu - CompactStore üzerinde tamsayı indekslerle
+    - assigned: öğrenci -> firma indeksi (NO_FIRM = yerleşmemiş)
+    - remaining: firma -> kalan kontenjan
+    - unplaced: yerleşmemiş öğrenci indeksleri kümesi
+    - available_list: boş kontenjanı olan firmalar (O(1) ekleme/çıkarma ve rastgele seçim)
+    Her yerleştirme/red O(1) maliyetle indeksleri günceller, tam tarama yapılmaz.
+    """
+
+    def __init__(self, store, assigned=None, remaining=None):
+        self.store = store
+        self.demand = None  # İsteğe bağlı DemandIndex; place/unplace ile güncellenir
+        if assigned is None:
+            assigned = array('i', [NO_FIRM]) * store.n_students
+            remaining = array('i', store.capacity)
+        self.assigned = assigned
+        self.remaining = remaining
+        self._rebuild_indexes()
+
+    def _rebuild_indexes(self):
+        """unplaced ve boş firma indekslerini assigned/remaining dizilerinden kur - O(n + m)"""
+        self.demand = None
+        assigned = self.assigned
+        unplaced_count = assigned.count(NO_FIRM)
+        if unplaced_count == len(assigned):
+            self.unplaced = set(range(len(assigned)))
+        elif unplaced_count == 0:
+            self.unplaced = set()
+        else:
+            self.unplaced = {i for i, firm in enumerate(assigned) if firm == NO_FIRM}
+        self.available_list = []
+        self._available_pos = {}
+        self._first_heap = []  # "ilk boş firma" için (firma indeksi = CSV sırası)
+        for firm in range(self.store.n_firms):
+            if self.remaining[firm] > 0:
+                self._add_available(firm)
+
+    # ---------- Anlık görüntü (snapshot) ----------
+
+    def reset(self):
+        """
+        Başlangıç durumuna dön - O(n + m), depo ve diziler yeniden kullanılır
+        (reset_data'nın nesne oluşturmayan karşılığı)
+        """
+        self.assigned[:] = array('i', [NO_FIRM]) * len(self.assigned)
+        memoryview(self.remaining)[:] = self.store.capacity
+        self._rebuild_indexes()
+
+    def snapshot(self):
+        """Değişmez anlık görüntü: (assigned, remaining) byte dizileri"""
+        return self.assigned.tobytes(), self.remaining.tobytes()
+
+    def restore(self, snapshot):
+        """snapshot() ile alınan görüntüye dön - O(n + m)"""
+        assigned, remaining = snapshot
+        self.assigned = array('i')
+        self.assigned.frombytes(assigned)
+        self.remaining = array('i')
+        self.remaining.frombytes(remaining)
+        self._rebuild_indexes()
+
+    def fork(self):
+        """Aynı depoyu paylaşan bağımsız bir kopya döndür - O(n + m)"""
+        return PlacementState(self.store, array('i', self.assigned), array('i', self.remaining))
+
+    def _add_available(self, firm):
+        if firm in self._available_pos:
+            return
+        self._available_pos[firm] = len(self.available_list)
+        self.available_list.append(firm)
+        heapq.heappush(self._first_heap, firm)
+
+    def _remove_available(self, firm):
+        pos = self._available_pos.pop(firm, None)
+        if pos is None:
+            return
+        last = self.available_list.pop()
+        if last != firm:
+            self.available_list[pos] = last
+            self._available_pos[last] = pos
+
+    def set_available_order(self, firms):
+        """
+        Boş firma listesinin sırasını ayarla - O(m)
+        firms aynı firma kümesinin başka bir durumdaki sırasıdır (random_available seçimleri
+        o durumla aynı olsun diye; bkz. stajyer_whatif)
+        """
+        self.available_list = list(firms)
+        self._available_pos = {firm: pos for pos, firm in enumerate(self.available_list)}
+        self._first_heap = sorted(self.available_list)
+
+    def is_available(self, firm):
+        """Firmanın boş kontenjanı var mı - O(1)"""
+        return firm in self._available_pos
+
+    def has_available(self):
+        return bool(self.available_list)
+
+    def first_available(self):
+        """CSV sırasına göre ilk boş firmayı döndür (yoksa None)"""
+        heap = self._first_heap
+        while heap and heap[0] not in self._available_pos:
+            heapq.heappop(heap)
+        return heap[0] if heap else None
+
+    def random_available(self, rng=random):
+        """Boş kontenjanı olan rastgele bir firma döndür (yoksa None)"""
+        if not self.available_list:
+            return None
+        return rng.choice(self.available_list)
+
+    def unplaced_by_gno(self):
+        """Yerleşmemiş öğrencileri GNO sırasında döndür - O(u log u)"""
+        return sorted(self.unplaced, key=self.store.gno_rank().__getitem__)
+
+    def unplaced_in_order(self):
+        """Yerleşmemiş öğrencileri liste sırasında döndür - O(u log u)"""
+        return sorted(self.unplaced)
+
+    def is_placed(self, student):
+        return self.assigned[student] != NO_FIRM
+
+    def place(self, student, firm):
+        """Öğrenciyi firmaya yerleştir"""
+        if self.demand is not None:
+            self.demand.on_place(self, student, firm)
+        self.assigned[student] = firm
+        self.remaining[firm] -= 1
+        self.unplaced.discard(student)
+        if self.remaining[firm] <= 0:
+            self._remove_available(firm)
+
+    def unplace(self, student):
+        """Öğrencinin yerleşmesini geri al, firmayı döndür"""
+        firm = self.assigned[student]
+        self.assigned[student] = NO_FIRM
+        self.remaining[firm] += 1
+        self.unplaced.add(student)
+        if self.remaining[firm] > 0:
+            self._add_available(firm)
+        if self.demand is not None:
+            self.demand.on_unplace(self, student, firm)
+        return firm
+
+    def add_student(self):
+        """Depoya eklenen yeni öğrenci için yerleşmemiş bir satır aç, indeksini döndür"""
+        student = len(self.assigned)
+        self.assigned.append(NO_FIRM)
+        self.unplaced.add(student)
+        return student
+
+    def set_capacity(self, firm, capacity):
+        """
+        Firma kapasitesini değiştir (depo dahil); kalan kontenjan farka göre güncellenir
+        Kapasite doluluğun altına inerse remaining negatif olur, fazlalık çağıranın
+        sorumluluğundadır (ör. stajyer_incremental en düşük öncelikli öğrencileri çıkarır)
+        """
+        delta = capacity - self.store.capacity[firm]
+        self.store.capacity[firm] = capacity
+        self.remaining[firm] += delta
+        if self.remaining[firm] > 0:
+            self._add_available(firm)
+        else:
+            self._remove_available(firm)
+
+    def satisfaction_score(self):
+        """calculate_satisfaction_score ile aynı puanlama"""
+        store = self.store
+        total_score = 0
+        for student, firm in enumerate(self.assigned):
+            if firm != NO_FIRM:
+                rank = store.pref_rank(student, firm)
+                if rank >= 0:
+                    total_score += 5 - rank
+        return total_score
+
+    def iter_placements(self):
+        """Yerleşen öğrenciler için (öğrenci_id, firma_id, tercih_sırası) üret"""
+        store = self.store
+        for student, firm in enumerate(self.assigned):
+            if firm != NO_FIRM:
+                rank = store.pref_rank(student, firm)
+                yield (store.student_ids[student], store.firm_ids[firm],
+                       rank + 1 if rank >= 0 else None)
+
+    def write_back(self, students, firms):
+        """Durumu Student/Firm nesnelerine yaz (depo bu nesnelerden kurulmuş olmalı)"""
+        firm_ids = self.store.firm_ids
+        for f in firms.values():
+            f.assigned_students = []
+        for student, firm in zip(students, self.assigned):
+            if firm != NO_FIRM:
+                student.assigned_firm = firm_ids[firm]
+                student.is_placed = True
+                firms[student.assigned_firm].assigned_students.append(student.id)
+            else:
+                student.assigned_firm = None
+                student.is_placed = False
+        for firm, fid in enumerate(firm_ids):
+            firms[fid].current_capacity = self.remaining[firm]
+
+class DemandIndex:
+    """
+    Tercih içi erişilebilirlik - faz geçişlerinin olay tabanlı kontrolü
+    - demand[f]: f'yi tercih eden yerleşmemiş öğrenci sayısı (store.interested() ters
+      indeksinden kurulur)
+    - live: boş kontenjanı olan ve demand > 0 olan firma sayısı
+    live == 0 ise hiçbir yerleşmemiş öğrencinin boş kontenjanlı bir tercihi yoktur; tercih
+    bazlı bir iterasyon kimseyi yerleştiremez. Durumun place/unplace işlemleri sayaçları
+    öğrencinin tercihleri üzerinden günceller - O(tercih sayısı). Durum sıfırlanınca
+    (reset/restore) bağlantı kopar.
+    """
+
+    __slots__ = ('demand', 'live')
+
+    def __init__(self, state):
+        assigned = state.assigned
+        self.demand = array('i', [
+            sum(1 for student in students if assigned[student] == NO_FIRM)
+            for students in state.store.interested()
+        ])
+        self.live = sum(1 for firm in state.available_list if self.demand[firm] > 0)
+        state.demand = self
+
+    def on_place(self, state, student, firm):
+        """Yerleştirmeden önce çağrılır"""
+        demand = self.demand
+        available = state._available_pos
+        store = state.store
+        start = student * store.width
+        for pref in store.prefs[start:start + store.width]:
+            if pref != NO_FIRM:
+                demand[pref] -= 1
+                if demand[pref] == 0 and pref in available:
+                    self.live -= 1
+        if state.remaining[firm] == 1 and demand[firm] > 0:
+            self.live -= 1  # Firma doluyor
+
+    def on_unplace(self, state, student, firm):
+        """Yerleşme geri alındıktan sonra çağrılır"""
+        demand = self.demand
+        available = state._available_pos
+        if state.remaining[firm] == 1 and demand[firm] > 0:
+            self.live += 1  # Firma tekrar boş kontenjanlı
+        store = state.store
+        start = student * store.width
+        for pref in store.prefs[start:start + store.width]:
+            if pref != NO_FIRM:
+                demand[pref] += 1
+                if demand[pref] == 1 and pref in available:
+                    self.live += 1
+
+def _phase_state(store, state, start_phase):
+    """
+    Faz tabanlı algoritmaların başlangıç durumu
+    start_phase == 1: durum sıfırlanır (verilmezse yeni oluşturulur)
+    start_phase > 1: verilen durumdan devam edilir, sıfırlanmaz (ör. parçalı eşleştirmede
+    parçaların FAZ 1 sonuçları birleştirildikten sonra global FAZ 2/3 geçişi)
+    """
+    if start_phase > 1:
+        if state is None:
+            raise ValueError("start_phase > 1 için devam edilecek durum verilmeli")
+        return state
+    if state is None:
+        return PlacementState(store)
+    state.reset()
+    return state
+
+def _next_phase(state, demand, phase, placed_this_iteration):
+    """
+    Bir sonraki iterasyonda faz değişmeli mi?
+    - FAZ 1 -> 2: hiçbir yerleşmemiş öğrencinin boş kontenjanlı tercihi kalmadı
+      (demand.live == 0); tercih bazlı iterasyonlar artık kimseyi yerleştiremez
+    - FAZ 2 -> 3: iterasyon kimseyi yerleştiremedi (güvenlik ağı - boş kontenjan varken
+      FAZ 2 her öğrenciyi yerleştirir)
+    """
+    if not state.unplaced:
+        return False
+    if phase == 1:
+        return demand.live == 0
+    return phase == 2 and not placed_this_iteration
+
+def reject_placements(state, placed_this_iteration, rng=random,
+                      probability=REJECTION_PROBABILITY, rejected_firms=None):
+    """
+    Firma reddetme mekanizması (depo tabanlı) - varsayılan %30 red olasılığı
+    Reddedilen öğrenci indekslerini döndürür
+    rejected_firms verilirse reddedilenlerin bırakıldığı firmalar aynı sırayla eklenir
+    """
+    rejected = []
+    for student in placed_this_iteration:
+        if rng.random() < probability:
+            if rejected_firms is not None:
+                rejected_firms.append(state.assigned[student])
+            state.unplace(student)
+            rejected.append(student)
+    return rejected
+
+def _run_object_algorithm(run, students, firms, log_callback, rng, log_level):
+    """Nesne listeleri için algoritmayı depo üzerinde çalıştır ve sonucu nesnelere yaz"""
+    store = CompactStore.from_objects(students, firms)
+    state = PlacementState(store)
+    metrics = run(store, state, log_callback, rng, log_level)
+    state.write_back(students, firms)
+    return metrics
+
+# ==================== ÖLÇÜM ====================
+
+# metrics['timings_ns'] bölümleri: nerede ne kadar zaman harcandığı (nanosaniye, toplam)
+TIMING_SECTIONS = ('sort', 'scoring', 'matching', 'rejection', 'logging', 'satisfaction')
+
+# metrics['counters']: sıcak yoldaki yardımcı işlemlerin çağrı sayıları
+# (get_available_firms / firm_rejection / calculate_match_score'un durum tabanlı karşılıkları)
+COUNTERS = ('availability_checks', 'first_available_calls', 'random_available_calls',
+            'match_scores', 'stale_entries', 'rejection_checks')
+
+def _new_metrics():
+    """
+    Boş metrik sözlüğü
+    Süreler perf_counter_ns ile (monoton) ölçülür; start_time/end_time duvar saatidir
+    """
+    return {
+        'total_iterations': 0,
+        'total_operations': 0,
+        'start_time': time.time(),
+        'phase_changes': [],
+        'rejections': 0,
+        'wasted_iterations': 0,  # Kimsenin yerleşmediği iterasyonlar
+        'timings_ns': dict.fromkeys(TIMING_SECTIONS, 0),
+        'phase_times_ns': {},
+        'counters': dict.fromkeys(COUNTERS, 0),
+        'iterations': [],  # İterasyon başına: faz, yerleşmemiş, yerleşen, reddedilen, süre
+    }
+
+def _record_iteration(metrics, iteration, phase, unplaced, placed, rejected, elapsed_ns):
+    metrics['iterations'].append({
+        'iteration': iteration, 'phase': phase, 'unplaced': unplaced,
+        'placed': placed, 'rejected': rejected, 'time_ns': elapsed_ns,
+    })
+    if not placed:
+        metrics['wasted_iterations'] += 1
+    phase_times = metrics['phase_times_ns']
+    phase_times[phase] = phase_times.get(phase, 0) + elapsed_ns
+
+def _finish_metrics(metrics, state, start_ns):
+    t = time.perf_counter_ns()
+    metrics['satisfaction_score'] = state.satisfaction_score()
+    end_ns = time.perf_counter_ns()
+    metrics['timings_ns']['satisfaction'] += end_ns - t
+    metrics['end_time'] = time.time()
+    metrics['total_time_ns'] = end_ns - start_ns
+    metrics['total_time'] = metrics['total_time_ns'] / 1e9
+
+# Log seviyeleri (logging modülündeki değerlerle aynı)
+LOG_DEBUG = 10  # İterasyon ayrıntıları
+LOG_INFO = 20   # Başlangıç, faz geçişleri ve sonuç özeti
+LOG_OFF = 100   # Hiç log yok
+
+def _make_logger(log_callback, metrics, log_level):
+    """
+    Log fonksiyonu ve seviye bayrakları: (log, debug açık mı, info açık mı)
+    Algoritmalar mesajları bayraklar açıksa oluşturur; kapalı seviyelerde f-string
+    biçimlendirmesi hiç yapılmaz. log_callback'te geçen süre 'logging' bölümüne yazılır.
+    """
+    timings = metrics['timings_ns']
+
+    def log(msg):
+        t = time.perf_counter_ns()
+        log_callback(msg)
+        timings['logging'] += time.perf_counter_ns() - t
+
+    enabled = log_callback is not None
+    return log, enabled and log_level <= LOG_DEBUG, enabled and log_level <= LOG_INFO
+
+# ==================== CANLI İLERLEME ====================
+
+class IterationDelta:
+    """
+    Bir iterasyonun sıkıştırılmış değişiklik kaydı (run_* event_callback ile yayınlanır)
+    - placed / placed_firms: iterasyonda yerleştirilen öğrenciler ve firmaları
+    - rejected / rejected_firms: yerleşmesi geri alınan öğrenciler ve bırakıldıkları firmalar
+    - unplaced: iterasyon sonunda yerleşmemiş öğrenci sayısı
+    - next_phase: bu iterasyondan sonra faz değiştiyse yeni faz, yoksa None
+    Diziler öğrenci/firma indeksleridir (array('i'); id'ler depodan çözülür), mesaj
+    biçimlendirmesi yapılmaz. Firma doluluğu placed_firms'teki her kayıtla 1 artar,
+    rejected_firms'tekiyle 1 azalır; kayıtların sırası önemli değildir.
+    """
+
+    __slots__ = ('iteration', 'phase', 'placed', 'placed_firms', 'rejected', 'rejected_firms',
+                 'unplaced', 'next_phase')
+
+    def __init__(self, iteration, phase, placed, placed_firms, rejected=None,
+                 rejected_firms=None, unplaced=0, next_phase=None):
+        self.iteration = iteration
+        self.phase = phase
+        self.placed = placed
+        self.placed_firms = placed_firms
+        self.rejected = array('i') if rejected is None else rejected
+        self.rejected_firms = array('i') if rejected_firms is None else rejected_firms
+        self.unplaced = unplaced
+        self.next_phase = next_phase
+
+    def fill_changes(self):
+        """Firma -> doluluk değişimi (Counter; kalan kontenjan ters yönde değişir)"""
+        changes = collections.Counter(self.placed_firms)
+        if self.rejected_firms:
+            # Counter(...) C düzeyinde sayar; subtract'a doğrudan dizi vermek Python döngüsüdür
+            changes.subtract(collections.Counter(self.rejected_firms))
+        return changes
+
+def _matched_delta(state, iteration, phase, placed):
+    """
+    Eşleştirme adımından sonra, reddetmeden önce iterasyon kaydını başlat
+    Firmalar itemgetter ile toplanır (map(__getitem__)'den ~2 kat hızlı); itemgetter tek
+    indekste demet değil değer döndürdüğü için küçük listeler ayrı ele alınır
+    """
+    if len(placed) > 1:
+        firms = array('i', operator.itemgetter(*placed)(state.assigned))
+    else:
+        firms = array('i', [state.assigned[student] for student in placed])
+    return IterationDelta(iteration, phase, array('i', placed), firms)
+
+def _emit_delta(event_callback, delta, state, rejected, next_phase):
+    """
+    Reddedilenleri ekle ve kaydı yayınla
+    Firmaları reject_placements(rejected_firms=delta.rejected_firms) tarafından doldurulur
+    """
+    if rejected:
+        delta.rejected = array('i', rejected)
+    delta.unplaced = len(state.unplaced)
+    delta.next_phase = next_phase
+    event_callback(delta)
+
+# ==================== GREEDY ALGORİTMASI ====================
+
+def run_greedy(store, state=None, log_callback=None, rng=None, log_level=LOG_DEBUG,
+               params=None, start_phase=1, max_phase=3, trace=None, resume=None,
+               event_callback=None):
+    """
+    Greedy algoritmasını CompactStore üzerinde çalıştır
+    state verilirse önce sıfırlanır ve sonuç oraya yazılır; aynı state birçok
+    çalıştırmada tekrar kullanılabilir (deepcopy gerekmez)
+    rng: random.Random örneği; verilmezse global random modülü kullanılır
+    log_level: LOG_DEBUG (iterasyon ayrıntıları), LOG_INFO (özet) veya LOG_OFF
+    params: DEFAULT_PARAMS anahtarlarından bazıları (greedy sadece rejection_probability kullanır)
+    start_phase / max_phase: çalıştırılacak faz aralığı (bkz. _phase_state)
+    trace: her iterasyonun başında iteration_start(iterasyon, faz, state, rng, sıra, metrics),
+           eşleştirmeden sonra (reddetmeden önce) matched(yerleşenler, state) çağrılan kayıtçı
+           (bkz. stajyer_whatif.GreedyTrace)
+    resume: iterasyonun ortasından devam - {'iteration', 'phase', 'order', 'position',
+            'placed'}; state o noktadaki durum olmalıdır (sıfırlanmaz). İlk iterasyon 'order'
+            listesinin 'position' konumundan, 'placed' zaten yerleşmişlerle başlar.
+            Metrikler sadece devam edilen kısmı sayar (iterasyon numaraları hariç).
+    event_callback: her iterasyonun sonunda IterationDelta ile çağrılır (canlı ilerleme)
+    """
+    start_ns = time.perf_counter_ns()
+    rng = rng or random
+    rejection_probability = resolve_params(params)['rejection_probability']
+    if resume is None:
+        state = _phase_state(store, state, start_phase)
+    else:
+        start_phase = resume['phase']
+    prefs = store.prefs
+    width = store.width
+
+    metrics = _new_metrics()
+    timings = metrics['timings_ns']
+    counters = metrics['counters']
+
+    current_phase = start_phase
+
+    log, log_debug, log_info = _make_logger(log_callback, metrics, log_level)
+    demand = DemandIndex(state)
+    if resume is not None:
+        metrics['total_iterations'] = resume['iteration'] - 1
+
+    if log_info:
+        log("=" * 50)
+        log("GREEDY ALGORİTMASI BAŞLADI")
+        log("=" * 50)
+
+    while True:
+        # Yarıda kalan iterasyona devam ederken başlangıç kontrolleri zaten geçilmiştir
+        if resume is None:
+            if not state.unplaced:
+                if log_info:
+                    log("\nTüm öğrenciler yerleşti!")
+                break
+            if not state.has_available():
+                if log_info:
+                    log(f"\nBoş kontenjan kalmadı: {len(state.unplaced)} öğrenci yerleşemedi")
+                break
+
+        iteration_start = time.perf_counter_ns()
+        metrics['total_iterations'] += 1
+        iteration = metrics['total_iterations']
+
+        if resume is None:
+            # GNO'ya göre sırala (yüksekten düşüğe)
+            unplaced = state.unplaced_by_gno()
+            position = 0
+            placed_this_iteration = []
+        else:
+            unplaced = resume['order']
+            position = resume['position']
+            placed_this_iteration = list(resume['placed'])
+            resume = None
+        t = time.perf_counter_ns()
+        timings['sort'] += t - iteration_start
+
+        if trace is not None:
+            trace.iteration_start(iteration, current_phase, state, rng, unplaced, metrics)
+
+        if log_debug:
+            log(f"\n--- İterasyon {iteration} (Faz {current_phase}) ---")
+            log(f"Yerleşmemiş öğrenci sayısı: {len(unplaced)}")
+
+        t = time.perf_counter_ns()
+        checks = 0
+        for student in itertools.islice(unplaced, position, None):
+            if not state.has_available():
+                break
+
+            placed = False
+
+            # FAZ 1 ve FAZ 2: Tercih bazlı yerleştirme
+            if current_phase <= 2:
+                # Önce tercihlere bak
+                start = student * width
+                for pref in prefs[start:start + width]:
+                    if pref == NO_FIRM:
+                        continue
+                    checks += 1
+                    if state.is_available(pref):
+                        state.place(student, pref)
+                        placed_this_iteration.append(student)
+                        placed = True
+                        break
+
+                # FAZ 2: Tercih dışı yerleştirme
+                if not placed and current_phase == 2:
+                    # Boş kontenjanı olan rastgele firmaya yerleştir
+                    counters['random_available_calls'] += 1
+                    random_firm = state.random_available(rng)
+                    if random_firm is not None:
+                        metrics['total_operations'] += 1
+                        state.place(student, random_firm)
+                        placed_this_iteration.append(student)
+                        placed = True
+
+            # FAZ 3: Zorunlu yerleştirme
+            elif current_phase == 3:
+                # İlk boş firmaya yerleştir
+                counters['first_available_calls'] += 1
+                first_available = state.first_available()
+                if first_available is not None:
+                    metrics['total_operations'] += 1
+                    state.place(student, first_available)
+                    placed_this_iteration.append(student)
+        metrics['total_operations'] += checks
+        counters['availability_checks'] += checks
+        timings['matching'] += time.perf_counter_ns() - t
+
+        if log_debug:
+            log(f"Bu iterasyonda yerleşen: {len(placed_this_iteration)}")
+        if trace is not None:
+            trace.matched(placed_this_iteration, state)
+        if event_callback is not None:
+            delta = _matched_delta(state, iteration, current_phase, placed_this_iteration)
+
+        # Firma reddetme (FAZ 3'te yok)
+        rejected = ()
+        if current_phase < 3 and placed_this_iteration:
+            t = time.perf_counter_ns()
+            rejected = reject_placements(
+                state, placed_this_iteration, rng, rejection_probability,
+                delta.rejected_firms if event_callback is not None else None)
+            timings['rejection'] += time.perf_counter_ns() - t
+            counters['rejection_checks'] += len(placed_this_iteration)
+            metrics['rejections'] += len(rejected)
+            if rejected and log_debug:
+                log(f"Reddedilen öğrenci sayısı: {len(rejected)}")
+
+        _record_iteration(metrics, iteration, current_phase, len(unplaced),
+                          len(placed_this_iteration), len(rejected),
+                          time.perf_counter_ns() - iteration_start)
+
+        # Faz geçişleri (olay tabanlı)
+        change_phase = _next_phase(state, demand, current_phase, placed_this_iteration)
+        if event_callback is not None:
+            _emit_delta(event_callback, delta, state, rejected,
+                        current_phase + 1 if change_phase and current_phase < max_phase
+                        else None)
+        if change_phase:
+            if current_phase == max_phase:
+                if log_info:
+                    log(f"\nFAZ {max_phase} sonunda durduruldu: "
+                        f"{len(state.unplaced)} öğrenci yerleşmedi")
+                break
+            current_phase += 1
+            metrics['phase_changes'].append((iteration, current_phase))
+            if log_info:
+                log(f"\n*** FAZ {current_phase}'e geçildi ***")
+
+    state.demand = None
+    _finish_metrics(metrics, state, start_ns)
+
+    if log_info:
+        log("\n" + "=" * 50)
+        log("GREEDY SONUÇLARI")
+        log("=" * 50)
+        log(f"Toplam iterasyon: {metrics['total_iterations']}")
+        log(f"Toplam işlem: {metrics['total_operations']}")
+        log(f"Toplam süre: {metrics['total_time']:.4f} saniye")
+        log(f"Memnuniyet skoru: {metrics['satisfaction_score']}")
+        log(f"Toplam red sayısı: {metrics['rejections']}")
+
+    return metrics
+
+def greedy_algorithm(students, firms, log_callback=None, rng=None, log_level=LOG_DEBUG):
+    """
+    Greedy (Açgözlü) Algoritma
+    - Öğrenciler GNO'ya göre sıralanır
+    - Her öğrenci tercihlerine sırayla bakar
+    - İlk boş firmaya yerleşir
+    """
+    return _run_object_algorithm(run_greedy, students, firms, log_callback, rng, log_level)
+
+# ==================== HEURİSTİC ALGORİTMASI ====================
+
+def calculate_match_score(student, firm, firms, is_preference):
+    """
+    Eşleşme skoru hesapla
+    Tercih içi: Skor = (GNO × 0.4) + (Tercih × 0.3) + (Uygunluk × 0.3)
+    Tercih dışı: Skor = (GNO × 0.4) + (Uygunluk × 0.3)
+    """
+    # GNO skoru (0-4 arası normalize edilmiş)
+    gno_score = student.gno / 4.0
+
+    # Tercih skoru
+    if is_preference and firm.id in student.preferences:
+        pref_index = student.preferences.index(firm.id)
+        pref_score = (5 - pref_index) / 5.0  # 1. tercih = 1.0, 5. tercih = 0.2
+    else:
+        pref_score = 0
+
+    # Uygunluk skoru (basit: firma kapasitesi bazlı)
+    # Daha az dolu firmalar daha yüksek skor
+    fill_ratio = 1 - (firm.current_capacity / firm.capacity) if firm.capacity > 0 else 0
+    compat_score = 1 - fill_ratio  # Boş firmalar daha yüksek skor
+
+    if is_preference:
+        score = ((gno_score * GNO_WEIGHT) + (pref_score * PREF_WEIGHT)
+                 + (compat_score * COMPAT_WEIGHT))
+    else:
+        score = (gno_score * GNO_WEIGHT) + (compat_score * COMPAT_WEIGHT)
+
+    return score
+
+def _compat_score(state, firm):
+    """calculate_match_score içindeki uygunluk skoru (boş firmalar yüksek)"""
+    capacity = state.store.capacity[firm]
+    fill_ratio = 1 - (state.remaining[firm] / capacity) if capacity > 0 else 0
+    return 1 - fill_ratio
+
+def _vectorized_round_setup(unplaced, state, scoring):
+    """
+    Tercih akışlarını ve GNO sırasını ScoringArrays ile kur
+    Saf Python yolu ile aynı sıralamayı üretir
+    """
+    import numpy as np
+
+    rows = np.array(unplaced, dtype=np.intp)
+    available = np.zeros(state.store.n_firms, dtype=bool)
+    available[state.available_list] = True
+    firm, pos, neg_base = scoring.pref_entries(rows, available)
+
+    pref_streams = {}
+    bounds = np.flatnonzero(np.diff(firm)) + 1
+    starts = [0] + bounds.tolist()
+    ends = bounds.tolist() + [len(firm)]
+    firm_list = firm.tolist()
+    pos_list = pos.tolist()
+    base_list = neg_base.tolist()
+    for start, end in zip(starts, ends):
+        if start < end:
+            pref_streams[firm_list[start]] = list(
+                zip(base_list[start:end], pos_list[start:end])
+            )
+
+    by_gno = np.lexsort((np.arange(len(rows)), -scoring.gno[rows])).tolist()
+    return pref_streams, by_gno
+
+def heuristic_match_round(unplaced, state, phase, metrics, scoring=None, params=None):
+    """
+    Heuristic FAZ 1/2 iterasyonu - öncelik kuyruğu (heap) ile
+    Skor = sabit kısım (GNO + tercih) + uygunluk ağırlığı × uygunluk; uygunluk sadece
+    firmaya bağlıdır (ağırlıklar params'tan, varsayılan 0.4 / 0.3 / 0.3).
+    - Tercih içi: her firma için adaylar sabit kısma göre bir kez sıralanır ve kuyrukta
+      her firmanın sadece en iyi adayı durur
+    - Tercih dışı (FAZ 2): firmalar uygunluğa göre ayrı bir heap'te tutulur, aday en yüksek
+      GNO'lu yerleşmemiş öğrencidir; üst sınırı aşamayan firmalara bakılmaz
+    - Firma bir öğrenci aldığında sürümü artar; eski kayıtlar kuyruğun başına geldiğinde
+      yeniden skorlanır (lazy). Skorlar iterasyon içinde sadece azalır, bu yüzden
+      doğrulanmış en üst kayıt gerçek en yüksek skorlu eşleşmedir.
+    Bellek O(n + m): tüm (öğrenci, firma) çiftleri hiçbir zaman oluşturulmaz.
+    scoring verilirse (stajyer_scoring.ScoringArrays, aynı ağırlıklarla kurulmuş) tercih akışları
+    NumPy ile tek seferde kurulur.
+    unplaced: öğrenci indeksleri (liste sırasında); yerleşenlerin indeksleri döndürülür
+    Kurulum süresi metrics['timings_ns']['scoring'], seçim döngüsü 'matching' bölümüne yazılır
+    """
+    setup_start = time.perf_counter_ns()
+    counters = metrics['counters']
+    store = state.store
+    prefs = store.prefs
+    width = store.width
+    assigned = state.assigned
+    version = {}  # firma -> bu iterasyonda aldığı yerleştirme sayısı
+    params = resolve_params(params)
+    gno_weight = params['gno_weight']
+    pref_weight = params['pref_weight']
+    compat_weight = params['compat_weight']
+
+    # Sabit kısımlar calculate_match_score ile aynı işlem sırasıyla hesaplanır
+    gno_parts = [(store.gno[student] / 4.0) * gno_weight for student in unplaced]
+
+    # Tercih akışı: firma -> [(-sabit kısım, sıra)], skorla azalan
+    if scoring is not None:
+        pref_streams, by_gno = _vectorized_round_setup(unplaced, state, scoring)
+    else:
+        by_gno = sorted(range(len(unplaced)), key=lambda t: (-store.gno[unplaced[t]], t))
+        # (Tekrarlanan tercih varsa ikinci kayıt daha düşük skorla sıralanır ve atlanır)
+        is_available = state.is_available
+        pref_parts = [((5 - pref_index) / 5.0) * pref_weight for pref_index in range(width)]
+        pref_streams = {}
+        for tie, student in enumerate(unplaced):
+            gno_part = gno_parts[tie]
+            start = student * width
+            for pref_index in range(width):
+                firm = prefs[start + pref_index]
+                if firm != NO_FIRM and is_available(firm):
+                    stream = pref_streams.get(firm)
+                    if stream is None:
+                        stream = pref_streams[firm] = []
+                    stream.append((-(gno_part + pref_parts[pref_index]), tie))
+        for stream in pref_streams.values():
+            stream.sort()
+    pref_pos = dict.fromkeys(pref_streams, 0)
+
+    def pref_entry(firm):
+        """Firmanın tercih akışındaki en iyi adayı: (-skor, sıra, firma, sürüm)"""
+        stream = pref_streams.get(firm)
+        if not stream:
+            return None
+        pos = pref_pos[firm]
+        while pos < len(stream) and assigned[unplaced[stream[pos][1]]] != NO_FIRM:
+            pos += 1
+        pref_pos[firm] = pos
+        if pos == len(stream):
+            return None
+        neg_base, tie = stream[pos]
+        metrics['total_operations'] += 1
+        counters['match_scores'] += 1
+        score = -neg_base + _compat_score(state, firm) * compat_weight
+        return (-score, tie, firm, version.get(firm, 0))
+
+    pref_heap = []
+    for firm in pref_streams:
+        entry = pref_entry(firm)
+        if entry is not None:
+            pref_heap.append(entry)
+    heapq.heapify(pref_heap)
+
+    # Tercih dışı akış: GNO sırası (by_gno) + yerleşenleri atlayan union-find
+    gno_pos = [0] * len(unplaced)
+    for pos, tie in enumerate(by_gno):
+        gno_pos[tie] = pos
+    next_free = list(range(len(unplaced) + 1))
+    outside_pos = {}
+    compat_heap = []
+
+    def push_compat(firm):
+        heapq.heappush(compat_heap, (-_compat_score(state, firm), firm, version.get(firm, 0)))
+
+    def find_free(pos):
+        root = pos
+        while next_free[root] != root:
+            root = next_free[root]
+        while next_free[pos] != root:
+            next_free[pos], pos = root, next_free[pos]
+        return root
+
+    def outside_partner(firm):
+        """Firmayı listelemeyen en yüksek GNO'lu yerleşmemiş öğrencinin sırası"""
+        pos = find_free(outside_pos.get(firm, 0))
+        while pos < len(by_gno):
+            start = unplaced[by_gno[pos]] * width
+            if firm not in prefs[start:start + width]:
+                break
+            pos = find_free(pos + 1)
+        outside_pos[firm] = pos
+        return by_gno[pos] if pos < len(by_gno) else None
+
+    def best_outside():
+        top = find_free(0)
+        if top == len(by_gno):
+            return None
+        top_part = gno_parts[by_gno[top]]
+        best = None
+        popped = []
+        while compat_heap:
+            entry = heapq.heappop(compat_heap)
+            neg_compat, firm, firm_version = entry
+            if firm_version != version.get(firm, 0) or not state.is_available(firm):
+                counters['stale_entries'] += 1
+                continue  # Eski kayıt, at
+            popped.append(entry)
+            compat_part = -neg_compat * compat_weight
+            if best is not None and -(top_part + compat_part) >= best[0]:
+                break  # Kalan firmalar üst sınırı aşamaz
+            tie = outside_partner(firm)
+            if tie is None:
+                continue
+            metrics['total_operations'] += 1
+            counters['match_scores'] += 1
+            candidate = (-(gno_parts[tie] + compat_part), tie, firm, firm_version)
+            if best is None or candidate < best:
+                best = candidate
+        for entry in popped:
+            heapq.heappush(compat_heap, entry)
+        return best
+
+    if phase == 2:
+        for firm in state.available_list:
+            push_compat(firm)
+
+    match_start = time.perf_counter_ns()
+    metrics['timings_ns']['scoring'] += match_start - setup_start
+
+    placed_this_iteration = []
+    while True:
+        # Tercih kuyruğunun başını doğrula
+        while pref_heap:
+            _, tie, firm, firm_version = pref_heap[0]
+            if (assigned[unplaced[tie]] != NO_FIRM or firm_version != version.get(firm, 0)
+                    or not state.is_available(firm)):
+                heapq.heappop(pref_heap)
+                counters['stale_entries'] += 1
+                if state.is_available(firm):
+                    entry = pref_entry(firm)
+                    if entry is not None:
+                        heapq.heappush(pref_heap, entry)
+                continue
+            break
+
+        best = pref_heap[0] if pref_heap else None
+        if phase == 2:
+            outside = best_outside()
+            if outside is not None and (best is None or outside[:3] < best[:3]):
+                best = outside
+        if best is None:
+            break
+
+        if pref_heap and best is pref_heap[0]:
+            heapq.heappop(pref_heap)
+        _, tie, firm, _ = best
+        student = unplaced[tie]
+
+        state.place(student, firm)
+        placed_this_iteration.append(student)
+        version[firm] = version.get(firm, 0) + 1
+        next_free[gno_pos[tie]] = gno_pos[tie] + 1
+
+        if state.is_available(firm):
+            entry = pref_entry(firm)
+            if entry is not None:
+                heapq.heappush(pref_heap, entry)
+            if phase == 2:
+                push_compat(firm)
+
+    metrics['timings_ns']['matching'] += time.perf_counter_ns() - match_start
+    return placed_this_iteration
+
+# Bu sayının altında NumPy hazırlık maliyeti kazançtan büyük
+VECTORIZE_MIN_STUDENTS = 10000
+
+def make_scoring_arrays(store, params=None):
+    """NumPy kuruluysa ve veri yeterince büyükse vektörel skorlama dizilerini hazırla"""
+    if store.n_students < VECTORIZE_MIN_STUDENTS:
+        return None
+    try:
+        from stajyer_scoring import ScoringArrays
+    except ImportError:
+        return None
+    params = resolve_params(params)
+    return ScoringArrays(store, params['gno_weight'], params['pref_weight'],
+                         params['compat_weight'])
+
+def run_heuristic(store, state=None, log_callback=None, rng=None, log_level=LOG_DEBUG,
+                  params=None, start_phase=1, max_phase=3, event_callback=None):
+    """
+    Heuristic algoritmasını CompactStore üzerinde çalıştır
+    state verilirse önce sıfırlanır ve sonuç oraya yazılır; aynı state birçok
+    çalıştırmada tekrar kullanılabilir (deepcopy gerekmez)
+    rng: random.Random örneği; verilmezse global random modülü kullanılır
+    log_level: LOG_DEBUG (iterasyon ayrıntıları), LOG_INFO (özet) veya LOG_OFF
+    params: skor ağırlıkları ve red olasılığı (DEFAULT_PARAMS anahtarları)
+    start_phase / max_phase: çalıştırılacak faz aralığı (bkz. _phase_state)
+    event_callback: her iterasyonun sonunda IterationDelta ile çağrılır (canlı ilerleme)
+    """
+    start_ns = time.perf_counter_ns()
+    rng = rng or random
+    params = resolve_params(params)
+    state = _phase_state(store, state, start_phase)
+
+    metrics = _new_metrics()
+    timings = metrics['timings_ns']
+    counters = metrics['counters']
+
+    t = time.perf_counter_ns()
+    scoring = make_scoring_arrays(store, params)
+    timings['scoring'] += time.perf_counter_ns() - t
+
+    current_phase = start_phase
+
+    log, log_debug, log_info = _make_logger(log_callback, metrics, log_level)
+    demand = DemandIndex(state)
+
+    if log_info:
+        log("=" * 50)
+        log("HEURİSTİC ALGORİTMASI BAŞLADI")
+        log("=" * 50)
+
+    while True:
+        iteration_start = time.perf_counter_ns()
+        unplaced = state.unplaced_in_order()
+        timings['sort'] += time.perf_counter_ns() - iteration_start
+
+        if not unplaced:
+            if log_info:
+                log("\nTüm öğrenciler yerleşti!")
+            break
+        if not state.has_available():
+            if log_info:
+                log(f"\nBoş kontenjan kalmadı: {len(unplaced)} öğrenci yerleşemedi")
+            break
+
+        metrics['total_iterations'] += 1
+        iteration = metrics['total_iterations']
+
+        placed_this_iteration = []
+
+        if log_debug:
+            log(f"\n--- İterasyon {iteration} (Faz {current_phase}) ---")
+            log(f"Yerleşmemiş öğrenci sayısı: {len(unplaced)}")
+
+        # FAZ 1 ve FAZ 2: Skor bazlı yerleştirme
+        if current_phase <= 2:
+            placed_this_iteration = heuristic_match_round(
+                unplaced, state, current_phase, metrics, scoring, params
+            )
+
+        # FAZ 3: Zorunlu yerleştirme
+        elif current_phase == 3:
+            # GNO'ya göre sırala
+            t = time.perf_counter_ns()
+            unplaced = state.unplaced_by_gno()
+            t2 = time.perf_counter_ns()
+            timings['sort'] += t2 - t
+
+            for student in unplaced:
+                counters['first_available_calls'] += 1
+                first_available = state.first_available()
+                if first_available is not None:
+                    metrics['total_operations'] += 1
+                    state.place(student, first_available)
+                    placed_this_iteration.append(student)
+            timings['matching'] += time.perf_counter_ns() - t2
+
+        if log_debug:
+            log(f"Bu iterasyonda yerleşen: {len(placed_this_iteration)}")
+        if event_callback is not None:
+            delta = _matched_delta(state, iteration, current_phase, placed_this_iteration)
+
+        # Firma reddetme (FAZ 3'te yok)
+        rejected = ()
+        if current_phase < 3 and placed_this_iteration:
+            t = time.perf_counter_ns()
+            rejected = reject_placements(
+                state, placed_this_iteration, rng, params['rejection_probability'],
+                delta.rejected_firms if event_callback is not None else None)
+            timings['rejection'] += time.perf_counter_ns() - t
+            counters['rejection_checks'] += len(placed_this_iteration)
+            metrics['rejections'] += len(rejected)
+            if rejected and log_debug:
+                log(f"Reddedilen öğrenci sayısı: {len(rejected)}")
+
+        _record_iteration(metrics, iteration, current_phase, len(unplaced),
+                          len(placed_this_iteration), len(rejected),
+                          time.perf_counter_ns() - iteration_start)
+
+        # Faz geçişleri (olay tabanlı)
+        change_phase = _next_phase(state, demand, current_phase, placed_this_iteration)
+        if event_callback is not None:
+            _emit_delta(event_callback, delta, state, rejected,
+                        current_phase + 1 if change_phase and current_phase < max_phase
+                        else None)
+        if change_phase:
+            if current_phase == max_phase:
+                if log_info:
+                    log(f"\nFAZ {max_phase} sonunda durduruldu: "
+                        f"{len(state.unplaced)} öğrenci yerleşmedi")
+                break
+            current_phase += 1
+            metrics['phase_changes'].append((iteration, current_phase))
+            if log_info:
+                log(f"\n*** FAZ {current_phase}'e geçildi ***")
+
+    state.demand = None
+    _finish_metrics(metrics, state, start_ns)
+
+    if log_info:
+        log("\n" + "=" * 50)
+        log("HEURİSTİC SONUÇLARI")
+        log("=" * 50)
+        log(f"Toplam iterasyon: {metrics['total_iterations']}")
+        log(f"Toplam işlem: {metrics['total_operations']}")
+        log(f"Toplam süre: {metrics['total_time']:.4f} saniye")
+        log(f"Memnuniyet skoru: {metrics['satisfaction_score']}")
+        log(f"Toplam red sayısı: {metrics['rejections']}")
+
+    return metrics
+
+def heuristic_algorithm(students, firms, log_callback=None, rng=None, log_level=LOG_DEBUG):
+    """
+    Heuristic (Sezgisel) Algoritma
+    - Puanlama tabanlı yerleştirme
+    - En yüksek skorlu eşleşmeler öncelikli
+    """
+    return _run_object_algorithm(run_heuristic, students, firms, log_callback, rng, log_level)
+
+# ==================== ERTELENMİŞ KABUL (GALE-SHAPLEY) ====================
+
+def run_deferred(store, state=None, log_callback=None, rng=None, log_level=LOG_DEBUG,
+                 event_callback=None):
+    """
+    Ertelenmiş kabul (öğrenci teklif eder, Gale-Shapley) - CompactStore üzerinde
+    FAZ 1: Her turda yerleşmemiş öğrenciler sıradaki tercihlerine teklif verir.
+           Firma kontenjanı kadar öğrenciyi geçici olarak tutar; dolu firma daha
+           yüksek GNO'lu bir teklif gelirse tuttuğu en düşük GNO'lu öğrenciyi bırakır.
+           Her tercih en fazla bir kez denendiği için toplam teklif sayısı toplam
+           tercih sayısını geçmez. Sonuç, GNO önceliklerine göre kararlıdır (hiçbir
+           öğrenci, kendisinden düşük GNO'lu birini tutan bir tercihine geçemez).
+    FAZ 2: Tüm tercihlerinden reddedilen öğrenciler (GNO sırasında) boş kontenjanı
+           olan rastgele firmaya yerleşir (greedy FAZ 2 ile aynı).
+    Rastgele red olmadığı için zorunlu yerleştirme fazına (FAZ 3) gerek kalmaz;
+    kontenjan yetmezse kalan öğrenciler yerleşmemiş olarak biter.
+    rng sadece FAZ 2'de kullanılır.
+    event_callback: her turun sonunda IterationDelta ile çağrılır; rejected, firmanın
+    daha yüksek GNO'lu bir teklif için bıraktığı (önceden tutulan) öğrencilerdir
+    """
+    start_ns = time.perf_counter_ns()
+    rng = rng or random
+    if state is None:
+        state = PlacementState(store)
+    else:
+        state.reset()
+    prefs = store.prefs
+    width = store.width
+    rank = store.gno_rank()
+
+    metrics = _new_metrics()
+    timings = metrics['timings_ns']
+    counters = metrics['counters']
+
+    log, log_debug, log_info = _make_logger(log_callback, metrics, log_level)
+
+    if log_info:
+        log("=" * 50)
+        log("ERTELENMİŞ KABUL (GALE-SHAPLEY) BAŞLADI")
+        log("=" * 50)
+
+    def skip_empty(student, choice):
+        """Boş (NO_FIRM) tercihleri atla; sıradaki geçerli tercih ya da width"""
+        start = student * width
+        while choice < width and prefs[start + choice] == NO_FIRM:
+            choice += 1
+        return choice
+
+    # Firma başına tutulan öğrenciler: (-GNO sırası, öğrenci) heap'i, başta en düşük GNO'lu
+    # next_choice her zaman geçerli bir tercihi (veya width) gösterir
+    t = time.perf_counter_ns()
+    held = [[] for _ in range(store.n_firms)]
+    next_choice = array('i', (skip_empty(student, 0) for student in range(store.n_students)))
+    free = []
+    exhausted = []
+    for student in store.gno_order():
+        (free if next_choice[student] < width else exhausted).append(student)
+    timings['sort'] += time.perf_counter_ns() - t
+
+    # FAZ 1: teklif turları
+    while free:
+        iteration_start = time.perf_counter_ns()
+        metrics['total_iterations'] += 1
+        iteration = metrics['total_iterations']
+
+        if log_debug:
+            log(f"\n--- İterasyon {iteration} (Faz 1) ---")
+            log(f"Teklif verecek öğrenci sayısı: {len(free)}")
+
+        proposals = 0
+        accepted = 0
+        rejections = 0
+        rejected = []
+        if event_callback is not None:
+            delta = IterationDelta(iteration, 1, array('i'), array('i'))
+            placed_log = delta.placed.append
+            firm_log = delta.placed_firms.append
+            dropped_log = delta.rejected.append
+            dropped_firm_log = delta.rejected_firms.append
+        for student in free:
+            choice = next_choice[student]
+            firm = prefs[student * width + choice]
+            next_choice[student] = skip_empty(student, choice + 1)
+
+            proposals += 1
+            queue = held[firm]
+            if state.remaining[firm] > 0:
+                state.place(student, firm)
+                heapq.heappush(queue, (-rank[student], student))
+                accepted += 1
+                if event_callback is not None:
+                    placed_log(student)
+                    firm_log(firm)
+                continue
+            if queue and -queue[0][0] > rank[student]:
+                # Firma dolu: en düşük GNO'lu öğrenciyi bırak
+                _, loser = heapq.heapreplace(queue, (-rank[student], student))
+                state.unplace(loser)
+                state.place(student, firm)
+                if event_callback is not None:
+                    placed_log(student)
+                    firm_log(firm)
+                    dropped_log(loser)
+                    dropped_firm_log(firm)
+            else:
+                loser = student
+            # Reddedilen öğrenci sıradaki turda bir sonraki tercihine teklif verir
+            if next_choice[loser] < width:
+                rejected.append(loser)
+            else:
+                exhausted.append(loser)
+            rejections += 1
+
+        metrics['total_operations'] += proposals
+        counters['availability_checks'] += proposals
+        counters['rejection_checks'] += proposals - accepted
+        metrics['rejections'] += rejections
+        timings['matching'] += time.perf_counter_ns() - iteration_start
+
+        if log_debug:
+            log(f"Teklif: {proposals}, kabul: {proposals - rejections}, red: {rejections}")
+
+        _record_iteration(metrics, iteration, 1, len(free), proposals - rejections,
+                          rejections, time.perf_counter_ns() - iteration_start)
+        if event_callback is not None:
+            delta.unplaced = len(state.unplaced)
+            delta.next_phase = 2 if not rejected and exhausted else None
+            event_callback(delta)
+        free = rejected
+
+    # FAZ 2: tercihleri tükenen öğrenciler (GNO sırasında) tercih dışı yerleşir
+    if exhausted:
+        iteration_start = time.perf_counter_ns()
+        metrics['total_iterations'] += 1
+        iteration = metrics['total_iterations']
+        metrics['phase_changes'].append((iteration, 2))
+        if log_info:
+            log("\n*** FAZ 2'ye geçildi ***")
+
+        exhausted.sort(key=rank.__getitem__)
+        placed = 0
+        for student in exhausted:
+            counters['random_available_calls'] += 1
+            firm = state.random_available(rng)
+            if firm is None:
+                break
+            metrics['total_operations'] += 1
+            state.place(student, firm)
+            placed += 1
+        timings['matching'] += time.perf_counter_ns() - iteration_start
+        if event_callback is not None:
+            _emit_delta(event_callback,
+                        _matched_delta(state, iteration, 2, exhausted[:placed]), state, (), None)
+
+        if log_debug:
+            log(f"\n--- İterasyon {iteration} (Faz 2) ---")
+            log(f"Tercih dışı yerleşen: {placed}")
+        _record_iteration(metrics, iteration, 2, len(exhausted), placed, 0,
+                          time.perf_counter_ns() - iteration_start)
+
+    _finish_metrics(metrics, state, start_ns)
+
+    if log_info:
+        if not state.unplaced:
+            log("\nTüm öğrenciler yerleşti!")
+        else:
+            log(f"\nKontenjan yetersiz: {len(state.unplaced)} öğrenci yerleşemedi")
+        log("\n" + "=" * 50)
+        log("ERTELENMİŞ KABUL SONUÇLARI")
+        log("=" * 50)
+        log(f"Toplam iterasyon: {metrics['total_iterations']}")
+        log(f"Toplam işlem: {metrics['total_operations']}")
+        log(f"Toplam süre: {metrics['total_time']:.4f} saniye")
+        log(f"Memnuniyet skoru: {metrics['satisfaction_score']}")
+        log(f"Toplam red sayısı: {metrics['rejections']}")
+
+    return metrics
+
+def deferred_algorithm(students, firms, log_callback=None, rng=None, log_level=LOG_DEBUG):
+    """
+    Ertelenmiş Kabul (Gale-Shapley) Algoritması
+    - Öğrenciler tercih sırasıyla teklif verir
+    - Firmalar kontenjan kadar en yüksek GNO'lu öğrenciyi tutar
+    - Sonuç kararlıdır; red ve faz tekrarları yoktur
+    """
+    return _run_object_algorithm(run_deferred, students, firms, log_callback, rng, log_level)
+
+# ==================== OPTİMAL ALGORİTMA (MIN-COST FLOW) ====================
+
+OUTSIDE_COST = 5  # Tercih dışı yerleşmenin maliyeti (k. tercih = k - 1, memnuniyet = 5 - maliyet)
+
+class _FlowGraph:
+    """
+    Min-cost flow için artık (residual) ağ
+    Kenarlar çiftler halinde tutulur: e ileri kenar, e ^ 1 ters kenarı
+    """
+    __slots__ = ('to', 'cap', 'cost', 'adj')
+
+    def __init__(self, n_nodes):
+        self.to = []
+        self.cap = []
+        self.cost = []
+        self.adj = [[] for _ in range(n_nodes)]
+
+    def add_edge(self, u, v, capacity, cost):
+        e = len(self.to)
+        self.to += (v, u)
+        self.cap += (capacity, 0)
+        self.cost += (cost, -cost)
+        self.adj[u].append(e)
+        self.adj[v].append(e + 1)
+        return e
+
+def _shortest_paths(graph, source, sink, potential):
+    """
+    Potansiyellerle indirgenmiş maliyetler üzerinde Dijkstra (maliyetler >= 0)
+    Hedef kuyruktan çıkınca durur: kalan düğümlerin uzaklığı en az hedefinki kadardır
+    ve potansiyel güncellemesi uzaklıkları zaten hedefin uzaklığıyla sınırlar
+    """
+    to, cap, cost, adj = graph.to, graph.cap, graph.cost, graph.adj
+    inf = float('inf')
+    dist = [inf] * len(adj)
+    dist[source] = 0
+    heap = [(0, source)]
+    while heap:
+        d, u = heapq.heappop(heap)
+        if d > dist[u]:
+            continue
+        if u == sink:
+            break
+        base = d + potential[u]
+        for e in adj[u]:
+            if cap[e] > 0:
+                v = to[e]
+                nd = base + cost[e] - potential[v]
+                if nd < dist[v]:
+                    dist[v] = nd
+                    heapq.heappush(heap, (nd, v))
+    return dist
+
+def _augment_admissible(graph, source, sink, potential):
+    """
+    İndirgenmiş maliyeti 0 olan (en kısa yol üzerindeki) kenarlarda maksimum akış - Dinic
+    Potansiyeller tur boyunca sabit olduğundan uygun kenarlar bir kez süzülür.
+    Kaynaktan çıkan kenarların kapasitesi 1 olduğu için her artırım 1 birimdir.
+    Dönüş: (artırılan yol sayısı, taranan kenar sayısı)
+    """
+    to, cap, cost = graph.to, graph.cap, graph.cost
+    admissible = []
+    for u, edges in enumerate(graph.adj):
+        pu = potential[u]
+        admissible.append([e for e in edges if cost[e] + pu == potential[to[e]]])
+    n_nodes = len(admissible)
+    flow = 0
+    scanned = 0
+    while True:
+        # Seviye grafı (BFS); hedefin seviyesinden derine inilmez
+        level = [-1] * n_nodes
+        level[source] = 0
+        queue = [source]
+        for u in queue:
+            next_level = level[u] + 1
+            if level[sink] >= 0 and next_level > level[sink]:
+                break
+            edges = admissible[u]
+            scanned += len(edges)
+            for e in edges:
+                if cap[e] > 0:
+                    v = to[e]
+                    if level[v] < 0:
+                        level[v] = next_level
+                        queue.append(v)
+        if level[sink] < 0:
+            return flow, scanned
+
+        # Engelleyici akış (blocking flow): yinelemeli DFS, kenar işaretçileriyle
+        pointer = [0] * n_nodes
+        stack = [source]
+        path = []
+        while stack:
+            u = stack[-1]
+            if u == sink:
+                for e in path:
+                    cap[e] -= 1
+                    cap[e ^ 1] += 1
+                flow += 1
+                stack = [source]
+                path = []
+                continue
+            edges = admissible[u]
+            i = pointer[u]
+            next_level = level[u] + 1
+            end = len(edges)
+            while i < end:
+                e = edges[i]
+                if cap[e] > 0 and level[to[e]] == next_level:
+                    break
+                i += 1
+            scanned += i - pointer[u]
+            pointer[u] = i
+            if i < end:
+                stack.append(to[edges[i]])
+                path.append(edges[i])
+            else:
+                level[u] = -1  # Çıkmaz düğüm
+                stack.pop()
+                if path:
+                    path.pop()
+
+def run_optimal(store, state=None, log_callback=None, rng=None, log_level=LOG_DEBUG,
+                event_callback=None):
+    """
+    Optimal yerleştirme - min-cost flow (ardışık en kısa yollar, potansiyellerle)
+    Ağ: kaynak -> öğrenci (1) -> tercih firması (maliyet = tercih sırası - 1)
+        öğrenci -> "tercih dışı" düğümü (maliyet 5) -> her firma
+        firma -> hedef (kapasite)
+    En çok öğrenciyi yerleştiren akışlar arasında toplam maliyeti en küçük olan, yani
+    memnuniyet skoru (calculate_satisfaction_score) en yüksek olan yerleştirme bulunur.
+    Kenar sayısı O(5n + m); tercih dışı kenarlar tek bir ara düğümde toplanır.
+    Artırım yolu maliyeti 0..5 arasında olduğu için en fazla birkaç Dijkstra turu
+    yapılır; her turda en kısa yollar üzerindeki tüm artırımlar Dinic ile birlikte yapılır.
+    Red mekanizması yoktur ve sonuç deterministiktir (rng kullanılmaz).
+    FAZ 1: tercih içi artırımlar (yol maliyeti < 5), FAZ 2: tercih dışı yerleştirmeler
+    event_callback: akış sonunda yerleştirmeye çevrildiğinde tek bir IterationDelta ile
+    çağrılır (ara turlarda yerleştirme yoktur)
+    """
+    start_ns = time.perf_counter_ns()
+    if state is None:
+        state = PlacementState(store)
+    else:
+        state.reset()
+
+    metrics = _new_metrics()
+    timings = metrics['timings_ns']
+
+    log, log_debug, log_info = _make_logger(log_callback, metrics, log_level)
+
+    if log_info:
+        log("=" * 50)
+        log("OPTİMAL ALGORİTMA (MIN-COST FLOW) BAŞLADI")
+        log("=" * 50)
+
+    # Ağı kur: 0 kaynak, 1..n öğrenciler, n+1..n+m firmalar, tercih dışı düğümü, hedef
+    t = time.perf_counter_ns()
+    n = store.n_students
+    m = store.n_firms
+    width = store.width
+    prefs = store.prefs
+    source = 0
+    firm_base = n + 1
+    outside = n + m + 1
+    sink = n + m + 2
+    graph = _FlowGraph(n + m + 3)
+    add_edge = graph.add_edge
+
+    pref_edges = []  # öğrenci -> (tercih kenarları, firma) listesi
+    outside_edges = array('i')
+    for student in range(n):
+        node = student + 1
+        add_edge(source, node, 1, 0)
+        edges = []
+        seen = set()
+        start = student * width
+        for rank in range(width):
+            firm = prefs[start + rank]
+            if firm != NO_FIRM and firm not in seen:
+                seen.add(firm)
+                edges.append((add_edge(node, firm_base + firm, 1, rank), firm))
+        pref_edges.append(edges)
+        outside_edges.append(add_edge(node, outside, 1, OUTSIDE_COST))
+    outside_firm_edges = [add_edge(outside, firm_base + firm, n, 0) for firm in range(m)]
+    for firm in range(m):
+        add_edge(firm_base + firm, sink, store.capacity[firm], 0)
+    metrics['counters']['match_scores'] = len(graph.to) // 2
+    timings['scoring'] += time.perf_counter_ns() - t
+
+    # Ardışık en kısa yollar (primal-dual)
+    potential = [0] * (n + m + 3)
+    current_phase = 1
+    placed_total = 0
+    while True:
+        iteration_start = time.perf_counter_ns()
+        dist = _shortest_paths(graph, source, sink, potential)
+        if dist[sink] == float('inf'):
+            break
+        sink_dist = dist[sink]
+        for v, d in enumerate(dist):
+            potential[v] += d if d < sink_dist else sink_dist
+        path_cost = potential[sink] - potential[source]
+
+        metrics['total_iterations'] += 1
+        iteration = metrics['total_iterations']
+        phase = 1 if path_cost < OUTSIDE_COST else 2
+        if phase != current_phase:
+            current_phase = phase
+            metrics['phase_changes'].append((iteration, current_phase))
+            if log_info:
+                log(f"\n*** FAZ {current_phase}'e geçildi ***")
+
+        augmented, scanned = _augment_admissible(graph, source, sink, potential)
+        metrics['total_operations'] += scanned
+        timings['matching'] += time.perf_counter_ns() - iteration_start
+        _record_iteration(metrics, iteration, current_phase, n - placed_total, augmented, 0,
+                          time.perf_counter_ns() - iteration_start)
+        if log_debug:
+            log(f"\n--- İterasyon {iteration} (Faz {current_phase}) ---")
+            log(f"Yol maliyeti: {path_cost}, artırılan yol: {augmented}")
+        placed_total += augmented
+
+    # Akışı yerleştirmeye çevir
+    t = time.perf_counter_ns()
+    cap = graph.cap
+    outside_students = []
+    for student in range(n):
+        for e, firm in pref_edges[student]:
+            if cap[e] == 0:
+                state.place(student, firm)
+                break
+        else:
+            if cap[outside_edges[student]] == 0:
+                outside_students.append(student)
+    # Tercih dışı öğrenciler kalan kontenjanlara dağıtılır; hepsi 0 puan olduğundan
+    # dağılım skoru etkilemez (GNO sırası, firma sırası)
+    outside_students.sort(key=store.gno_rank().__getitem__)
+    slots = []
+    for firm, e in enumerate(outside_firm_edges):
+        slots.extend([firm] * cap[e ^ 1])
+    for student, firm in zip(outside_students, slots):
+        state.place(student, firm)
+    timings['sort'] += time.perf_counter_ns() - t
+    if event_callback is not None:
+        # Akış ancak sonunda yerleştirmeye dönüşür: tek kayıt
+        placed = [student for student, firm in enumerate(state.assigned) if firm != NO_FIRM]
+        _emit_delta(event_callback,
+                    _matched_delta(state, metrics['total_iterations'], current_phase, placed),
+                    state, (), None)
+
+    _finish_metrics(metrics, state, start_ns)
+
+    if log_info:
+        if not state.unplaced:
+            log("\nTüm öğrenciler yerleşti!")
+        else:
+            log(f"\nKontenjan yetersiz: {len(state.unplaced)} öğrenci yerleşemedi")
+        log("\n" + "=" * 50)
+        log("OPTİMAL SONUÇLAR")
+        log("=" * 50)
+        log(f"Toplam iterasyon: {metrics['total_iterations']}")
+        log(f"Toplam işlem: {metrics['total_operations']}")
+        log(f"Toplam süre: {metrics['total_time']:.4f} saniye")
+        log(f"Memnuniyet skoru: {metrics['satisfaction_score']}")
+        log(f"Toplam red sayısı: {metrics['rejections']}")
+
+    return metrics
+
+def optimal_algorithm(students, firms, log_callback=None, rng=None, log_level=LOG_DEBUG):
+    """
+    Optimal Algoritma (min-cost flow)
+    - Kapasiteler altında memnuniyet skorunu en yüksek yapan yerleştirme
+    - Red ve faz tekrarları yoktur
+    """
+    return _run_object_algorithm(run_optimal, students, firms, log_callback, rng, log_level)
+
+# ==================== SONUÇ GÖSTERME ====================
+
+def iter_placements(students):
+    """
+    Yerleşen öğrenciler için (öğrenci_id, firma_id, tercih_sırası) üret
+    Tercih dışı yerleşmelerde tercih_sırası None olur
+    """
+    for s in students:
+        if s.is_placed:
+            if s.assigned_firm in s.preferences:
+                yield s.id, s.assigned_firm, s.preferences.index(s.assigned_firm) + 1
+            else:
+                yield s.id, s.assigned_firm, None
+
+def get_placement_details(students):
+    """Yerleştirme detaylarını döndür (Student listesi veya PlacementState)"""
+    if isinstance(students, PlacementState):
+        placements = students.iter_placements()
+    else:
+        placements = iter_placements(students)
+    details = []
+    for student_id, firm_id, pref_num in placements:
+        if pref_num is not None:
+            pref_info = f"({pref_num}. tercih)"
+        else:
+            pref_info = "(tercih dışı)"
+        details.append(f"{student_id} -> {firm_id} {pref_info}")
+    return details
+
+# ==================== ALGORİTMA KAYDI ====================
+
+# Depo tabanlı çalıştırıcılar:
+# run(store, state=None, log_callback=None, rng=None, log_level=LOG_DEBUG) -> metrics
+ALGORITHMS = {
+    'greedy': run_greedy,
+    'heuristic': run_heuristic,
+    'deferred': run_deferred,
+    'optimal': run_optimal,
+}
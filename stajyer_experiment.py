@@ -0,0 +1,209 @@
+"""
+Stajyer Yerleştirme Simülatörü - Monte Carlo Deneyleri
+Firma reddetme rastgeleliği üzerinde tohumlanmış tekrarlarla algoritma karşılaştırması
+
+Her tekrar kendi random.Random örneğini kullanır; global rastgelelik durumu
+paylaşılmadığı için tekrarlar süreç havuzunda bağımsız ve tekrarlanabilir şekilde
+çalışır. Aynı tohum listesi tüm algoritmalarda kullanılır (ortak rastgele sayılar).
+
+Örnek:
+    python3 stajyer_experiment.py -a greedy heuristic -n 200 -j 4 -o deney.json
+"""
+
+import argparse
+import bisect
+import json
+import math
+import os
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from stajyer_core import ALGORITHMS, PlacementState, load_store
+
+# Özetlenen metrikler
+SUMMARY_METRICS = ('satisfaction_score', 'total_iterations', 'total_operations', 'rejections')
+
+# %95 güven aralığı için iki yönlü t kritik değerleri (serbestlik derecesi -> t)
+_T_CRITICAL_95 = {
+    1: 12.706, 2: 4.303, 3: 3.182, 4: 2.776, 5: 2.571, 6: 2.447, 7: 2.365,
+    8: 2.306, 9: 2.262, 10: 2.228, 11: 2.201, 12: 2.179, 13: 2.160, 14: 2.145,
+    15: 2.131, 16: 2.120, 17: 2.110, 18: 2.101, 19: 2.093, 20: 2.086, 21: 2.080,
+    22: 2.074, 23: 2.069, 24: 2.064, 25: 2.060, 26: 2.056, 27: 2.052, 28: 2.048,
+    29: 2.045, 30: 2.042, 40: 2.021, 50: 2.009, 60: 2.000, 80: 1.990, 100: 1.984,
+    120: 1.980,
+}
+_T_TABLE_DFS = sorted(_T_CRITICAL_95)
+_Z_95 = 1.960  # df -> sonsuz (normal dağılım)
+
+
+# ==================== İSTATİSTİK ====================
+
+def t_critical(df):
+    """
+    %95 güven aralığı için t kritik değeri
+    Tabloda olmayan df için iki komşu değer arasında 1/df'ye göre doğrusal ara değer
+    alınır (120'den sonra komşu df -> sonsuz, 1.960); hata 0.001'in altındadır
+    """
+    if df in _T_CRITICAL_95:
+        return _T_CRITICAL_95[df]
+    upper = bisect.bisect(_T_TABLE_DFS, df)
+    low_df = _T_TABLE_DFS[upper - 1]
+    low_t = _T_CRITICAL_95[low_df]
+    if upper == len(_T_TABLE_DFS):
+        high_inverse, high_t = 0.0, _Z_95
+    else:
+        high_df = _T_TABLE_DFS[upper]
+        high_inverse, high_t = 1 / high_df, _T_CRITICAL_95[high_df]
+    weight = (1 / low_df - 1 / df) / (1 / low_df - high_inverse)
+    return low_t + weight * (high_t - low_t)
+
+
+def summarize(values):
+    """Ortalama, standart sapma, %95 güven aralığı, min ve max"""
+    n = len(values)
+    if n == 0:
+        return {'n': 0}
+    mean = math.fsum(values) / n
+    if n > 1:
+        std = math.sqrt(math.fsum((v - mean) ** 2 for v in values) / (n - 1))
+        half_width = t_critical(n - 1) * std / math.sqrt(n)
+    else:
+        std = 0.0
+        half_width = 0.0
+    return {
+        'n': n,
+        'mean': mean,
+        'std': std,
+        'ci95': [mean - half_width, mean + half_width],
+        'min': min(values),
+        'max': max(values),
+    }
+
+
+def aggregate(results):
+    """Tekrar sonuçlarını algoritma bazında özetle"""
+    by_algorithm = {}
+    for result in results:
+        by_algorithm.setdefault(result['algorithm'], []).append(result)
+
+    summary = {}
+    for algorithm, runs in by_algorithm.items():
+        summary[algorithm] = {
+            metric: summarize([run[metric] for run in runs])
+            for metric in SUMMARY_METRICS
+        }
+    return summary
+
+
+# ==================== İŞÇİ SÜREÇLER ====================
+
+# Her işçi süreçte bir kez kurulur (depo her görevde tekrar gönderilmez)
+_worker_store = None
+_worker_state = None
+
+
+def _init_worker(store):
+    global _worker_store, _worker_state
+    _worker_store = store
+    _worker_state = PlacementState(store)
+
+
+def run_replication(task):
+    """Tek bir (algoritma, tohum) tekrarını çalıştır ve özet metrikleri döndür"""
+    algorithm, seed = task
+    metrics = ALGORITHMS[algorithm](_worker_store, _worker_state, None, random.Random(seed))
+    result = {'algorithm': algorithm, 'seed': seed, 'total_time': metrics['total_time']}
+    for metric in SUMMARY_METRICS:
+        result[metric] = metrics[metric]
+    return result
+
+
+# ==================== DENEY ====================
+
+def run_experiment(store, algorithms, replications, base_seed=0, workers=None):
+    """
+    Her algoritma için replications adet tekrar çalıştır
+    Tohumlar base_seed, base_seed + 1, ... şeklindedir ve tüm algoritmalarda ortaktır.
+    workers: süreç sayısı (None = CPU sayısı, 1 = havuz kullanmadan aynı süreçte)
+    Dönüş: (tekrar sonuçları, algoritma bazında özet)
+    """
+    tasks = [(algorithm, base_seed + i)
+             for algorithm in algorithms for i in range(replications)]
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    if workers <= 1:
+        _init_worker(store)
+        results = [run_replication(task) for task in tasks]
+    else:
+        # Küçük görevleri gruplayarak süreçler arası iletişim maliyetini azalt
+        chunksize = max(1, len(tasks) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(store,)) as executor:
+            results = list(executor.map(run_replication, tasks, chunksize=chunksize))
+
+    return results, aggregate(results)
+
+
+# ==================== KOMUT SATIRI ====================
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Firma reddetme rastgeleliği üzerinde Monte Carlo deneyi"
+    )
+    parser.add_argument('-a', '--algorithms', nargs='+', default=sorted(ALGORITHMS),
+                        choices=sorted(ALGORITHMS), help="Karşılaştırılacak algoritmalar")
+    parser.add_argument('--students', default="students.csv", help="Öğrenci CSV dosyası")
+    parser.add_argument('--firms', default="firms.csv", help="Firma CSV dosyası")
+    parser.add_argument('--no-cache', action='store_true',
+                        help="İkili veri önbelleğini kullanma, CSV'leri her seferinde oku")
+    parser.add_argument('-n', '--replications', type=int, default=100,
+                        help="Algoritma başına tekrar sayısı")
+    parser.add_argument('-j', '--workers', type=int, default=None,
+                        help="Süreç sayısı (varsayılan: CPU sayısı)")
+    parser.add_argument('--seed', type=int, default=0, help="İlk tohum")
+    parser.add_argument('-o', '--output', default=None,
+                        help="Sonuçların yazılacağı JSON dosyası")
+    args = parser.parse_args(argv)
+    if args.replications < 1:
+        parser.error("--replications en az 1 olmalı")
+    return args
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    store = load_store(args.students, args.firms, cache=not args.no_cache)
+
+    start = time.perf_counter()
+    results, summary = run_experiment(store, args.algorithms, args.replications,
+                                      args.seed, args.workers)
+    elapsed = time.perf_counter() - start
+
+    for algorithm in args.algorithms:
+        stats = summary[algorithm]
+        score = stats['satisfaction_score']
+        low, high = score['ci95']
+        print(f"{algorithm:<10} n={score['n']} "
+              f"memnuniyet={score['mean']:.2f} (%95 GA {low:.2f}-{high:.2f}) "
+              f"iterasyon={stats['total_iterations']['mean']:.2f} "
+              f"red={stats['rejections']['mean']:.2f}")
+    print(f"Toplam süre: {elapsed:.2f}sn ({len(results)} tekrar)")
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump({
+                'replications': args.replications,
+                'base_seed': args.seed,
+                'workers': args.workers,
+                'elapsed': elapsed,
+                'summary': summary,
+                'runs': results,
+            }, f, ensure_ascii=False, indent=2)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,406 @@
+"""
+Stajyer Yerleştirme Simülatörü - Çalıştırma Geçmişi
+Her çalıştırmanın metrikleri ve öğrenci başına ataması SQLite veritabanında saklanır.
+Herhangi iki çalıştırma karşılaştırılabilir, binlerce çalıştırma üzerinde özet alınabilir.
+
+Tablolar:
+- datasets: veri seti içerik hash'i (stajyer_store.dataset_hash), öğrenci/firma sayısı
+- students / firms: veri seti başına indeks -> id (veri seti ilk kaydedildiğinde bir kez)
+- runs: çalıştırma başına metrikler; (dataset, algorithm, seed) ve seed indeksli
+- assignments: (run, student) -> firma indeksi ve tercih sırası; student indeksli.
+  Sıralar PlacementReport ile aynıdır: 0 = 1. tercih, -1 tercih dışı, -2 yerleşmemiş.
+
+Bir çalıştırmanın tüm satırları tek bir işlemde (transaction) executemany ile eklenir.
+
+Örnek:
+    python3 stajyer_history.py list -a heuristic
+    python3 stajyer_history.py diff 12 15
+    python3 stajyer_history.py aggregate --by algorithm params
+"""
+
+import argparse
+import json
+import math
+import os
+import sqlite3
+import sys
+import threading
+import time
+
+from stajyer_store import dataset_hash
+
+DEFAULT_HISTORY_PATH = "stajyer_history.db"
+SCHEMA_VERSION = 1
+GROUP_COLUMNS = ('algorithm', 'seed', 'params')  # aggregate(by=...) için izin verilen sütunlar
+RUN_COLUMNS = ('id', 'dataset', 'algorithm', 'seed', 'params', 'created', 'satisfaction',
+               'iterations', 'operations', 'rejections', 'total_time', 'placed', 'outside',
+               'unplaced')
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS datasets (
+    id INTEGER PRIMARY KEY,
+    hash TEXT NOT NULL UNIQUE,
+    students INTEGER NOT NULL,
+    firms INTEGER NOT NULL,
+    created REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS students (
+    dataset INTEGER NOT NULL,
+    student INTEGER NOT NULL,
+    student_id TEXT NOT NULL,
+    PRIMARY KEY (dataset, student)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS students_id ON students (student_id);
+CREATE TABLE IF NOT EXISTS firms (
+    dataset INTEGER NOT NULL,
+    firm INTEGER NOT NULL,
+    firm_id TEXT NOT NULL,
+    PRIMARY KEY (dataset, firm)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    dataset INTEGER NOT NULL REFERENCES datasets (id),
+    algorithm TEXT NOT NULL,
+    seed INTEGER,
+    params TEXT,
+    created REAL NOT NULL,
+    satisfaction INTEGER NOT NULL,
+    iterations INTEGER,
+    operations INTEGER,
+    rejections INTEGER,
+    total_time REAL,
+    placed INTEGER,
+    outside INTEGER,
+    unplaced INTEGER
+);
+CREATE INDEX IF NOT EXISTS runs_dataset_algorithm_seed ON runs (dataset, algorithm, seed);
+CREATE INDEX IF NOT EXISTS runs_seed ON runs (seed);
+CREATE TABLE IF NOT EXISTS assignments (
+    run INTEGER NOT NULL,
+    student INTEGER NOT NULL,
+    firm INTEGER NOT NULL,
+    rank INTEGER NOT NULL,
+    PRIMARY KEY (run, student)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS assignments_student ON assignments (student, run);
+"""
+
+# Tercih sırasının memnuniyet puanı (calculate_satisfaction_score: 1. tercih 5 ... 5. tercih 1)
+POINTS_SQL = "CASE WHEN {rank} >= 0 THEN 5 - {rank} ELSE 0 END"
+
+
+def default_history_path(students_path):
+    """students.csv'nin klasöründeki stajyer_history.db (GUI geçmişi veriyle birlikte durur)"""
+    return os.path.join(os.path.dirname(students_path), DEFAULT_HISTORY_PATH)
+
+
+class RunStore:
+    """
+    SQLite tabanlı çalıştırma geçmişi
+    check_same_thread=False ile bağlantı thread'ler arasında paylaşılabilir (GUI: kayıt
+    algoritma thread'inde, sorgular ana thread'de); işlemler bir kilitle (RLock) sıralanır.
+    """
+
+    def __init__(self, path=DEFAULT_HISTORY_PATH, check_same_thread=True):
+        self.path = path
+        self.conn = sqlite3.connect(path, check_same_thread=check_same_thread)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.lock = threading.RLock()
+        self._datasets = {}  # id(store) -> (store, veri seti no); depo canlı tutulur
+        with self.conn:
+            self.conn.executescript(SCHEMA)
+            row = self.conn.execute("SELECT value FROM meta WHERE key = 'schema'").fetchone()
+            if row is None:
+                self.conn.execute("INSERT INTO meta VALUES ('schema', ?)", (str(SCHEMA_VERSION),))
+            elif int(row[0]) != SCHEMA_VERSION:
+                raise ValueError(f"{path}: desteklenmeyen şema sürümü {row[0]}")
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # ---------- Veri setleri ----------
+
+    def dataset_id(self, store, create=True):
+        """Deponun veri seti numarası; ilk kayıtta öğrenci ve firma id'leri de yazılır"""
+        cached = self._datasets.get(id(store))
+        if cached is not None and cached[0] is store:
+            return cached[1]
+        with self.lock:
+            return self._register_dataset(store, create)
+
+    def _register_dataset(self, store, create):
+        digest = dataset_hash(store)
+        row = self.conn.execute("SELECT id FROM datasets WHERE hash = ?", (digest,)).fetchone()
+        if row is None:
+            if not create:
+                return None
+            with self.conn:
+                cursor = self.conn.execute(
+                    "INSERT INTO datasets (hash, students, firms, created) VALUES (?, ?, ?, ?)",
+                    (digest, store.n_students, store.n_firms, time.time()))
+                dataset = cursor.lastrowid
+                self.conn.executemany("INSERT INTO students VALUES (?, ?, ?)",
+                                      ((dataset, i, sid) for i, sid in enumerate(store.student_ids)))
+                self.conn.executemany("INSERT INTO firms VALUES (?, ?, ?)",
+                                      ((dataset, i, fid) for i, fid in enumerate(store.firm_ids)))
+        else:
+            dataset = row[0]
+        self._datasets[id(store)] = (store, dataset)
+        return dataset
+
+    # ---------- Kayıt ----------
+
+    def record(self, store, state, metrics, algorithm, seed=None, params=None, report=None):
+        """
+        Çalıştırmayı ve öğrenci başına atamaları tek işlemde kaydet; çalıştırma no döner
+        report: aynı durumun PlacementReport'u (verilmezse hesaplanır)
+        """
+        if report is None:
+            from stajyer_report import PlacementReport  # NumPy sadece gerekirse yüklenir
+
+            report = PlacementReport(state)
+        with self.lock:
+            dataset = self.dataset_id(store)
+            with self.conn:
+                cursor = self.conn.execute(
+                    "INSERT INTO runs (dataset, algorithm, seed, params, created, satisfaction, "
+                    "iterations, operations, rejections, total_time, placed, outside, unplaced) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (dataset, algorithm, seed,
+                     json.dumps(params, sort_keys=True) if params else None, time.time(),
+                     metrics['satisfaction_score'], metrics.get('total_iterations'),
+                     metrics.get('total_operations'), metrics.get('rejections'),
+                     metrics.get('total_time'), report.placed, report.outside, report.unplaced))
+                run = cursor.lastrowid
+                self.conn.executemany(
+                    "INSERT INTO assignments VALUES (?, ?, ?, ?)",
+                    zip([run] * len(report.assigned), range(len(report.assigned)),
+                        report.assigned, report.ranks))
+        return run
+
+    def delete(self, run):
+        with self.lock, self.conn:
+            self.conn.execute("DELETE FROM assignments WHERE run = ?", (run,))
+            self.conn.execute("DELETE FROM runs WHERE id = ?", (run,))
+
+    # ---------- Sorgular ----------
+
+    def _run_rows(self, where, args, limit=None):
+        sql = f"SELECT {', '.join(RUN_COLUMNS)} FROM runs"
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        sql += " ORDER BY id DESC"
+        if limit:
+            sql += f" LIMIT {int(limit)}"
+        with self.lock:
+            rows = self.conn.execute(sql, args).fetchall()
+        return [dict(zip(RUN_COLUMNS, row)) for row in rows]
+
+    def runs(self, store=None, algorithm=None, seed=None, limit=None):
+        """Çalıştırmalar (en yeni önce); store verilirse sadece o veri setininkiler"""
+        where, args = [], []
+        if store is not None:
+            dataset = self.dataset_id(store, create=False)
+            if dataset is None:
+                return []
+            where.append("dataset = ?")
+            args.append(dataset)
+        if algorithm is not None:
+            where.append("algorithm = ?")
+            args.append(algorithm)
+        if seed is not None:
+            where.append("seed = ?")
+            args.append(seed)
+        return self._run_rows(where, args, limit)
+
+    def run(self, run):
+        rows = self._run_rows(["id = ?"], [run])
+        return rows[0] if rows else None
+
+    def diff(self, run_a, run_b, limit=None):
+        """
+        İki çalıştırmanın öğrenci bazında farkı (aynı veri seti)
+        Dönüş: {'changed', 'improved', 'worsened', 'satisfaction_delta',
+                'rows': [(öğrenci_id, firma_a, sıra_a, firma_b, sıra_b), ...]}
+        Sıralar PlacementReport biçimindedir; yerleşmemişte firma None
+        """
+        a, b = self.run(run_a), self.run(run_b)
+        for number, row in ((run_a, a), (run_b, b)):
+            if row is None:
+                raise ValueError(f"Çalıştırma bulunamadı: {number}")
+        if a['dataset'] != b['dataset']:
+            raise ValueError(f"{run_a} ve {run_b} farklı veri setlerinde")
+        points_a = POINTS_SQL.format(rank="a.rank")
+        points_b = POINTS_SQL.format(rank="b.rank")
+        with self.lock:
+            changed, improved, worsened, delta = self.conn.execute(
+                f"SELECT COUNT(*), COALESCE(SUM({points_b} > {points_a}), 0), "
+                f"COALESCE(SUM({points_b} < {points_a}), 0), "
+                f"COALESCE(SUM({points_b} - {points_a}), 0) "
+                "FROM assignments a JOIN assignments b ON b.run = ? AND b.student = a.student "
+                "WHERE a.run = ? AND a.firm != b.firm", (run_b, run_a)).fetchone()
+            sql = ("SELECT s.student_id, fa.firm_id, a.rank, fb.firm_id, b.rank "
+                   "FROM assignments a "
+                   "JOIN assignments b ON b.run = ? AND b.student = a.student "
+                   "JOIN students s ON s.dataset = ? AND s.student = a.student "
+                   "LEFT JOIN firms fa ON fa.dataset = ? AND fa.firm = a.firm "
+                   "LEFT JOIN firms fb ON fb.dataset = ? AND fb.firm = b.firm "
+                   "WHERE a.run = ? AND a.firm != b.firm ORDER BY a.student")
+            if limit:
+                sql += f" LIMIT {int(limit)}"
+            dataset = a['dataset']
+            rows = self.conn.execute(sql, (run_b, dataset, dataset, dataset, run_a)).fetchall()
+        return {'changed': changed, 'improved': improved, 'worsened': worsened,
+                'satisfaction_delta': delta, 'rows': rows}
+
+    def aggregate(self, store=None, by=('algorithm',)):
+        """
+        Gruplara göre özet (sadece runs tablosu): çalıştırma sayısı, ortalama / std / min /
+        maks memnuniyet, ortalama süre ve iterasyon
+        by: GROUP_COLUMNS'tan sütunlar
+        """
+        for column in by:
+            if column not in GROUP_COLUMNS:
+                raise ValueError(f"Gruplanamaz: {column!r} (beklenen: {', '.join(GROUP_COLUMNS)})")
+        columns = ", ".join(by)
+        where, args = "", []
+        if store is not None:
+            dataset = self.dataset_id(store, create=False)
+            if dataset is None:
+                return []
+            where, args = "WHERE dataset = ?", [dataset]
+        with self.lock:
+            rows = self.conn.execute(
+                f"SELECT {columns}, COUNT(*), AVG(satisfaction), "
+                "AVG(satisfaction * satisfaction), MIN(satisfaction), MAX(satisfaction), "
+                f"AVG(total_time), AVG(iterations) FROM runs {where} GROUP BY {columns} "
+                "ORDER BY AVG(satisfaction) DESC", args).fetchall()
+        result = []
+        for row in rows:
+            keys, (count, mean, mean_sq, low, high, time_mean, iterations) = \
+                row[:len(by)], row[len(by):]
+            result.append({
+                **dict(zip(by, keys)),
+                'runs': count,
+                'satisfaction_mean': mean,
+                'satisfaction_std': (math.sqrt(max(0.0, mean_sq - mean * mean) * count
+                                               / (count - 1)) if count > 1 else 0.0),
+                'satisfaction_min': low,
+                'satisfaction_max': high,
+                'time_mean': time_mean,
+                'iterations_mean': iterations,
+            })
+        return result
+
+    def student_history(self, student_id, limit=None):
+        """Öğrencinin çalıştırmalardaki yerleşmeleri: (çalıştırma, algoritma, firma_id, sıra)"""
+        sql = ("SELECT r.id, r.algorithm, f.firm_id, a.rank FROM students s "
+               "JOIN assignments a ON a.student = s.student "
+               "JOIN runs r ON r.id = a.run AND r.dataset = s.dataset "
+               "LEFT JOIN firms f ON f.dataset = s.dataset AND f.firm = a.firm "
+               "WHERE s.student_id = ? ORDER BY r.id DESC")
+        if limit:
+            sql += f" LIMIT {int(limit)}"
+        with self.lock:
+            return self.conn.execute(sql, (student_id,)).fetchall()
+
+
+# ==================== BİÇİMLENDİRME ====================
+
+def rank_label(rank):
+    if rank >= 0:
+        return f"{rank + 1}. tercih"
+    return "tercih dışı" if rank == -1 else "yerleşmemiş"
+
+
+def run_label(run):
+    """Çalıştırmanın tek satırlık özeti (GUI seçim listesi ve CLI)"""
+    seed = run['seed'] if run['seed'] is not None else '-'
+    created = time.strftime('%Y-%m-%d %H:%M', time.localtime(run['created']))
+    return (f"#{run['id']} {run['algorithm']} seed={seed} memnuniyet={run['satisfaction']} "
+            f"({created})")
+
+
+def format_diff(run_a, run_b, diff, limit=None):
+    lines = [f"#{run_a} -> #{run_b}: {diff['changed']} öğrencinin yeri değişti "
+             f"({diff['improved']} iyileşti, {diff['worsened']} kötüleşti), "
+             f"memnuniyet farkı {diff['satisfaction_delta']:+d}"]
+    rows = diff['rows'] if limit is None else diff['rows'][:limit]
+    for student_id, firm_a, rank_a, firm_b, rank_b in rows:
+        lines.append(f"  {student_id}: {firm_a or '-'} ({rank_label(rank_a)}) -> "
+                     f"{firm_b or '-'} ({rank_label(rank_b)})")
+    if len(rows) < diff['changed']:
+        lines.append(f"  ... {diff['changed'] - len(rows)} satır daha")
+    return lines
+
+
+def format_aggregate(rows, by):
+    lines = [f"{' / '.join(by):<30} {'n':>6} {'ortalama':>10} {'std':>8} {'min':>7} {'maks':>7} "
+             f"{'süre (ms)':>10}"]
+    for row in rows:
+        key = " / ".join(str(row[column]) if row[column] is not None else '-' for column in by)
+        lines.append(f"{key[:30]:<30} {row['runs']:>6} {row['satisfaction_mean']:>10.2f} "
+                     f"{row['satisfaction_std']:>8.2f} {row['satisfaction_min']:>7} "
+                     f"{row['satisfaction_max']:>7} {(row['time_mean'] or 0) * 1000:>10.2f}")
+    return lines
+
+
+# ==================== KOMUT SATIRI ====================
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Çalıştırma geçmişini sorgula")
+    parser.add_argument('--db', default=DEFAULT_HISTORY_PATH, help="Geçmiş veritabanı")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    listing = commands.add_parser('list', help="Çalıştırmaları listele (en yeni önce)")
+    listing.add_argument('-a', '--algorithm', default=None)
+    listing.add_argument('--seed', type=int, default=None)
+    listing.add_argument('-n', '--limit', type=int, default=20)
+
+    diff = commands.add_parser('diff', help="İki çalıştırmanın öğrenci bazında farkı")
+    diff.add_argument('run_a', type=int)
+    diff.add_argument('run_b', type=int)
+    diff.add_argument('-n', '--limit', type=int, default=50, help="Gösterilecek satır sayısı")
+
+    aggregate = commands.add_parser('aggregate', help="Gruplara göre memnuniyet özeti")
+    aggregate.add_argument('--by', nargs='+', default=['algorithm'], choices=GROUP_COLUMNS)
+
+    student = commands.add_parser('student', help="Bir öğrencinin çalıştırmalardaki yerleri")
+    student.add_argument('student_id')
+    student.add_argument('-n', '--limit', type=int, default=20)
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    with RunStore(args.db) as history:
+        try:
+            if args.command == 'list':
+                for run in history.runs(algorithm=args.algorithm, seed=args.seed,
+                                        limit=args.limit):
+                    print(run_label(run))
+            elif args.command == 'diff':
+                diff = history.diff(args.run_a, args.run_b, limit=args.limit)
+                print("\n".join(format_diff(args.run_a, args.run_b, diff)))
+            elif args.command == 'aggregate':
+                print("\n".join(format_aggregate(history.aggregate(by=args.by), args.by)))
+            else:
+                for run, algorithm, firm_id, rank in history.student_history(
+                        args.student_id, args.limit):
+                    print(f"#{run} {algorithm:<10} {firm_id or '-'} ({rank_label(rank)})")
+        except ValueError as e:
+            print(f"Hata: {e}", file=sys.stderr)
+            return 2
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,369 @@
+"""
+Stajyer Yerleştirme Simülatörü - Yerel Arama İyileştirmesi
+Greedy/heuristic yerleştirmesinden sonra memnuniyet skorunu artıran hamleler
+
+FAZ 2/3'te tercih dışına (rastgele veya ilk boş firmaya) yerleşen ve redden sonra
+boşalan kontenjanlara hiç geçemeyen öğrenciler kolay kazanç bırakır. Yerel arama sadece
+yerleşmiş öğrencileri taşır; yerleşen sayısı ve kapasiteler değişmez. Hamleler:
+    relocate: öğrenci boş kontenjanlı daha iyi bir tercihine geçer
+    swap: iki öğrenci firmalarını değiş tokuş eder
+    eject: öğrenci dolu ve daha iyi bir tercihine geçer, oradaki en düşük puanlı öğrenci
+        boş kontenjanlı bir firmaya çıkarılır (kendi tercihine, yoksa tercih dışına)
+    chain: boşalan kontenjana onu mevcut yerinden en çok isteyen öğrenci geçer, onun
+        boşalttığı yer için tekrarlanır (boşluk zinciri; relocate ve eject'in ardından da
+        çalışır)
+Puanlar calculate_satisfaction_score ile aynıdır (k. tercih = 6 - k, tercih dışı = 0).
+Her aday hamlenin kazancı önceden kurulan (öğrenci, firma) -> puan sözlüğü ve
+firma başına puan kovalarıyla O(1) hesaplanır; sadece kazancı pozitif hamleler uygulanır.
+
+Örnek:
+    metrics = run_heuristic(store, state)
+    result = improve_placement(state, time_budget=2.0)
+    print(result['gain'], result['gain_per_second'])
+"""
+
+import time
+
+from stajyer_core import LOG_DEBUG, LOG_INFO
+from stajyer_store import NO_FIRM
+
+MOVE_KINDS = ('chain', 'relocate', 'swap', 'eject')
+DEFAULT_TIME_BUDGET = 1.0  # Saniye
+CHECK_EVERY = 256          # Süre kontrolü arasındaki öğrenci sayısı
+
+
+class LocalSearch:
+    """
+    PlacementState üzerinde yerel arama
+    - score: öğrenci * m + firma -> puan (sadece tercihler; yoksa 0)
+    - current[s]: öğrencinin şu anki puanı
+    - buckets[f]: puan -> f'deki öğrenciler (en düşük puanlı üye O(kova sayısı))
+    - want[hedef * m + kaynak]: kaynak firmada olup hedefi daha çok isteyenler (swap ortağı)
+    - wanters[f]: f'yi mevcut yerinden daha çok isteyen yerleşmiş öğrenciler
+    Yapılar her taşımada öğrencinin tercihleri üzerinden güncellenir - O(tercih sayısı).
+    Durum yerel arama sürerken başka bir yerden değiştirilmemelidir.
+    """
+
+    def __init__(self, state):
+        self.state = state
+        store = state.store
+        m = store.n_firms
+        width = store.width
+        prefs = store.prefs
+        self.m = m
+        self.width = width
+
+        score = {}
+        for student in range(store.n_students):
+            base = student * m
+            start = student * width
+            # Sondan başa: aynı firma iki kez geçerse ilk sırası geçerlidir (pref_rank gibi)
+            for rank in range(width - 1, -1, -1):
+                firm = prefs[start + rank]
+                if firm != NO_FIRM:
+                    score[base + firm] = 5 - rank
+        self.score = score
+
+        self.current = [0] * store.n_students
+        self.buckets = [{} for _ in range(m)]
+        self.want = {}
+        self.wanters = [set() for _ in range(m)]
+        self.touched = set()  # Son geçişte üyeliği veya kontenjanı değişen firmalar
+        self.dirty = set()    # Son geçişte taşınan öğrenciler
+        for student, firm in enumerate(state.assigned):
+            if firm != NO_FIRM:
+                self.current[student] = score.get(student * m + firm, 0)
+                self._register(student, firm)
+
+    # ---------- İndeksler ----------
+
+    def _register(self, student, firm):
+        current = self.current[student]
+        bucket = self.buckets[firm].get(current)
+        if bucket is None:
+            self.buckets[firm][current] = {student}
+        else:
+            bucket.add(student)
+        m = self.m
+        score = self.score
+        base = student * m
+        start = student * self.width
+        for target in self.state.store.prefs[start:start + self.width]:
+            if target != NO_FIRM and target != firm and score[base + target] > current:
+                key = target * m + firm
+                partners = self.want.get(key)
+                if partners is None:
+                    self.want[key] = {student}
+                else:
+                    partners.add(student)
+                self.wanters[target].add(student)
+
+    def _unregister(self, student, firm):
+        current = self.current[student]
+        buckets = self.buckets[firm]
+        bucket = buckets[current]
+        bucket.discard(student)
+        if not bucket:
+            del buckets[current]
+        m = self.m
+        score = self.score
+        base = student * m
+        start = student * self.width
+        for target in self.state.store.prefs[start:start + self.width]:
+            if target != NO_FIRM and target != firm and score[base + target] > current:
+                key = target * m + firm
+                partners = self.want.get(key)
+                if partners is not None:
+                    partners.discard(student)
+                    if not partners:
+                        del self.want[key]
+                self.wanters[target].discard(student)
+
+    def _move(self, student, firm):
+        """Öğrenciyi firmaya taşı, kazancı döndür"""
+        state = self.state
+        old = state.assigned[student]
+        self._unregister(student, old)
+        state.unplace(student)
+        state.place(student, firm)
+        self.touched.add(old)
+        self.touched.add(firm)
+        self.dirty.add(student)
+        before = self.current[student]
+        self.current[student] = self.score.get(student * self.m + firm, 0)
+        self._register(student, firm)
+        return self.current[student] - before
+
+    # ---------- Hamleler ----------
+
+    def vacancy_chain(self, firm, moved):
+        """
+        Boş kontenjanı olan firmadan başlayan boşluk zinciri; kazancı döndürür
+        Her adım toplam puanı artırdığı için zincir sonludur
+        """
+        gain = 0
+        score = self.score
+        current = self.current
+        assigned = self.state.assigned
+        remaining = self.state.remaining
+        m = self.m
+        while remaining[firm] > 0:
+            candidates = self.wanters[firm]
+            if not candidates:
+                break
+            student = max(candidates, key=lambda s: score[s * m + firm] - current[s])
+            old = assigned[student]
+            gain += self._move(student, firm)
+            moved.append(student)
+            firm = old
+        return gain
+
+    def best_move(self, student):
+        """
+        Öğrenci için en kazançlı hamle: (kazanç, tür, hedef firma, ortak, ortağın hedefi)
+        Kazançlı hamle yoksa None. Her tercih için aday sayısı sabittir: boş kontenjan,
+        bir swap ortağı ve hedef firmanın en düşük puanlı üyesi.
+        """
+        state = self.state
+        m = self.m
+        score = self.score
+        current = self.current
+        remaining = state.remaining
+        firm = state.assigned[student]
+        own = current[student]
+        start = student * self.width
+        prefs = state.store.prefs
+
+        best = None
+        best_gain = 0
+        fallback = NO_FIRM  # İlk boş firma, gerektiğinde bir kez sorulur
+        for target in prefs[start:start + self.width]:
+            if target == NO_FIRM or target == firm:
+                continue
+            base = score[student * m + target] - own
+            if base <= 0:
+                break  # Sonraki tercihlerin puanı daha düşük
+            if remaining[target] > 0:
+                if base > best_gain:
+                    best, best_gain = ('relocate', target, None, None), base
+                continue
+
+            partners = self.want.get(firm * m + target)
+            if partners:
+                partner = next(iter(partners))
+                gain = base + score[partner * m + firm] - current[partner]
+                if gain > best_gain:
+                    best, best_gain = ('swap', target, partner, firm), gain
+
+            buckets = self.buckets[target]
+            if not buckets:
+                continue  # Kapasitesi 0 olan firma: çıkarılacak öğrenci yok
+            lowest = min(buckets)
+            if lowest >= base + 5:
+                continue  # Çıkarılacak öğrenci en iyi ihtimalle bile kazancı siler
+            partner = next(iter(buckets[lowest]))
+            dest, dest_score = firm, score.get(partner * m + firm, 0)
+            p_start = partner * self.width
+            for other in prefs[p_start:p_start + self.width]:
+                if other != NO_FIRM and other != target and remaining[other] > 0:
+                    if score[partner * m + other] > dest_score:
+                        dest, dest_score = other, score[partner * m + other]
+                    break  # Tercih sırasındaki ilk boş firma en yüksek puanlıdır
+            if dest_score == 0 and dest == firm:
+                if fallback == NO_FIRM:
+                    fallback = state.first_available()
+                if fallback is not None:
+                    dest = fallback
+            gain = base + dest_score - lowest
+            if gain > best_gain:
+                kind = 'swap' if dest == firm else 'eject'
+                best, best_gain = (kind, target, partner, dest), gain
+
+        if best is None:
+            return None
+        return (best_gain,) + best
+
+    def apply(self, student, move, moved):
+        """best_move sonucunu uygula (boşalan kontenjan için zincir dahil), kazancı döndür"""
+        _, kind, target, partner, dest = move
+        firm = self.state.assigned[student]
+        gain = 0
+        if partner is not None:
+            gain += self._move(partner, dest)
+            moved.append(partner)
+        gain += self._move(student, target)
+        moved.append(student)
+        if kind != 'swap':
+            gain += self.vacancy_chain(firm, moved)
+        return gain
+
+    # ---------- Çalıştırma ----------
+
+    def run(self, time_budget=DEFAULT_TIME_BUDGET, deadline_ns=None, log_callback=None,
+            log_level=LOG_INFO):
+        """
+        Kazançlı hamle kalmayana veya süre bitene kadar ara; sonuç sözlüğünü döndür
+        Önce boş kontenjanlı firmalardan boşluk zincirleri, sonra GNO sırasında her
+        öğrenci için en kazançlı hamle. Sonraki geçişler sadece taşınan öğrencileri ve
+        üyeliği değişen bir firmayı isteyenleri dener (diğerlerinin adayları değişmedi).
+        Bir geçişte hamle bulunmazsa yerel optimumdur.
+        """
+        start_ns = time.perf_counter_ns()
+        if deadline_ns is None:
+            deadline_ns = start_ns + int(time_budget * 1e9)
+        state = self.state
+        log_debug = log_callback is not None and log_level <= LOG_DEBUG
+        log_info = log_callback is not None and log_level <= LOG_INFO
+        student_ids = state.store.student_ids
+        moves = []
+        last_ns = start_ns
+
+        def record(kind, gain, moved):
+            nonlocal last_ns
+            now = time.perf_counter_ns()
+            elapsed = max(now - last_ns, 1)
+            last_ns = now
+            moves.append({
+                'kind': kind, 'gain': gain, 'time_ns': elapsed,
+                'gain_per_second': gain * 1e9 / elapsed,
+                'students': [student_ids[s] for s in moved],
+            })
+            if log_debug:
+                log_callback(f"{kind}: +{gain} ({', '.join(student_ids[s] for s in moved)})")
+
+        initial_score = state.satisfaction_score()
+        stopped = 'converged'
+        for firm in list(state.available_list):
+            moved = []
+            gain = self.vacancy_chain(firm, moved)
+            if gain:
+                record('chain', gain, moved)
+
+        passes = 0
+        current = self.current
+        assigned = state.assigned
+        gno_rank = state.store.gno_rank()
+        order = state.store.gno_order()
+        while stopped == 'converged':
+            passes += 1
+            improved = False
+            self.touched.clear()
+            self.dirty.clear()
+            for position, student in enumerate(order):
+                if position % CHECK_EVERY == 0 and time.perf_counter_ns() > deadline_ns:
+                    stopped = 'time_budget'
+                    break
+                if current[student] >= 5 or assigned[student] == NO_FIRM:
+                    continue
+                move = self.best_move(student)
+                if move is None:
+                    continue
+                moved = []
+                record(move[1], self.apply(student, move, moved), moved)
+                improved = True
+            if not improved:
+                break
+            candidates = set(self.dirty)
+            for firm in self.touched:
+                candidates.update(self.wanters[firm])
+            order = sorted(candidates, key=gno_rank.__getitem__)
+
+        end_ns = time.perf_counter_ns()
+        gain = sum(move['gain'] for move in moves)
+        total_ns = end_ns - start_ns
+        by_kind = {}
+        for kind in MOVE_KINDS:
+            selected = [move for move in moves if move['kind'] == kind]
+            kind_ns = sum(move['time_ns'] for move in selected)
+            kind_gain = sum(move['gain'] for move in selected)
+            by_kind[kind] = {
+                'moves': len(selected), 'gain': kind_gain, 'time_ns': kind_ns,
+                'gain_per_second': kind_gain * 1e9 / kind_ns if kind_ns else 0.0,
+            }
+        result = {
+            'initial_score': initial_score,
+            'satisfaction_score': initial_score + gain,
+            'gain': gain,
+            'passes': passes,
+            'stopped': stopped,
+            'total_time_ns': total_ns,
+            'total_time': total_ns / 1e9,
+            'gain_per_second': gain * 1e9 / total_ns if total_ns else 0.0,
+            'by_kind': by_kind,
+            'moves': moves,
+        }
+        if log_info:
+            log_callback(f"Yerel arama: {initial_score} -> {result['satisfaction_score']} "
+                         f"(+{gain}, {len(moves)} hamle, {passes} geçiş, "
+                         f"{result['total_time']:.3f} sn, {stopped})")
+        return result
+
+
+def improve_placement(state, time_budget=DEFAULT_TIME_BUDGET, log_callback=None,
+                      log_level=LOG_INFO):
+    """
+    Yerleştirmeyi yerinde iyileştir; sonuç sözlüğünü döndür
+    time_budget: indeks kurulumu dahil saniye cinsinden süre sınırı
+    Sonuç: initial_score, satisfaction_score, gain, passes, stopped ('converged' veya
+    'time_budget'), total_time(_ns), gain_per_second, by_kind (tür başına hamle, kazanç,
+    süre ve saniye başına kazanç) ve moves (hamle başına tür, kazanç, süre, saniye başına
+    kazanç ve taşınan öğrenci id'leri)
+    """
+    start_ns = time.perf_counter_ns()
+    search = LocalSearch(state)
+    setup_ns = time.perf_counter_ns() - start_ns
+    result = search.run(deadline_ns=start_ns + int(time_budget * 1e9),
+                        log_callback=log_callback, log_level=log_level)
+    result['setup_time_ns'] = setup_ns
+    result['total_time_ns'] += setup_ns
+    result['total_time'] = result['total_time_ns'] / 1e9
+    if result['total_time_ns']:
+        result['gain_per_second'] = result['gain'] * 1e9 / result['total_time_ns']
+    return result
+
+
+def summarize(result):
+    """Sonuç sözlüğünün hamle listesi olmayan kopyası (metrics.jsonl için)"""
+    summary = {key: value for key, value in result.items() if key != 'moves'}
+    summary['move_count'] = len(result['moves'])
+    return summary
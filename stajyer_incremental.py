@@ -0,0 +1,395 @@
+"""
+Stajyer Yerleştirme Simülatörü - Artımlı Yeniden Eşleştirme
+İlk yerleştirmeden sonra gelen değişiklikleri (öğrenci ekleme/çıkarma, kapasite ve
+tercih değişikliği) tüm kohortu yeniden çalıştırmadan uygulama
+
+Tutulan yerleştirme ertelenmiş kabul (run_deferred) sonucudur, yani GNO
+önceliklerine göre kararlı eşleşmedir. Tüm firmalar aynı önceliği kullandığı için
+kararlı eşleşme tektir. Bu yüzden her değişiklikten sonraki tercih içi yerleşmeler,
+run_deferred'ın baştan çalıştırılmasıyla aynı olur. Onarım sadece etkilenen zincirleri
+dolaşır:
+    yerinden etme zinciri: yeni (veya çıkarılan) öğrenci sıradaki tercihine teklif
+        verir; dolu firma en düşük öncelikli öğrencisini bırakır, bırakılan öğrenci de
+        kendi sıradaki tercihiyle devam eder
+    boşluk zinciri: boşalan kontenjana, o firmayı mevcut yerinden daha çok isteyen en
+        yüksek GNO'lu öğrenci geçer; onun boşalttığı yer için aynısı tekrarlanır
+Tercihleri tükenen öğrenciler bekleme kuyruğuna alınır. Her değişikliğin sonunda
+FAZ 2 uygulanır: bekleyenler GNO sırasında boş kontenjanlara tercih dışı yerleşir;
+boş kontenjan yoksa daha düşük GNO'lu bir tercih dışı yerleşenin yerini alır
+(run_deferred'ın FAZ 2'si gibi en yüksek GNO'lular tercih dışı yerleşir). Tercih dışı
+yerleşenler bulundukları firmada en düşük önceliğe sahiptir.
+
+Örnek:
+    matcher = IncrementalMatcher(store)
+    for student_id, old_firm, new_firm in matcher.set_capacity('F3', 2):
+        print(student_id, old_firm, '->', new_firm)
+"""
+
+import bisect
+import heapq
+import random
+from array import array
+
+from stajyer_core import LOG_OFF, NO_FIRM, PlacementState, run_deferred
+
+
+class IncrementalMatcher:
+    """
+    Ertelenmiş kabul yerleştirmesini değişikliklerle güncel tutar
+    Her işlem değişen yerleşmeleri (öğrenci_id, eski_firma_id, yeni_firma_id) listesi
+    olarak döndürür (yerleşmemiş = None)
+
+    Değişiklikler (apply için):
+        ('add', öğrenci_id, tercihler, gno)
+        ('remove', öğrenci_id)
+        ('capacity', firma_id, kapasite)
+        ('preferences', öğrenci_id, tercihler)
+    Çıkarılan öğrenciler depoda yerleşmemiş satır olarak kalır (withdrawn kümesi).
+    """
+
+    def __init__(self, store, state=None, rng=None):
+        """
+        store: CompactStore (önbellekten eşlenmiş salt okunur depolar kopyalanır)
+        state: aynı depo üzerinde run_deferred ile üretilmiş yerleştirme; None ise
+               run_deferred burada çalıştırılır
+        rng: tercih dışı yerleştirmeler için random.Random (verilmezse global random)
+        """
+        self.rng = rng or random
+        if store.mapped_path is not None:
+            store = store.copy()
+            if state is not None:
+                state = PlacementState(store, array('i', state.assigned),
+                                       array('i', state.remaining))
+        if state is None:
+            state = PlacementState(store)
+            run_deferred(store, state, rng=self.rng, log_level=LOG_OFF)
+        self.store = store
+        self.state = state
+        self.student_index = {sid: i for i, sid in enumerate(store.student_ids)}
+        self.withdrawn = set()
+        self._version = array('i', bytes(4 * store.n_students))
+        self._changes = None
+
+        gno = store.gno
+        # Firma başına yerleşenler: (tercih içi mi, gno, -öğrenci, sürüm, öğrenci) heap'i,
+        # başta en düşük öncelikli öğrenci; öğrenci taşındıkça eski kayıtlar atlanır (lazy)
+        self._held = [[] for _ in range(store.n_firms)]
+        # Firma başına onu tercih eden öğrenciler: (-gno, öğrenci), en yüksek öncelikli başta
+        self._interested = [[] for _ in range(store.n_firms)]
+        # Tercih dışı yerleşenler: (gno, -öğrenci, sürüm, öğrenci) heap'i, başta en düşük öncelikli
+        self._outside = []
+        # Tercihleri tükenmiş, yerleşmemiş öğrenciler: (-gno, öğrenci) heap'i
+        self._waiting = []
+
+        for student in store.gno_order():
+            for firm in self._pref_firms(student):
+                self._interested[firm].append((-gno[student], student))
+        for student, firm in enumerate(state.assigned):
+            if firm != NO_FIRM:
+                entry = self._held_entry(student, firm)
+                self._held[firm].append(entry)
+                if not entry[0]:
+                    self._outside.append((gno[student], -student, 0, student))
+            else:
+                self._waiting.append((-gno[student], student))
+        for heap in self._held:
+            heapq.heapify(heap)
+        heapq.heapify(self._outside)
+        heapq.heapify(self._waiting)
+
+    # ---------- Değişiklikler ----------
+
+    def apply(self, deltas):
+        """Değişiklikleri sırayla uygula; hepsinin birleşik farkını döndür"""
+        self._changes = {}
+        try:
+            for delta in deltas:
+                kind = delta[0]
+                if kind == 'add':
+                    self._add_student(*delta[1:])
+                elif kind == 'remove':
+                    self._remove_student(*delta[1:])
+                elif kind == 'capacity':
+                    self._set_capacity(*delta[1:])
+                elif kind == 'preferences':
+                    self._set_preferences(*delta[1:])
+                else:
+                    raise ValueError(f"Bilinmeyen değişiklik türü: {kind}")
+                self._settle()
+            return self._diff()
+        finally:
+            self._changes = None
+
+    def add_student(self, student_id, preferences, gno):
+        """Yeni öğrenci ekle ve tercihlerine yerleştir"""
+        return self.apply([('add', student_id, preferences, gno)])
+
+    def remove_student(self, student_id):
+        """Öğrenciyi çıkar (staj iptali); boşalan kontenjan yeniden doldurulur"""
+        return self.apply([('remove', student_id)])
+
+    def set_capacity(self, firm_id, capacity):
+        """Firma kapasitesini değiştir"""
+        return self.apply([('capacity', firm_id, capacity)])
+
+    def set_preferences(self, student_id, preferences):
+        """Öğrencinin tercihlerini değiştir"""
+        return self.apply([('preferences', student_id, preferences)])
+
+    def _add_student(self, student_id, preferences, gno):
+        if student_id in self.student_index:
+            raise ValueError(f"{student_id}: öğrenci zaten var")
+        self.store.add_student(student_id, preferences, gno)
+        student = self.state.add_student()
+        self.student_index[student_id] = student
+        self._version.append(0)
+        self._add_interest(student)
+        self._propose(student, 0)
+
+    def _remove_student(self, student_id):
+        student = self._student(student_id)
+        del self.student_index[student_id]
+        self.withdrawn.add(student)
+        self._remove_interest(student)
+        firm = self.state.assigned[student]
+        if firm != NO_FIRM:
+            self._move(student, NO_FIRM)
+        self.state.unplaced.discard(student)
+        if firm != NO_FIRM:
+            self._fill(firm)
+
+    def _set_capacity(self, firm_id, capacity):
+        if capacity < 0:
+            raise ValueError(f"{firm_id}: kapasite negatif olamaz ({capacity})")
+        firm = self.store.firm_index.get(firm_id)
+        if firm is None:
+            raise ValueError(f"{firm_id}: firma bulunamadı")
+        state = self.state
+        state.set_capacity(firm, capacity)
+
+        # Kapasite doluluğun altına indiyse en düşük öncelikli öğrenciler çıkar
+        evicted = []
+        while state.remaining[firm] < 0:
+            loser = self._worst(firm)[4]
+            evicted.append((loser, self.store.pref_rank(loser, firm)))
+            self._move(loser, NO_FIRM)
+        for loser, rank in evicted:
+            if rank >= 0:
+                self._propose(loser, rank + 1)
+            else:
+                self._wait(loser)
+        self._fill(firm)
+
+    def _set_preferences(self, student_id, preferences):
+        # Öğrenci önce çıkarılmış gibi boşluğu doldur, sonra yeni öğrenci gibi teklif versin
+        # (boşluk açıkken teklif verilirse boş kontenjanı daha öncelikli adaylardan önce
+        # zincirdeki bir öğrenci kapabilir)
+        student = self._student(student_id)
+        self._remove_interest(student)
+        firm = self.state.assigned[student]
+        if firm != NO_FIRM:
+            self._move(student, NO_FIRM)
+            self._fill(firm)
+        self.store.set_preferences(student, preferences)
+        self._add_interest(student)
+        self._propose(student, 0)
+
+    # ---------- Zincirler ----------
+
+    def _propose(self, student, position):
+        """Yerinden etme zinciri: yerleşmemiş öğrenci position'dan itibaren teklif verir"""
+        store = self.store
+        state = self.state
+        prefs = store.prefs
+        width = store.width
+        gno = store.gno
+        while True:
+            start = student * width
+            loser = None
+            for position in range(position, width):
+                firm = prefs[start + position]
+                if firm == NO_FIRM:
+                    continue
+                if state.remaining[firm] > 0:
+                    self._move(student, firm)
+                    return
+                worst = self._worst(firm)
+                if worst is not None and (1, gno[student], -student) > worst[:3]:
+                    loser = worst[4]
+                    self._move(loser, NO_FIRM)
+                    self._move(student, firm)
+                    break
+            if loser is None:
+                self._wait(student)
+                return
+            if worst[0] == 0:
+                # Tercih dışı yerleşmiş öğrenci yerinden edildi
+                self._wait(loser)
+                return
+            student = loser
+            position = store.pref_rank(loser, firm) + 1
+
+    def _wait(self, student):
+        """Tercihleri tükenen öğrenciyi FAZ 2 için bekleme kuyruğuna al"""
+        heapq.heappush(self._waiting, (-self.store.gno[student], student))
+
+    def _settle(self):
+        """
+        FAZ 2: bekleyenleri GNO sırasında boş kontenjanlı rastgele firmaya yerleştir;
+        boş kontenjan kalmadıysa daha düşük GNO'lu tercih dışı yerleşenin yerini alır
+        """
+        state = self.state
+        gno = self.store.gno
+        while True:
+            student = self._pop_waiting()
+            if student is None:
+                return
+            firm = state.random_available(self.rng)
+            if firm is None:
+                worst = self._worst_outside()
+                if worst is None or (gno[student], -student) <= worst[:2]:
+                    self._wait(student)
+                    return
+                firm = self._move(worst[3], NO_FIRM)
+                self._wait(worst[3])
+            self._move(student, firm)
+
+    def _fill(self, firm):
+        """Boşluk zinciri: boş kontenjanları o firmayı en çok isteyen öğrencilerle doldur"""
+        state = self.state
+        pending = [firm]
+        while pending:
+            firm = pending.pop()
+            while state.remaining[firm] > 0:
+                student = self._best_candidate(firm)
+                if student is None:
+                    student = self._pop_waiting()
+                    if student is None:
+                        break
+                old = self._move(student, firm)
+                if old != NO_FIRM:
+                    pending.append(old)
+
+    def _best_candidate(self, firm):
+        """
+        Firmayı mevcut yerinden daha çok isteyen en yüksek öncelikli öğrenci (yoksa None)
+        Kararlılık gereği firmanın en düşük öncelikli tercih içi öğrencisinden daha
+        yüksek öncelikli hiç kimse firmayı mevcut yerine tercih etmez; tarama onun
+        arkasından başlar. Firmada tercih dışı yerleşen varsa aday yoktur.
+        """
+        worst = self._worst(firm)
+        if worst is not None and worst[0] == 0:
+            return None
+        interested = self._interested[firm]
+        start = 0 if worst is None else bisect.bisect_right(interested, (-worst[1], worst[4]))
+        store = self.store
+        assigned = self.state.assigned
+        width = store.width
+        for i in range(start, len(interested)):
+            student = interested[i][1]
+            current = assigned[student]
+            if current == NO_FIRM:
+                return student
+            current_rank = store.pref_rank(student, current)
+            if current_rank < 0:
+                current_rank = width
+            if store.pref_rank(student, firm) < current_rank:
+                return student
+        return None
+
+    def _pop_waiting(self):
+        waiting = self._waiting
+        while waiting:
+            _, student = heapq.heappop(waiting)
+            if self.state.assigned[student] == NO_FIRM and student not in self.withdrawn:
+                return student
+        return None
+
+    # ---------- Yardımcılar ----------
+
+    def _move(self, student, firm):
+        """Öğrenciyi firmaya taşı (NO_FIRM = yerinden çıkar); eski firmayı döndür"""
+        state = self.state
+        old = state.assigned[student]
+        self._changes.setdefault(student, old)
+        if old != NO_FIRM:
+            state.unplace(student)
+        self._version[student] += 1
+        if firm != NO_FIRM:
+            state.place(student, firm)
+            entry = self._held_entry(student, firm)
+            heapq.heappush(self._held[firm], entry)
+            if not entry[0]:
+                heapq.heappush(self._outside, (entry[1], entry[2], entry[3], student))
+        return old
+
+    def _held_entry(self, student, firm):
+        in_preferences = 1 if self.store.pref_rank(student, firm) >= 0 else 0
+        return (in_preferences, self.store.gno[student], -student,
+                self._version[student], student)
+
+    def _worst(self, firm):
+        """Firmadaki en düşük öncelikli öğrencinin kaydı (boşsa None)"""
+        heap = self._held[firm]
+        assigned = self.state.assigned
+        version = self._version
+        while heap:
+            entry = heap[0]
+            student = entry[4]
+            if assigned[student] == firm and version[student] == entry[3]:
+                return entry
+            heapq.heappop(heap)
+        return None
+
+    def _worst_outside(self):
+        """En düşük öncelikli tercih dışı yerleşenin kaydı (yoksa None)"""
+        heap = self._outside
+        assigned = self.state.assigned
+        version = self._version
+        while heap:
+            entry = heap[0]
+            student = entry[3]
+            if assigned[student] != NO_FIRM and version[student] == entry[2]:
+                return entry
+            heapq.heappop(heap)
+        return None
+
+    def _pref_firms(self, student):
+        """Öğrencinin tekrarsız geçerli tercihleri"""
+        seen = []
+        for firm in self.store.pref_row(student):
+            if firm != NO_FIRM and firm not in seen:
+                seen.append(firm)
+        return seen
+
+    def _add_interest(self, student):
+        key = (-self.store.gno[student], student)
+        for firm in self._pref_firms(student):
+            bisect.insort(self._interested[firm], key)
+
+    def _remove_interest(self, student):
+        key = (-self.store.gno[student], student)
+        for firm in self._pref_firms(student):
+            interested = self._interested[firm]
+            i = bisect.bisect_left(interested, key)
+            if i < len(interested) and interested[i] == key:
+                del interested[i]
+
+    def _student(self, student_id):
+        student = self.student_index.get(student_id)
+        if student is None:
+            raise ValueError(f"{student_id}: öğrenci bulunamadı")
+        return student
+
+    def _diff(self):
+        store = self.store
+        assigned = self.state.assigned
+        firm_ids = store.firm_ids
+        diff = []
+        for student, old in self._changes.items():
+            new = assigned[student]
+            if old != new:
+                diff.append((store.student_ids[student],
+                             firm_ids[old] if old != NO_FIRM else None,
+                             firm_ids[new] if new != NO_FIRM else None))
+        return diff
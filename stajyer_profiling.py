@@ -0,0 +1,88 @@
+"""
+Stajyer Yerleştirme Simülatörü - Profil Çıkarma
+Algoritma çalıştırmalarını isteğe bağlı cProfile / tracemalloc ile ölçme ve
+sonuçları JSON satırları (JSONL) olarak yazma
+
+Her çalıştırmanın metrics sözlüğü zaten şunları içerir (stajyer_core):
+    timings_ns     : bölüm süreleri (sort, scoring, matching, rejection, logging, satisfaction)
+    phase_times_ns : faz başına süre
+    counters       : yardımcı işlem sayaçları
+    iterations     : iterasyon başına faz, yerleşmemiş, yerleşen, reddedilen ve süre
+Bu modül bunlara 'profile' (en pahalı fonksiyonlar) ve 'memory' (bellek tepe değeri,
+en çok ayıran satırlar) alanlarını ekler.
+"""
+
+import cProfile
+import json
+import os
+import pstats
+import tracemalloc
+
+from stajyer_core import LOG_DEBUG
+
+
+def profile_summary(profiler, top=20):
+    """cProfile sonuçlarından kümülatif süreye göre en pahalı top fonksiyon"""
+    stats = pstats.Stats(profiler).stats
+    rows = sorted(stats.items(), key=lambda item: item[1][3], reverse=True)[:top]
+    summary = []
+    for (filename, line, function), (_, calls, tottime, cumtime, _) in rows:
+        summary.append({
+            'function': f"{os.path.basename(filename)}:{line}({function})",
+            'calls': calls,
+            'tottime': tottime,
+            'cumtime': cumtime,
+        })
+    return summary
+
+
+def memory_summary(snapshot, current, peak, top=10):
+    """tracemalloc anlık görüntüsünden bellek özeti"""
+    return {
+        'current_bytes': current,
+        'peak_bytes': peak,
+        'top': [
+            {'location': str(stat.traceback[0]), 'size': stat.size, 'count': stat.count}
+            for stat in snapshot.statistics('lineno')[:top]
+        ],
+    }
+
+
+def profile_run(run, store, state=None, log_callback=None, rng=None,
+                cprofile=False, trace_memory=False, top=20, log_level=LOG_DEBUG):
+    """
+    Depo tabanlı bir algoritmayı (run_greedy / run_heuristic / run_optimal) çalıştır
+    cprofile=True: metrics['profile'] en pahalı fonksiyonları içerir
+    trace_memory=True: metrics['memory'] çalıştırma sırasındaki bellek tepe değerini içerir
+    İkisi de kapalıysa doğrudan run çağrılır (ek maliyet yok)
+    """
+    profiler = cProfile.Profile() if cprofile else None
+    started_tracing = trace_memory and not tracemalloc.is_tracing()
+    if started_tracing:
+        tracemalloc.start()
+    if trace_memory:
+        tracemalloc.reset_peak()
+
+    if profiler:
+        profiler.enable()
+    try:
+        metrics = run(store, state, log_callback, rng, log_level)
+    finally:
+        if profiler:
+            profiler.disable()
+        if trace_memory:
+            current, peak = tracemalloc.get_traced_memory()
+            snapshot = tracemalloc.take_snapshot()
+        if started_tracing:
+            tracemalloc.stop()
+
+    if profiler:
+        metrics['profile'] = profile_summary(profiler, top)
+    if trace_memory:
+        metrics['memory'] = memory_summary(snapshot, current, peak)
+    return metrics
+
+
+def write_jsonl(f, record):
+    """Kaydı açık bir dosyaya tek satır JSON olarak yaz"""
+    f.write(json.dumps(record, ensure_ascii=False, default=str) + "\n")
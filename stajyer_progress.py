@@ -0,0 +1,79 @@
+"""
+Stajyer Yerleştirme Simülatörü - Canlı İlerleme
+Algoritmaların iterasyon kayıtlarından (IterationDelta, run_* event_callback) firma
+doluluğunu ve yerleşmemiş öğrenci sayısını güncel tutar (tkinter bağımlılığı yoktur).
+
+Algoritma thread'i kayıtları sadece kuyruğa koyar (biçimlendirme yok); ana thread kuyruğu
+aralıklarla boşaltır, kayıtları modele uygular ve çizimi en fazla REDRAW_INTERVAL_MS'de
+bir yapar. Çizim için firmalar en fazla ekran sütunu kadar gruba toplanır (columns), bu
+yüzden çizim maliyeti firma sayısından değil sütun sayısından bağımsızdır.
+
+Örnek:
+    model = ProgressModel(store)
+    run_greedy(store, state, event_callback=model.apply)
+    print(model.unplaced, model.full_firms())
+"""
+
+from array import array
+
+REDRAW_INTERVAL_MS = 200  # GUI'de iki çizim arasındaki en kısa süre
+COLUMN_WIDTH = 4          # Bir doluluk sütununun piksel genişliği
+
+
+class ProgressModel:
+    """
+    Kayıtlardan kurulan canlı durum
+    - fill[f]: f firmasındaki yerleşmiş öğrenci sayısı
+    - unplaced, iteration, phase: son kaydın değerleri (phase, faz değiştiyse yeni faz)
+    - placed / rejected: toplam yerleştirme ve geri alma kaydı sayısı
+    """
+
+    def __init__(self, store):
+        self.capacity = array('i', store.capacity)
+        self.fill = array('i', bytes(4 * store.n_firms))
+        self.n_students = store.n_students
+        self.unplaced = store.n_students
+        self.iteration = 0
+        self.phase = 1
+        self.placed = 0
+        self.rejected = 0
+        self.deltas = 0
+
+    def apply(self, delta):
+        """Bir IterationDelta'yı uygula - O(değişen firma sayısı) Python işlemi"""
+        fill = self.fill
+        for firm, change in delta.fill_changes().items():
+            fill[firm] += change
+        self.unplaced = delta.unplaced
+        self.iteration = delta.iteration
+        self.phase = delta.next_phase or delta.phase
+        self.placed += len(delta.placed)
+        self.rejected += len(delta.rejected)
+        self.deltas += 1
+
+    def full_firms(self):
+        """Kontenjanı dolu firma sayısı"""
+        return sum(1 for used, cap in zip(self.fill, self.capacity) if used >= cap)
+
+    def columns(self, count):
+        """
+        Firmaları en fazla count gruba topla; grup başına doluluk oranı (0-1) listesi
+        Gruplar firma sırasındadır; oran, grubun toplam doluluğunun toplam kapasitesine oranı
+        """
+        m = len(self.fill)
+        count = max(1, min(count, m))
+        ratios = []
+        for column in range(count):
+            lo = column * m // count
+            hi = (column + 1) * m // count
+            cap = sum(self.capacity[lo:hi])
+            ratios.append(sum(self.fill[lo:hi]) / cap if cap else 1.0)
+        return ratios
+
+    def status_line(self):
+        """Durum satırı: iterasyon, faz, yerleşen/yerleşmemiş, dolu firma"""
+        return (f"İterasyon {self.iteration} (Faz {self.phase}) | "
+                f"yerleşen {self.n_students - self.unplaced} / {self.n_students}, "
+                f"yerleşmemiş {self.unplaced} | "
+                f"dolu firma {self.full_firms()} / {len(self.fill)} | "
+                f"red {self.rejected}")
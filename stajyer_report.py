@@ -0,0 +1,262 @@
+"""
+Stajyer Yerleştirme Simülatörü - Raporlama
+Büyük çıktılar için yerleştirme raporu: memnuniyet skoru, tercih sırası dağılımı
+(1.-5. tercih, tercih dışı, yerleşmemiş) ve firma doluluk istatistikleri dizi verisi
+üzerinde tek geçişte hesaplanır.
+
+NumPy varsa öğrenciler parçalara bölünür ve parçalar bir thread havuzunda işlenir
+(büyük dizilerde NumPy işlemleri GIL'i bırakır); yoksa aynı sonuç saf Python ile
+hesaplanır. Yerleştirmeler toplu olarak CSV'ye (veya pyarrow kuruluysa Parquet'e)
+yazılır; GUI satırları sadece gösterilen sayfa için üretir (get_placement_details ile
+aynı biçim).
+"""
+
+import csv
+import importlib.util
+import os
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
+
+from stajyer_store import NO_FIRM
+
+try:
+    import numpy as np
+except ImportError:  # NumPy yoksa saf Python yolu kullanılır
+    np = None
+
+RANK_OUTSIDE = -1    # Tercih dışı yerleşme
+RANK_UNPLACED = -2   # Yerleşmemiş
+CHUNK_SIZE = 262144  # Parça başına öğrenci (NumPy ara dizileri bu boyutla sınırlı kalır)
+PAGE_SIZE = 1000     # GUI'de bir sayfadaki satır sayısı
+WRITE_BATCH = 65536  # Dosyaya tek seferde yazılan satır sayısı
+
+PLACEMENT_COLUMNS = ('student_id', 'firma_id', 'tercih_sirasi')
+
+
+def parquet_available():
+    """Parquet çıktısı için pyarrow kurulu mu?"""
+    return importlib.util.find_spec('pyarrow') is not None
+
+
+def _take(values, indices):
+    """[values[i] for i in indices] - itemgetter ile (tek elemanlı seçimde de liste döner)"""
+    if len(indices) == 1:
+        return [values[indices[0]]]
+    return list(itemgetter(*indices)(values)) if indices else []
+
+
+def _plain_csv(values):
+    """Değerlerin hiçbiri CSV'de tırnak gerektirmiyor mu (ayraç, tırnak, satır sonu)?"""
+    text = "\0".join(values)
+    return not any(char in text for char in ',"\r\n')
+
+
+def _numpy_pass(store, assigned, workers, chunk_size):
+    """Tercih sıraları, sıra dağılımı ve firma doluluğu - parçalar thread havuzunda"""
+    n, width = store.n_students, store.width
+    prefs = np.frombuffer(store.prefs, dtype=np.int32).reshape(n, width)
+    firms = np.frombuffer(assigned, dtype=np.int32)
+    ranks = np.empty(n, dtype=np.int8)
+
+    def work(start):
+        stop = min(start + chunk_size, n)
+        chunk = firms[start:stop]
+        match = prefs[start:stop] == chunk[:, None]
+        rank = np.where(match.any(axis=1), match.argmax(axis=1), RANK_OUTSIDE)
+        placed = chunk != NO_FIRM
+        rank[~placed] = RANK_UNPLACED  # Boş tercih hücreleri (-1) yerleşmemişle eşleşir
+        ranks[start:stop] = rank
+        return (np.bincount(rank - RANK_UNPLACED, minlength=width + 2),
+                np.bincount(chunk[placed], minlength=store.n_firms))
+
+    starts = range(0, n, chunk_size)
+    if workers > 1 and len(starts) > 1:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            parts = list(pool.map(work, starts))
+    else:
+        parts = [work(start) for start in starts]
+
+    counts = np.zeros(width + 2, dtype=np.int64)
+    filled = np.zeros(store.n_firms, dtype=np.int64)
+    for part_counts, part_filled in parts:
+        counts += part_counts
+        filled += part_filled
+    return array('b', ranks.tobytes()), counts.tolist(), array('i', filled.tolist())
+
+
+def _python_pass(store, assigned):
+    """_numpy_pass'in saf Python karşılığı"""
+    pref_rank = store.pref_rank
+    ranks = array('b', bytes(len(assigned)))
+    counts = [0] * (store.width + 2)
+    filled = array('i', bytes(4 * store.n_firms))
+    for student, firm in enumerate(assigned):
+        if firm == NO_FIRM:
+            rank = RANK_UNPLACED
+        else:
+            filled[firm] += 1
+            rank = pref_rank(student, firm)  # Tercihte yoksa -1 = RANK_OUTSIDE
+        ranks[student] = rank
+        counts[rank - RANK_UNPLACED] += 1
+    return ranks, counts, filled
+
+
+class PlacementReport:
+    """
+    Bir yerleştirme durumunun raporu (tek geçişte hesaplanır)
+    - ranks: öğrenci başına tercih sırası (0 = 1. tercih, RANK_OUTSIDE, RANK_UNPLACED)
+    - rank_histogram: tercih sırası başına öğrenci sayısı (indeks 0 = 1. tercih)
+    - outside / unplaced: tercih dışı yerleşen / yerleşmemiş öğrenci sayısı
+    - filled: firma başına yerleşen öğrenci sayısı
+    - satisfaction_score: calculate_satisfaction_score ile aynı puanlama
+    Durumun atama dizisi kopyalanır; durum sonraki çalıştırmada sıfırlansa da rapor geçerlidir.
+    workers: thread sayısı (NumPy yolu; varsayılan CPU sayısı)
+    """
+
+    def __init__(self, state, workers=None, chunk_size=CHUNK_SIZE):
+        self.store = state.store
+        self.assigned = array('i', state.assigned)
+        if np is not None:
+            ranks, counts, filled = _numpy_pass(self.store, self.assigned,
+                                                workers or os.cpu_count() or 1, chunk_size)
+        else:
+            ranks, counts, filled = _python_pass(self.store, self.assigned)
+        self.ranks = ranks
+        self.unplaced = counts[0]
+        self.outside = counts[1]
+        self.rank_histogram = counts[2:]
+        self.filled = filled
+        self.satisfaction_score = sum((5 - rank) * count
+                                      for rank, count in enumerate(self.rank_histogram))
+        self._placed = None
+
+    @property
+    def placed(self):
+        """Yerleşen öğrenci sayısı"""
+        return len(self.assigned) - self.unplaced
+
+    def placed_students(self):
+        """Yerleşen öğrenci indeksleri (liste sırasında); ilk çağrıda kurulur"""
+        if self._placed is None:
+            if np is not None:
+                firms = np.frombuffer(self.assigned, dtype=np.int32)
+                placed = np.flatnonzero(firms != NO_FIRM).astype(np.int32)
+                self._placed = array('i', placed.tobytes())
+            else:
+                self._placed = array('i', (s for s, f in enumerate(self.assigned) if f != NO_FIRM))
+        return self._placed
+
+    # ---------- Firma istatistikleri ----------
+
+    def firm_stats(self):
+        """Firma doluluk özeti: tam dolu / kısmen dolu / boş firma sayısı, ortalama doluluk"""
+        capacity = self.store.capacity
+        full = empty = 0
+        ratio_sum = 0.0
+        with_capacity = 0
+        for firm, count in enumerate(self.filled):
+            if count == 0:
+                empty += 1
+            if capacity[firm] > 0:
+                with_capacity += 1
+                ratio_sum += count / capacity[firm]
+                if count >= capacity[firm]:
+                    full += 1
+        return {
+            'full': full,
+            'partial': self.store.n_firms - full - empty,
+            'empty': empty,
+            'mean_fill_ratio': ratio_sum / with_capacity if with_capacity else 0.0,
+        }
+
+    def summary_lines(self):
+        """Raporun okunabilir özeti"""
+        total = len(self.assigned) or 1
+        lines = [f"Memnuniyet skoru: {self.satisfaction_score}",
+                 f"Yerleşen: {self.placed} / {len(self.assigned)}"]
+        for rank, count in enumerate(self.rank_histogram):
+            lines.append(f"  {rank + 1}. tercih : {count:>8} (%{count / total * 100:.1f})")
+        lines.append(f"  tercih dışı: {self.outside:>8} (%{self.outside / total * 100:.1f})")
+        lines.append(f"  yerleşmemiş: {self.unplaced:>8} (%{self.unplaced / total * 100:.1f})")
+        stats = self.firm_stats()
+        lines.append(f"Firmalar: {stats['full']} tam dolu, {stats['partial']} kısmen dolu, "
+                     f"{stats['empty']} boş "
+                     f"(ortalama doluluk %{stats['mean_fill_ratio'] * 100:.1f})")
+        return lines
+
+    # ---------- Sayfalı görünüm ----------
+
+    def page_count(self, page_size=PAGE_SIZE):
+        return max(1, -(-self.placed // page_size))
+
+    def page(self, index, page_size=PAGE_SIZE):
+        """index. sayfanın satırları (0'dan başlar) - get_placement_details biçiminde"""
+        store = self.store
+        student_ids, firm_ids = store.student_ids, store.firm_ids
+        lines = []
+        for student in self.placed_students()[index * page_size:(index + 1) * page_size]:
+            rank = self.ranks[student]
+            pref_info = f"({rank + 1}. tercih)" if rank >= 0 else "(tercih dışı)"
+            lines.append(f"{student_ids[student]} -> {firm_ids[self.assigned[student]]} "
+                         f"{pref_info}")
+        return lines
+
+    # ---------- Toplu çıktı ----------
+
+    def iter_batches(self, batch_size=WRITE_BATCH):
+        """
+        Yerleşenler için sütun grupları üret: (öğrenci_id'ler, firma_id'ler, tercih sıraları)
+        Tercih sırası 0'dan başlar, tercih dışı yerleşmede RANK_OUTSIDE; seçimler itemgetter
+        ile C seviyesinde yapılır
+        """
+        store = self.store
+        placed = self.placed_students()
+        for start in range(0, len(placed), batch_size):
+            batch = placed[start:start + batch_size].tolist()
+            yield (_take(store.student_ids, batch),
+                   _take(store.firm_ids, _take(self.assigned, batch)),
+                   _take(self.ranks, batch))
+
+    def write_csv(self, filepath):
+        """
+        Yerleştirmeleri CSV olarak yaz (tercih dışı yerleşmede tercih_sirasi boş)
+        Hiçbir id tırnak gerektirmiyorsa satırlar doğrudan birleştirilir; gerekiyorsa csv modülü
+        """
+        labels = [str(rank + 1) for rank in range(self.store.width)] + ['']  # [-1] = tercih dışı
+        plain = _plain_csv(self.store.firm_ids) and _plain_csv(self.store.student_ids)
+        with open(filepath, 'w', encoding='utf-8', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(PLACEMENT_COLUMNS)
+            for student_ids, firm_ids, ranks in self.iter_batches():
+                rows = zip(student_ids, firm_ids, _take(labels, ranks))
+                if plain:
+                    f.write("\r\n".join(map(",".join, rows)) + "\r\n")
+                else:
+                    writer.writerows(rows)
+
+    def write_parquet(self, filepath):
+        """Yerleştirmeleri Parquet olarak yaz (pyarrow gerekir)"""
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError as e:
+            raise ImportError("Parquet çıktısı için pyarrow gerekli "
+                              "(pip install pyarrow)") from e
+
+        schema = pa.schema([('student_id', pa.string()), ('firma_id', pa.string()),
+                            ('tercih_sirasi', pa.int8())])
+        with pq.ParquetWriter(filepath, schema) as writer:
+            for student_ids, firm_ids, ranks in self.iter_batches():
+                pref_nums = [rank + 1 if rank >= 0 else None for rank in ranks]
+                writer.write_table(pa.Table.from_arrays(
+                    [pa.array(column, type=field.type)
+                     for column, field in zip((student_ids, firm_ids, pref_nums), schema)],
+                    schema=schema))
+
+    def write(self, filepath, fmt='csv'):
+        """Yerleştirmeleri verilen biçimde yaz ('csv' veya 'parquet')"""
+        if fmt == 'parquet':
+            self.write_parquet(filepath)
+        else:
+            self.write_csv(filepath)
@@ -0,0 +1,149 @@
+"""
+Stajyer Yerleştirme Simülatörü - Vektörel Skorlama
+calculate_match_score formülünün NumPy ile toplu (batch) hesaplanması
+
+Skor = (GNO × 0.4) + (Tercih × 0.3) + (Uygunluk × 0.3)
+Toplama sırası calculate_match_score ile aynıdır, bu yüzden sonuçlar bit düzeyinde eşittir.
+Ağırlıklar varsayılan olarak stajyer_core sabitleridir; parametre taramaları için değiştirilebilir.
+"""
+
+import numpy as np
+
+from stajyer_core import COMPAT_WEIGHT, GNO_WEIGHT, PREF_WEIGHT
+
+
+class ScoringArrays:
+    """
+    Skorlama için dizi tabanlı veri
+    - gno: öğrenci GNO'ları
+    - gno_part: (GNO / 4) × gno_weight, öğrenci başına
+    - pref_firms: n × w tercih matrisi (firma indeksi, boş hücreler -1)
+    - pref_parts: n × w tercih skorları ((5 - sıra) / 5) × pref_weight; tekrarlanan tercihlerde
+      sadece ilk geçiş skorlanır (list.index davranışı)
+    - capacity: firma kapasiteleri
+    Diziler bir CompactStore'dan kurulur; öğrenci ve firma indeksleri depo ile aynıdır.
+    """
+
+    def __init__(self, store, gno_weight=GNO_WEIGHT, pref_weight=PREF_WEIGHT,
+                 compat_weight=COMPAT_WEIGHT):
+        self.compat_weight = compat_weight
+        self.student_ids = store.student_ids
+        self.firm_ids = store.firm_ids
+        self.firm_index = store.firm_index
+
+        n = store.n_students
+        width = store.width
+        self.gno = np.frombuffer(store.gno, dtype=np.float64) if n else np.zeros(0)
+        self.gno_part = self.gno / 4.0 * gno_weight
+
+        pref_firms = np.array(store.prefs, dtype=np.int32).reshape(n, width)
+        ranks = np.arange(width, dtype=np.float64)
+        pref_parts = np.broadcast_to((5 - ranks) / 5.0 * pref_weight, (n, width)).copy()
+        # Tekrarlanan tercihler: ilk geçişten sonrakiler -1 yapılır
+        for k in range(1, width):
+            dup = (pref_firms[:, k:k + 1] == pref_firms[:, :k]).any(axis=1)
+            pref_firms[dup, k] = -1
+        pref_parts[pref_firms < 0] = 0.0
+        self.pref_firms = pref_firms
+        self.pref_parts = pref_parts
+
+        self.capacity = np.array(store.capacity, dtype=np.float64)
+
+    @classmethod
+    def from_objects(cls, students, firms):
+        """Student listesi ve Firm sözlüğünden skorlama dizileri oluştur"""
+        from stajyer_store import CompactStore
+        return cls(CompactStore.from_objects(students, firms))
+
+    def current_capacity(self, firms):
+        """Firmaların kalan kontenjanlarını dizi olarak döndür"""
+        return np.fromiter((firms[fid].current_capacity for fid in self.firm_ids),
+                           dtype=np.float64, count=len(self.firm_ids))
+
+    def compat_scores(self, current_capacity):
+        """Uygunluk skoru: 1 - doluluk oranı (kapasitesi 0 olan firmalar için 1)"""
+        fill_ratio = np.zeros_like(self.capacity)
+        np.subtract(1, current_capacity / np.where(self.capacity > 0, self.capacity, 1),
+                    out=fill_ratio, where=self.capacity > 0)
+        return 1 - fill_ratio
+
+    def pref_score_matrix(self, student_rows, firm_cols):
+        """Seçilen öğrenci × firma blokları için (tercih skoru × pref_weight) matrisi"""
+        student_rows = np.asarray(student_rows, dtype=np.intp)
+        firm_cols = np.asarray(firm_cols, dtype=np.intp)
+        col_of = np.full(len(self.firm_ids), -1, dtype=np.intp)
+        col_of[firm_cols] = np.arange(len(firm_cols))
+
+        matrix = np.zeros((len(student_rows), len(firm_cols)), dtype=np.float64)
+        prefs = self.pref_firms[student_rows]
+        parts = self.pref_parts[student_rows]
+        for k in range(prefs.shape[1]):
+            valid = prefs[:, k] >= 0
+            cols = np.where(valid, col_of[np.where(valid, prefs[:, k], 0)], -1)
+            hit = cols >= 0
+            matrix[np.nonzero(hit)[0], cols[hit]] = parts[hit, k]
+        return matrix
+
+    def score_matrix(self, current_capacity, student_rows=None, firm_cols=None,
+                     is_preference=True):
+        """
+        Tüm öğrenci × firma adaylarını tek çağrıda skorla
+        calculate_match_score(student, firm, firms, is_preference) ile aynı sonuçları verir
+        """
+        if student_rows is None:
+            student_rows = np.arange(len(self.student_ids))
+        if firm_cols is None:
+            firm_cols = np.arange(len(self.firm_ids))
+        student_rows = np.asarray(student_rows, dtype=np.intp)
+        firm_cols = np.asarray(firm_cols, dtype=np.intp)
+
+        compat_part = self.compat_scores(current_capacity)[firm_cols] * self.compat_weight
+        gno_part = self.gno_part[student_rows][:, None]
+        if is_preference:
+            return gno_part + self.pref_score_matrix(student_rows, firm_cols) + compat_part[None, :]
+        return gno_part + compat_part[None, :]
+
+    def best_candidates(self, current_capacity, student_rows=None, firm_cols=None,
+                        chunk_rows=4096):
+        """
+        Her öğrenci için en yüksek skorlu firmayı bul
+        Matris satır blokları halinde hesaplanır; bellek O(chunk_rows × m)
+        Dönüş: (firma indeksleri, skorlar)
+        """
+        if student_rows is None:
+            student_rows = np.arange(len(self.student_ids))
+        if firm_cols is None:
+            firm_cols = np.arange(len(self.firm_ids))
+        student_rows = np.asarray(student_rows, dtype=np.intp)
+        firm_cols = np.asarray(firm_cols, dtype=np.intp)
+
+        best_firm = np.full(len(student_rows), -1, dtype=np.intp)
+        best_score = np.full(len(student_rows), -np.inf, dtype=np.float64)
+        if len(firm_cols) == 0:
+            return best_firm, best_score
+
+        for start in range(0, len(student_rows), chunk_rows):
+            rows = student_rows[start:start + chunk_rows]
+            scores = self.score_matrix(current_capacity, rows, firm_cols)
+            arg = scores.argmax(axis=1)
+            best_firm[start:start + len(rows)] = firm_cols[arg]
+            best_score[start:start + len(rows)] = scores[np.arange(len(rows)), arg]
+        return best_firm, best_score
+
+    def pref_entries(self, student_rows, available):
+        """
+        Tercih içi adayların sabit skor kısımları (GNO + tercih), firmaya göre gruplanmış
+        available: firma başına boş kontenjan var mı (bool dizisi)
+        Dönüş: (firma indeksleri, satır konumları, -sabit kısım) - firma, skor (azalan), konum sırasında
+        """
+        student_rows = np.asarray(student_rows, dtype=np.intp)
+        prefs = self.pref_firms[student_rows]
+        positions = np.broadcast_to(np.arange(len(student_rows))[:, None], prefs.shape)
+        mask = prefs >= 0
+        mask[mask] = available[prefs[mask]]
+
+        firm = prefs[mask]
+        pos = positions[mask]
+        neg_base = -(self.gno_part[student_rows][:, None] + self.pref_parts[student_rows])[mask]
+        order = np.lexsort((pos, neg_base, firm))
+        return firm[order], pos[order], neg_base[order]
@@ -0,0 +1,485 @@
+"""
+Stajyer Yerleştirme Simülatörü - Eşleştirme Servisi
+localhost üzerinde JSON HTTP API (asyncio). Veri setleri açılışta bir kez yüklenir ve işçi
+süreçlere aktarılır; her çalıştırma isteği süreç havuzunda yürütülür, istekler birbirini
+beklemeden eşzamanlı işlenir. Kapasite değişiklikleri (what-if) istek başına uygulanır,
+yüklenmiş veri değişmez.
+
+Uç noktalar:
+    GET  /health     servis durumu ve iş sayaçları
+    GET  /datasets   yüklü veri setleri
+    POST /runs       {"dataset": "default", "algorithm": "heuristic", "seed": 1,
+                      "params": {"gno_weight": 0.5}, "capacity": {"F3": 5},
+                      "log_level": "info", "assignments": false, "stream": false}
+
+"stream": true ise yanıt parça parça (chunked) NDJSON olay akışıdır:
+queued, started, log (algoritma mesajları), sonunda result veya error.
+
+Örnek:
+    python3 stajyer_service.py --dataset default=students.csv,firms.csv -j 4
+    curl -s localhost:8765/runs -d '{"algorithm": "heuristic", "seed": 1}'
+"""
+
+import argparse
+import asyncio
+import itertools
+import json
+import multiprocessing
+import os
+import random
+import signal
+import sys
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from stajyer_core import (
+    ALGORITHMS, LOG_DEBUG, LOG_INFO, PlacementState, load_store, resolve_params,
+)
+from stajyer_report import PlacementReport
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+MAX_BODY_SIZE = 1 << 20  # İstek gövdesi sınırı (bayt)
+PARAM_ALGORITHMS = ('greedy', 'heuristic')  # params kabul eden algoritmalar
+STREAM_LOG_LEVELS = {'debug': LOG_DEBUG, 'info': LOG_INFO}
+
+STATUS_TEXT = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+               413: "Payload Too Large", 500: "Internal Server Error"}
+
+
+class RequestError(Exception):
+    """İstemciye HTTP durum koduyla döndürülen hata"""
+
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+# ==================== İŞÇİ SÜREÇLER ====================
+
+# Her işçi süreçte bir kez kurulur (veri setleri her işte tekrar gönderilmez)
+_worker_datasets = None
+_worker_states = None
+_worker_events = None
+
+
+def _init_worker(datasets, events):
+    global _worker_datasets, _worker_states, _worker_events
+    _worker_datasets = datasets
+    _worker_states = {}
+    _worker_events = events
+
+
+def _worker_pid():
+    return os.getpid()
+
+
+def run_job(job):
+    """
+    Tek bir çalıştırma (işçi süreç)
+    Akışlı işlerde olaylar (iş no, olay) olarak olay kuyruğuna yazılır; 'done' olayı
+    her durumda en son gönderilir
+    """
+    started = time.time()
+    job_id = job['id']
+    log_callback = None
+    if job['stream']:
+        def log_callback(message):
+            _worker_events.put((job_id, {'event': 'log', 'message': message}))
+        _worker_events.put((job_id, {'event': 'started', 'pid': os.getpid()}))
+    try:
+        name = job['dataset']
+        if job['capacity']:
+            store = _worker_datasets[name].with_capacity(job['capacity'])
+            state = PlacementState(store)
+        else:
+            # Değişikliksiz işler veri seti başına tek bir durumu yeniden kullanır
+            store = _worker_datasets[name]
+            state = _worker_states.get(name) or _worker_states.setdefault(
+                name, PlacementState(store))
+        kwargs = {'params': job['params']} if job['params'] is not None else {}
+        metrics = ALGORITHMS[job['algorithm']](store, state, log_callback,
+                                               random.Random(job['seed']), job['log_level'],
+                                               **kwargs)
+        report = PlacementReport(state, workers=1)
+        result = {
+            'job': job_id,
+            'dataset': name,
+            'algorithm': job['algorithm'],
+            'seed': job['seed'],
+            'satisfaction_score': metrics['satisfaction_score'],
+            'total_iterations': metrics['total_iterations'],
+            'rejections': metrics['rejections'],
+            'placed': report.placed,
+            'unplaced': report.unplaced,
+            'outside': report.outside,
+            'rank_histogram': list(report.rank_histogram),
+            'run_time': metrics['total_time'],
+            'queue_time': max(0.0, started - job['submitted']),
+        }
+        if job['assignments']:
+            result['assignments'] = [
+                [student_id, firm_id, rank + 1 if rank >= 0 else None]
+                for batch in report.iter_batches() for student_id, firm_id, rank in zip(*batch)
+            ]
+        return result
+    finally:
+        if job['stream']:
+            _worker_events.put((job_id, {'event': 'done'}))
+
+
+# ==================== İSTEK DOĞRULAMA ====================
+
+def parse_run_request(body, datasets):
+    """POST /runs gövdesini doğrula -> iş sözlüğü (RequestError 400/404)"""
+    if not isinstance(body, dict):
+        raise RequestError(400, "İstek gövdesi bir JSON nesnesi olmalı")
+    unknown = set(body) - {'dataset', 'algorithm', 'seed', 'params', 'capacity', 'log_level',
+                           'assignments', 'stream'}
+    if unknown:
+        raise RequestError(400, f"Bilinmeyen alan(lar): {', '.join(sorted(unknown))}")
+
+    name = body.get('dataset', 'default')
+    store = datasets.get(name)
+    if store is None:
+        raise RequestError(404, f"Veri seti bulunamadı: {name!r}")
+    algorithm = body.get('algorithm', 'greedy')
+    if algorithm not in ALGORITHMS:
+        raise RequestError(400, f"Bilinmeyen algoritma: {algorithm!r} "
+                                f"(beklenen: {', '.join(ALGORITHMS)})")
+    seed = body.get('seed')
+    # bool int'in alt sınıfıdır; JSON true/false tamsayı sayılmaz
+    if seed is not None and type(seed) is not int:
+        raise RequestError(400, "seed bir tamsayı olmalı")
+
+    params = body.get('params')
+    if params is not None:
+        if algorithm not in PARAM_ALGORITHMS:
+            raise RequestError(400, f"{algorithm} parametre almaz")
+        if not isinstance(params, dict):
+            raise RequestError(400, "params bir JSON nesnesi olmalı")
+        try:
+            resolve_params(params)
+        except (TypeError, ValueError) as e:
+            raise RequestError(400, str(e)) from None
+
+    changes = body.get('capacity') or {}
+    if not isinstance(changes, dict):
+        raise RequestError(400, "capacity bir JSON nesnesi olmalı ({firma_id: kapasite})")
+    capacity = {}
+    for firm_id, value in changes.items():
+        firm = store.firm_index.get(firm_id)
+        if firm is None:
+            raise RequestError(400, f"Bilinmeyen firma: {firm_id!r}")
+        if type(value) is not int or value < 0:
+            raise RequestError(400, f"{firm_id}: kapasite negatif olmayan bir tamsayı olmalı")
+        capacity[firm] = value
+
+    log_level = body.get('log_level', 'info')
+    if log_level not in STREAM_LOG_LEVELS:
+        raise RequestError(400, f"log_level: {', '.join(STREAM_LOG_LEVELS)}")
+    return {
+        'dataset': name,
+        'algorithm': algorithm,
+        'seed': seed,
+        'params': params,
+        'capacity': capacity,
+        'assignments': bool(body.get('assignments', False)),
+        'stream': bool(body.get('stream', False)),
+        'log_level': STREAM_LOG_LEVELS[log_level],
+    }
+
+
+# ==================== HTTP ====================
+
+async def read_request(reader):
+    """Bir HTTP/1.1 isteği oku -> (yöntem, yol, başlıklar, gövde); bağlantı kapandıysa None"""
+    line = await reader.readline()
+    if not line:
+        return None
+    try:
+        method, target, _ = line.decode('latin-1').split(' ', 2)
+    except ValueError:
+        raise RequestError(400, "Geçersiz istek satırı") from None
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b'\r\n', b'\n', b''):
+            break
+        name, _, value = line.decode('latin-1').partition(':')
+        headers[name.strip().lower()] = value.strip()
+    try:
+        length = int(headers.get('content-length', 0))
+    except ValueError:
+        raise RequestError(400, "Geçersiz Content-Length") from None
+    if length > MAX_BODY_SIZE:
+        raise RequestError(413, f"İstek gövdesi en fazla {MAX_BODY_SIZE} bayt olabilir")
+    body = await reader.readexactly(length) if length else b''
+    return method, target.split('?', 1)[0], headers, body
+
+
+def _head(status, content_type, extra=()):
+    lines = [f"HTTP/1.1 {status} {STATUS_TEXT.get(status, '')}",
+             f"Content-Type: {content_type}", *extra]
+    return ("\r\n".join(lines) + "\r\n\r\n").encode('latin-1')
+
+
+async def send_json(writer, status, payload, keep_alive=True):
+    data = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+    writer.write(_head(status, "application/json; charset=utf-8",
+                       (f"Content-Length: {len(data)}",
+                        f"Connection: {'keep-alive' if keep_alive else 'close'}")) + data)
+    await writer.drain()
+
+
+async def send_chunk(writer, payload):
+    """NDJSON olayını tek bir chunk olarak yaz"""
+    data = json.dumps(payload, ensure_ascii=False).encode('utf-8') + b"\n"
+    writer.write(b"%x\r\n%s\r\n" % (len(data), data))
+    await writer.drain()
+
+
+# ==================== SERVİS ====================
+
+class MatchingService:
+    """
+    Yüklü veri setleri + süreç havuzu + HTTP sunucusu
+    datasets: {ad: CompactStore}; workers: süreç sayısı (None = CPU sayısı)
+    İşçiler açılışta başlatılır; veri setleri onlara bir kez aktarılır (fork'ta kopyalanmadan,
+    önbellekten eşlenmiş depolarda dosya yoluyla).
+    """
+
+    def __init__(self, datasets, workers=None):
+        self.datasets = datasets
+        self.workers = workers or os.cpu_count() or 1
+        self.events = multiprocessing.SimpleQueue()
+        self.executor = ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker,
+                                            initargs=(datasets, self.events))
+        self.streams = {}  # iş no -> asyncio.Queue (akışlı işler)
+        self.job_ids = itertools.count(1)
+        self.counters = {'running': 0, 'completed': 0, 'failed': 0}
+        self.loop = None
+        self.server = None
+        self.reader = None
+        self.connections = set()  # Açık bağlantıların writer'ları (kapanışta kapatılır)
+
+    async def start(self, host=DEFAULT_HOST, port=DEFAULT_PORT):
+        self.loop = asyncio.get_running_loop()
+        # Havuz süreçlerini ilk istekten önce başlat (sıcak havuz)
+        await asyncio.gather(*(self.loop.run_in_executor(self.executor, _worker_pid)
+                               for _ in range(self.workers)))
+        self.reader = threading.Thread(target=self._read_events, daemon=True)
+        self.reader.start()
+        self.server = await asyncio.start_server(self.handle_connection, host, port)
+        return self.server.sockets[0].getsockname()[:2]
+
+    async def close(self):
+        if self.server is not None:
+            self.server.close()
+            await self.server.wait_closed()
+        for writer in list(self.connections):
+            writer.close()  # Boştaki keep-alive bağlantıları EOF ile sonlanır
+        self.executor.shutdown(wait=True, cancel_futures=True)
+        self.events.put(None)
+        if self.reader is not None:
+            self.reader.join()
+
+    def _read_events(self):
+        """Olay kuyruğunu oku ve olayları ilgili akışa aktar (ayrı thread)"""
+        while True:
+            item = self.events.get()
+            if item is None:
+                return
+            self.loop.call_soon_threadsafe(self._dispatch, *item)
+
+    def _dispatch(self, job_id, event):
+        queue = self.streams.get(job_id)
+        if queue is not None:
+            queue.put_nowait(event)
+
+    # ---------- İşler ----------
+
+    async def run(self, job):
+        """İşi havuzda çalıştır ve sonucu döndür"""
+        self.counters['running'] += 1
+        try:
+            result = await self.loop.run_in_executor(self.executor, run_job, job)
+        except Exception:
+            self.counters['failed'] += 1
+            raise
+        finally:
+            self.counters['running'] -= 1
+        self.counters['completed'] += 1
+        return result
+
+    def new_job(self, body):
+        job = parse_run_request(body, self.datasets)
+        job['id'] = next(self.job_ids)
+        job['submitted'] = time.time()
+        return job
+
+    async def stream_run(self, writer, job):
+        """İşi çalıştır, olayları chunked NDJSON olarak gönder"""
+        queue = asyncio.Queue()
+        self.streams[job['id']] = queue
+        try:
+            writer.write(_head(200, "application/x-ndjson; charset=utf-8",
+                               ("Transfer-Encoding: chunked", "Connection: keep-alive")))
+            await send_chunk(writer, {'event': 'queued', 'job': job['id']})
+            future = asyncio.ensure_future(self.run(job))
+            getter = asyncio.ensure_future(queue.get())
+            while True:
+                if not future.done():
+                    await asyncio.wait((getter, future), return_when=asyncio.FIRST_COMPLETED)
+                    if not getter.done():
+                        if future.exception() is None:
+                            continue  # 'done' olayı yolda
+                        getter.cancel()
+                        break  # İşçi süreç çöktü, 'done' gelmeyecek
+                event = getter.result() if getter.done() else await getter
+                if event['event'] == 'done':
+                    break
+                await send_chunk(writer, event)
+                getter = asyncio.ensure_future(queue.get())
+            try:
+                await send_chunk(writer, {'event': 'result', **await future})
+            except Exception as e:
+                await send_chunk(writer, {'event': 'error', 'error': str(e)})
+            writer.write(b"0\r\n\r\n")
+            await writer.drain()
+        finally:
+            del self.streams[job['id']]
+
+    # ---------- HTTP ----------
+
+    async def handle_connection(self, reader, writer):
+        """Bağlantıdaki istekleri sırayla işle (keep-alive)"""
+        self.connections.add(writer)
+        try:
+            while True:
+                try:
+                    request = await read_request(reader)
+                    if request is None:
+                        break
+                    method, path, headers, body = request
+                    keep_alive = headers.get('connection', '').lower() != 'close'
+                    await self.route(writer, method, path, body, keep_alive)
+                except RequestError as e:
+                    await send_json(writer, e.status, {'error': str(e)}, keep_alive=False)
+                    break
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, asyncio.CancelledError):
+            pass  # İstemci koptu veya servis kapanıyor
+        finally:
+            self.connections.discard(writer)
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    async def route(self, writer, method, path, body, keep_alive):
+        if path == '/health':
+            if method != 'GET':
+                raise RequestError(405, "GET bekleniyordu")
+            await send_json(writer, 200, {'status': 'ok', 'workers': self.workers,
+                                          'jobs': self.counters}, keep_alive)
+        elif path == '/datasets':
+            if method != 'GET':
+                raise RequestError(405, "GET bekleniyordu")
+            await send_json(writer, 200, {'datasets': [
+                {'name': name, 'students': store.n_students, 'firms': store.n_firms}
+                for name, store in self.datasets.items()
+            ]}, keep_alive)
+        elif path == '/runs':
+            if method != 'POST':
+                raise RequestError(405, "POST bekleniyordu")
+            try:
+                job = self.new_job(json.loads(body or b'{}'))
+            except json.JSONDecodeError as e:
+                raise RequestError(400, f"Geçersiz JSON: {e}") from None
+            if job['stream']:
+                await self.stream_run(writer, job)
+            else:
+                try:
+                    result = await self.run(job)
+                except Exception as e:
+                    await send_json(writer, 500, {'error': str(e)}, keep_alive)
+                else:
+                    await send_json(writer, 200, result, keep_alive)
+        else:
+            raise RequestError(404, f"Bilinmeyen yol: {path}")
+
+
+# ==================== KOMUT SATIRI ====================
+
+def parse_dataset(spec):
+    """'ad=öğrenciler.csv,firmalar.csv' -> (ad, öğrenci yolu, firma yolu)"""
+    name, sep, paths = spec.partition('=')
+    students_path, comma, firms_path = paths.rpartition(',')
+    if not sep or not comma or not name:
+        raise ValueError(f"Geçersiz veri seti: {spec!r} (beklenen: ad=öğrenciler.csv,firmalar.csv)")
+    return name, students_path, firms_path
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Yerel eşleştirme servisi (JSON HTTP API)")
+    parser.add_argument('--host', default=DEFAULT_HOST, help="Dinlenecek adres")
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT, help="Port (0 = rastgele)")
+    parser.add_argument('--dataset', action='append', default=[],
+                        metavar='AD=ÖĞRENCİLER.csv,FİRMALAR.csv',
+                        help="Yüklenecek veri seti (tekrarlanabilir; varsayılan: "
+                             "default=students.csv,firms.csv)")
+    parser.add_argument('--no-cache', action='store_true',
+                        help="İkili veri önbelleğini kullanma, CSV'leri her seferinde oku")
+    parser.add_argument('-j', '--workers', type=int, default=None,
+                        help="Süreç sayısı (varsayılan: CPU sayısı)")
+    args = parser.parse_args(argv)
+    try:
+        args.dataset = [parse_dataset(spec) for spec in args.dataset]
+    except ValueError as e:
+        parser.error(str(e))
+    if not args.dataset:
+        args.dataset = [('default', "students.csv", "firms.csv")]
+    return args
+
+
+async def serve(args):
+    datasets = {}
+    for name, students_path, firms_path in args.dataset:
+        start = time.perf_counter()
+        datasets[name] = load_store(students_path, firms_path, cache=not args.no_cache)
+        print(f"Veri seti {name}: {datasets[name].n_students} öğrenci, "
+              f"{datasets[name].n_firms} firma ({time.perf_counter() - start:.2f}sn)",
+              flush=True)
+
+    service = MatchingService(datasets, args.workers)
+    try:
+        host, port = await service.start(args.host, args.port)
+        print(f"Dinleniyor: http://{host}:{port} ({service.workers} işçi)", flush=True)
+        # SIGINT/SIGTERM ile düzgün kapanış (Windows'ta KeyboardInterrupt)
+        stop = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(sig, stop.set)
+            except NotImplementedError:
+                pass
+        await stop.wait()
+    finally:
+        await service.close()
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    try:
+        asyncio.run(serve(args))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
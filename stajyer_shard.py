@@ -0,0 +1,309 @@
+"""
+Stajyer Yerleştirme Simülatörü - Parçalı (Sharded) Eşleştirme
+Bölge veya bölüm bazlı yerleştirmelerde öğrenci/firma grafiği parçalara ayrılır, her parçanın
+FAZ 1'i (tercih bazlı yerleştirme) ayrı bir işçi süreçte çalıştırılır ve sonuçlar
+birleştirilir. Ardından sadece artakalan öğrenciler için global FAZ 2/3 geçişi yapılır
+(tercih dışı ve zorunlu yerleştirme tüm firmalara açıktır).
+
+Parçalar iki şekilde belirlenir:
+- components (varsayılan): tercih grafiğinin bağlı bileşenleri. Bir öğrencinin tercih ettiği
+  firmalar aynı bileşendedir; bileşenler arasında hiçbir tercih yoktur, bu yüzden red
+  olasılığı 0 iken parçalı FAZ 1 global FAZ 1 ile aynı yerleştirmeyi verir. Küçük bileşenler
+  SHARD_BINS adet gruba toplanır (en büyükten başlayarak en hafif gruba).
+- declared: kullanıcının verdiği firma -> parça CSV'si (firma_id,parca). Öğrenci, parçası
+  tanımlı ilk tercihinin parçasına girer; başka parçalardaki tercihleri parça içinde yok
+  sayılır, global geçişin tercih adımında tekrar denenir. Dosyada olmayan firmalar sadece
+  global geçişte kullanılır.
+
+Örnek:
+    python3 stajyer_shard.py -a heuristic -j 4 --compare
+    python3 stajyer_shard.py --shard-file regions.csv -o yerlesimler.csv
+"""
+
+import argparse
+import csv
+import os
+import random
+import sys
+import time
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+
+from stajyer_core import ALGORITHMS, LOG_DEBUG, LOG_INFO, LOG_OFF, PlacementState, load_store
+from stajyer_report import PlacementReport
+from stajyer_store import NO_FIRM
+
+SHARD_ALGORITHMS = ('greedy', 'heuristic')  # Faz tabanlı algoritmalar (start_phase/max_phase)
+SHARD_BINS = 32                             # Bileşenlerin toplandığı en fazla grup sayısı
+NO_SHARD = -1                               # Hiçbir parçaya girmeyen öğrenci/firma
+
+
+# ==================== PARÇALAMA ====================
+
+def component_shards(store):
+    """
+    Tercih grafiğinin bağlı bileşenleri (union-find)
+    Dönüş: (öğrenci -> parça dizisi, firma -> parça dizisi, parça sayısı)
+    Geçerli tercihi olmayan öğrenciler ve kimsenin tercih etmediği firmalar NO_SHARD'dır.
+    """
+    parent = list(range(store.n_firms))
+
+    def find(firm):
+        root = firm
+        while parent[root] != root:
+            root = parent[root]
+        while parent[firm] != root:  # Yol sıkıştırma
+            parent[firm], firm = root, parent[firm]
+        return root
+
+    width = store.width
+    prefs = store.prefs
+    first = array('i', [NO_FIRM]) * store.n_students
+    for student in range(store.n_students):
+        start = student * width
+        root = NO_FIRM
+        for firm in prefs[start:start + width]:
+            if firm == NO_FIRM:
+                continue
+            if root == NO_FIRM:
+                root = find(firm)
+                first[student] = firm
+            else:
+                other = find(firm)
+                if other != root:
+                    parent[other] = root
+
+    shard_of_root = {}
+    firm_shard = array('i', [NO_SHARD]) * store.n_firms
+    student_shard = array('i', [NO_SHARD]) * store.n_students
+    for student, firm in enumerate(first):
+        if firm != NO_FIRM:
+            root = find(firm)
+            shard = shard_of_root.setdefault(root, len(shard_of_root))
+            student_shard[student] = shard
+    for firm in range(store.n_firms):
+        root = find(firm)
+        if root in shard_of_root:
+            firm_shard[firm] = shard_of_root[root]
+    return student_shard, firm_shard, len(shard_of_root)
+
+
+def load_shard_file(filepath, store):
+    """
+    firma_id,parca CSV'sini oku -> firma -> parça dizisi ve parça adları
+    Depoda olmayan firma ValueError verir; dosyada olmayan firmalar NO_SHARD kalır.
+    """
+    firm_shard = array('i', [NO_SHARD]) * store.n_firms
+    names = {}
+    with open(filepath, 'r', encoding='utf-8') as f:
+        reader = csv.reader(f)
+        next(reader, None)  # Başlık satırı
+        for line, row in enumerate(reader, 2):
+            if not row:
+                continue
+            if len(row) < 2:
+                raise ValueError(f"{filepath}:{line}: firma_id,parca bekleniyordu")
+            firm = store.firm_index.get(row[0].strip())
+            if firm is None:
+                raise ValueError(f"{filepath}:{line}: bilinmeyen firma {row[0].strip()!r}")
+            firm_shard[firm] = names.setdefault(row[1].strip(), len(names))
+    return firm_shard, list(names)
+
+
+def declared_shards(store, firm_shard, n_shards):
+    """
+    Firma parçalarından öğrenci parçaları: parçası tanımlı ilk tercihin parçası
+    Dönüş: component_shards ile aynı biçim
+    """
+    width = store.width
+    prefs = store.prefs
+    student_shard = array('i', [NO_SHARD]) * store.n_students
+    for student in range(store.n_students):
+        start = student * width
+        for firm in prefs[start:start + width]:
+            if firm != NO_FIRM and firm_shard[firm] != NO_SHARD:
+                student_shard[student] = firm_shard[firm]
+                break
+    return student_shard, firm_shard, n_shards
+
+
+def group_shards(student_shard, firm_shard, n_shards):
+    """Parça başına (öğrenciler, firmalar) indeks listeleri - artan sırada"""
+    groups = [([], []) for _ in range(n_shards)]
+    for student, shard in enumerate(student_shard):
+        if shard != NO_SHARD:
+            groups[shard][0].append(student)
+    for firm, shard in enumerate(firm_shard):
+        if shard != NO_SHARD:
+            groups[shard][1].append(firm)
+    return groups
+
+
+def pack_shards(groups, bins=SHARD_BINS):
+    """
+    Küçük parçaları en fazla `bins` gruba topla (en büyükten başlayarak en hafif gruba)
+    Sadece birbirine tercih bağı olmayan parçalar (bileşenler) toplanmalıdır; aksi halde
+    aynı gruba düşen parçalar arasındaki tercihler geri gelir.
+    """
+    groups = [group for group in groups if group[0]]
+    if len(groups) <= bins:
+        return groups
+    packed = [([], []) for _ in range(bins)]
+    loads = [0] * bins
+    for students, firms in sorted(groups, key=lambda group: -len(group[0])):
+        target = loads.index(min(loads))
+        packed[target][0].extend(students)
+        packed[target][1].extend(firms)
+        loads[target] += len(students)
+    for students, firms in packed:
+        students.sort()
+        firms.sort()
+    return packed
+
+
+# ==================== İŞÇİ SÜREÇLER ====================
+
+def match_shard(task):
+    """Bir parçanın FAZ 1'i: (alt depo, algoritma, tohum, parametreler) -> (atama, özet)"""
+    sub_store, algorithm, seed, params = task
+    state = PlacementState(sub_store)
+    metrics = ALGORITHMS[algorithm](sub_store, state, None, random.Random(seed), LOG_OFF,
+                                    params=params, max_phase=1)
+    return state.assigned, {
+        'students': sub_store.n_students,
+        'firms': sub_store.n_firms,
+        'placed': sub_store.n_students - len(state.unplaced),
+        'iterations': metrics['total_iterations'],
+        'rejections': metrics['rejections'],
+        'time': metrics['total_time'],
+    }
+
+
+# ==================== PARÇALI EŞLEŞTİRME ====================
+
+def run_sharded(store, state=None, log_callback=None, rng=None, log_level=LOG_DEBUG,
+                algorithm='greedy', params=None, firm_shards=None, workers=None,
+                bins=SHARD_BINS):
+    """
+    Parçalı eşleştirme: parça başına FAZ 1 (süreç havuzunda), birleştirme, global FAZ 2/3
+    state verilirse önce sıfırlanır ve sonuç oraya yazılır
+    rng: parça tohumları ve global geçiş için random.Random örneği
+    algorithm: SHARD_ALGORITHMS'tan biri
+    firm_shards: (firma -> parça dizisi, parça sayısı) - verilmezse bağlı bileşenler
+    workers: süreç sayısı (None = CPU sayısı, 1 = aynı süreçte)
+    Dönüş: global geçişin metrikleri + 'shards' (parça başına özet) ve 'shard_time';
+    total_time parçalama dahil toplam süredir
+    """
+    if algorithm not in SHARD_ALGORITHMS:
+        raise ValueError(f"Parçalı eşleştirme sadece {', '.join(SHARD_ALGORITHMS)} "
+                         f"için kullanılabilir: {algorithm!r}")
+    start = time.perf_counter()
+    rng = rng or random
+    log_info = log_callback is not None and log_level <= LOG_INFO
+
+    if firm_shards is None:
+        groups = pack_shards(group_shards(*component_shards(store)), bins)
+    else:
+        # Tanımlı parçalar arasında tercih bağı olabilir, gruplanmaz
+        groups = [group for group in group_shards(*declared_shards(store, *firm_shards))
+                  if group[0]]
+    tasks = [(store.subset(students, firms), algorithm, rng.getrandbits(64), params)
+             for students, firms in groups]
+    sharded = sum(len(students) for students, _ in groups)
+    if log_info:
+        log_callback(f"{len(groups)} parça, parçalarda {sharded} öğrenci, "
+                     f"parça dışında {store.n_students - sharded} öğrenci")
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers <= 1 or len(tasks) <= 1:
+        results = [match_shard(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=min(workers, len(tasks))) as executor:
+            results = list(executor.map(match_shard, tasks))
+    shard_time = time.perf_counter() - start
+
+    # Birleştirme: alt depo indeksleri global indekslere çevrilir
+    if state is None:
+        state = PlacementState(store)
+    else:
+        state.reset()
+    for (students, firms), (assigned, summary) in zip(groups, results):
+        for local, firm in enumerate(assigned):
+            if firm != NO_FIRM:
+                state.place(students[local], firms[firm])
+    if log_info:
+        log_callback(f"Parçalarda yerleşen: {sum(summary['placed'] for _, summary in results)}, "
+                     f"global geçişe kalan: {len(state.unplaced)} ({shard_time:.2f}sn)")
+
+    metrics = ALGORITHMS[algorithm](store, state, log_callback, rng, log_level,
+                                    params=params, start_phase=2)
+    metrics['shards'] = [summary for _, summary in results]
+    metrics['shard_time'] = shard_time
+    metrics['total_time'] = time.perf_counter() - start
+    metrics['total_time_ns'] = int(metrics['total_time'] * 1e9)
+    return metrics
+
+
+# ==================== KOMUT SATIRI ====================
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Bölge/bölüm parçalarında paralel FAZ 1 ve global artakalan geçişi"
+    )
+    parser.add_argument('-a', '--algorithm', default='greedy', choices=SHARD_ALGORITHMS,
+                        help="Parça içinde ve global geçişte kullanılacak algoritma")
+    parser.add_argument('--seed', type=int, default=None, help="Rastgele tohum")
+    parser.add_argument('-j', '--workers', type=int, default=None,
+                        help="Süreç sayısı (varsayılan: CPU sayısı)")
+    parser.add_argument('--shard-file', default=None,
+                        help="firma_id,parca CSV'si (verilmezse bağlı bileşenler)")
+    parser.add_argument('--bins', type=int, default=SHARD_BINS,
+                        help="Bileşenlerin toplanacağı en fazla grup sayısı")
+    parser.add_argument('--compare', action='store_true',
+                        help="Aynı algoritmayı parçasız da çalıştırıp karşılaştır")
+    parser.add_argument('--students', default="students.csv", help="Öğrenci CSV dosyası")
+    parser.add_argument('--firms', default="firms.csv", help="Firma CSV dosyası")
+    parser.add_argument('--no-cache', action='store_true',
+                        help="İkili veri önbelleğini kullanma, CSV'leri her seferinde oku")
+    parser.add_argument('-v', '--verbose', action='store_true', help="İterasyon ayrıntıları")
+    parser.add_argument('-o', '--output', default=None, help="Yerleştirme CSV çıktısı")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    store = load_store(args.students, args.firms, cache=not args.no_cache)
+    firm_shards = None
+    if args.shard_file:
+        try:
+            firm_shard, names = load_shard_file(args.shard_file, store)
+        except (OSError, ValueError) as e:
+            print(f"Hata: {e}", file=sys.stderr)
+            return 2
+        firm_shards = (firm_shard, len(names))
+
+    state = PlacementState(store)
+    metrics = run_sharded(store, state, print, random.Random(args.seed),
+                          LOG_DEBUG if args.verbose else LOG_INFO, args.algorithm,
+                          firm_shards=firm_shards, workers=args.workers, bins=args.bins)
+    report = PlacementReport(state)
+    print(f"\nParçalı {args.algorithm}: memnuniyet {metrics['satisfaction_score']}, "
+          f"{metrics['total_time']:.2f}sn (parçalar {metrics['shard_time']:.2f}sn)")
+    for line in report.summary_lines()[1:]:
+        print(line)
+
+    if args.compare:
+        baseline = ALGORITHMS[args.algorithm](store, PlacementState(store), None,
+                                              random.Random(args.seed), LOG_OFF)
+        print(f"\nParçasız {args.algorithm}: memnuniyet {baseline['satisfaction_score']}, "
+              f"{baseline['total_time']:.2f}sn, {baseline['total_iterations']} iterasyon")
+
+    if args.output:
+        report.write_csv(args.output)
+        print(f"\nYerleştirmeler yazıldı: {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
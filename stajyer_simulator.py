@@ -1,449 +1,173 @@
 """
 Stajyer Yerleştirme Simülatörü
-Greedy ve Heuristic algoritmaları ile öğrenci-firma eşleştirmesi
+Greedy, Heuristic, Ertelenmiş Kabul ve Optimal algoritmaları ile öğrenci-firma eşleştirmesi
+
+Açılış süresi için GUI modülleri (tkinter) ve raporlama (stajyer_report, NumPy) ilk
+kullanıldıklarında yüklenir: modülü içe aktarmak sadece çekirdeği yükler. Pencere hemen
+çizilir, veriler arka plan thread'inde okunur (bkz. benchmarks/bench_startup.py).
 """
 
-import csv
-import random
+import queue
+import threading
 import time
-import tkinter as tk
-from tkinter import ttk, scrolledtext
-from copy import deepcopy
-
-# ==================== VERİ YAPILARI ====================
-
-class Student:
-    def __init__(self, student_id, preferences, gno):
-        self.id = student_id
-        self.preferences = preferences  # 5 firma tercihi listesi
-        self.gno = gno
-        self.assigned_firm = None
-        self.is_placed = False
-
-class Firm:
-    def __init__(self, firm_id, capacity):
-        self.id = firm_id
-        self.capacity = capacity
-        self.current_capacity = capacity
-        self.assigned_students = []
-
-# ==================== CSV OKUMA ====================
-
-def load_students(filepath="students.csv"):
-    """students.csv dosyasını oku"""
-    students = []
-    with open(filepath, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            prefs = row['preferences'].split(',')
-            student = Student(
-                student_id=row['student_id'],
-                preferences=prefs,
-                gno=float(row['gno'])
-            )
-            students.append(student)
-    return students
-
-def load_firms(filepath="firms.csv"):
-    """firms.csv dosyasını oku"""
-    firms = {}
-    with open(filepath, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            firm_id = row['firma_id'].strip()
-            firm = Firm(
-                firm_id=firm_id,
-                capacity=int(row['kapasite'])
-            )
-            firms[firm_id] = firm
-    return firms
-
-# ==================== YARDIMCI FONKSİYONLAR ====================
-
-def reset_data(students, firms):
-    """Verileri başlangıç durumuna sıfırla"""
-    for s in students:
-        s.assigned_firm = None
-        s.is_placed = False
-    for f in firms.values():
-        f.current_capacity = f.capacity
-        f.assigned_students = []
-
-def get_unplaced_students(students):
-    """Yerleşmemiş öğrencileri döndür"""
-    return [s for s in students if not s.is_placed]
-
-def get_available_firms(firms):
-    """Boş kontenjanı olan firmaları döndür"""
-    return {fid: f for fid, f in firms.items() if f.current_capacity > 0}
-
-def place_student(student, firm):
-    """Öğrenciyi firmaya yerleştir"""
-    student.assigned_firm = firm.id
-    student.is_placed = True
-    firm.current_capacity -= 1
-    firm.assigned_students.append(student.id)
-
-def firm_rejection(students, firms, placed_this_iteration):
-    """
-    Firma reddetme mekanizması - %30 red olasılığı
-    Reddedilen öğrenciler tekrar yerleşmemiş olur
-    """
-    rejected = []
-    for student_id in placed_this_iteration:
-        if random.random() < 0.30:  # %30 red olasılığı
-            # Öğrenciyi bul
-            student = next(s for s in students if s.id == student_id)
-            firm = firms[student.assigned_firm]
-
-            # Reddet
-            student.is_placed = False
-            student.assigned_firm = None
-            firm.current_capacity += 1
-            firm.assigned_students.remove(student_id)
-            rejected.append(student_id)
-
-    return rejected
-
-def calculate_satisfaction_score(students):
-    """
-    Memnuniyet skoru hesapla
-    1. tercih = 5 puan, 2. tercih = 4 puan, ..., 5. tercih = 1 puan
-    Tercih dışı yerleşme = 0 puan
-    """
-    total_score = 0
-    for s in students:
-        if s.is_placed and s.assigned_firm:
-            if s.assigned_firm in s.preferences:
-                pref_index = s.preferences.index(s.assigned_firm)
-                total_score += (5 - pref_index)  # 1. tercih = 5, 5. tercih = 1
-            # Tercih dışı = 0 puan
-    return total_score
-
-# ==================== GREEDY ALGORİTMASI ====================
-
-def greedy_algorithm(students, firms, log_callback=None):
-    """
-    Greedy (Açgözlü) Algoritma
-    - Öğrenciler GNO'ya göre sıralanır
-    - Her öğrenci tercihlerine sırayla bakar
-    - İlk boş firmaya yerleşir
-    """
-    reset_data(students, firms)
-
-    metrics = {
-        'total_iterations': 0,
-        'total_operations': 0,
-        'start_time': time.time(),
-        'phase_changes': [],
-        'rejections': 0
-    }
-
-    current_phase = 1
-    no_progress_count = 0
-
-    def log(msg):
-        if log_callback:
-            log_callback(msg)
-
-    log("=" * 50)
-    log("GREEDY ALGORİTMASI BAŞLADI")
-    log("=" * 50)
-
-    while True:
-        unplaced = get_unplaced_students(students)
-
-        if not unplaced:
-            log("\nTüm öğrenciler yerleşti!")
-            break
-
-        metrics['total_iterations'] += 1
-        iteration = metrics['total_iterations']
-
-        # GNO'ya göre sırala (yüksekten düşüğe)
-        unplaced.sort(key=lambda x: x.gno, reverse=True)
-
-        placed_this_iteration = []
-
-        log(f"\n--- İterasyon {iteration} (Faz {current_phase}) ---")
-        log(f"Yerleşmemiş öğrenci sayısı: {len(unplaced)}")
-
-        for student in unplaced:
-            available = get_available_firms(firms)
-
-            if not available:
-                break
-
-            placed = False
-
-            # FAZ 1 ve FAZ 2: Tercih bazlı yerleştirme
-            if current_phase <= 2:
-                # Önce tercihlere bak
-                for pref in student.preferences:
-                    metrics['total_operations'] += 1
-                    if pref in available:
-                        place_student(student, firms[pref])
-                        placed_this_iteration.append(student.id)
-                        placed = True
-                        break
-
-                # FAZ 2: Tercih dışı yerleştirme
-                if not placed and current_phase == 2:
-                    # Boş kontenjanı olan rastgele firmaya yerleştir
-                    available_list = list(available.values())
-                    if available_list:
-                        random_firm = random.choice(available_list)
-                        metrics['total_operations'] += 1
-                        place_student(student, random_firm)
-                        placed_this_iteration.append(student.id)
-                        placed = True
-
-            # FAZ 3: Zorunlu yerleştirme
-            elif current_phase == 3:
-                available_list = list(available.values())
-                if available_list:
-                    # İlk boş firmaya yerleştir
-                    metrics['total_operations'] += 1
-                    place_student(student, available_list[0])
-                    placed_this_iteration.append(student.id)
-
-        log(f"Bu iterasyonda yerleşen: {len(placed_this_iteration)}")
-
-        # Firma reddetme (FAZ 3'te yok)
-        if current_phase < 3 and placed_this_iteration:
-            rejected = firm_rejection(students, firms, placed_this_iteration)
-            metrics['rejections'] += len(rejected)
-            if rejected:
-                log(f"Reddedilen öğrenci sayısı: {len(rejected)}")
-
-        # İlerleme kontrolü
-        if len(placed_this_iteration) == 0:
-            no_progress_count += 1
-        else:
-            no_progress_count = 0
-
-        # Faz geçişleri
-        if no_progress_count >= 5 and current_phase < 3:
-            current_phase += 1
-            no_progress_count = 0
-            metrics['phase_changes'].append((iteration, current_phase))
-            log(f"\n*** FAZ {current_phase}'e geçildi ***")
-
-    metrics['end_time'] = time.time()
-    metrics['total_time'] = metrics['end_time'] - metrics['start_time']
-    metrics['satisfaction_score'] = calculate_satisfaction_score(students)
-
-    log("\n" + "=" * 50)
-    log("GREEDY SONUÇLARI")
-    log("=" * 50)
-    log(f"Toplam iterasyon: {metrics['total_iterations']}")
-    log(f"Toplam işlem: {metrics['total_operations']}")
-    log(f"Toplam süre: {metrics['total_time']:.4f} saniye")
-    log(f"Memnuniyet skoru: {metrics['satisfaction_score']}")
-    log(f"Toplam red sayısı: {metrics['rejections']}")
-
-    return metrics
-
-# ==================== HEURİSTİC ALGORİTMASI ====================
-
-def calculate_match_score(student, firm, firms, is_preference):
-    """
-    Eşleşme skoru hesapla
-    Tercih içi: Skor = (GNO × 0.4) + (Tercih × 0.3) + (Uygunluk × 0.3)
-    Tercih dışı: Skor = (GNO × 0.4) + (Uygunluk × 0.3)
-    """
-    # GNO skoru (0-4 arası normalize edilmiş)
-    gno_score = student.gno / 4.0
-
-    # Tercih skoru
-    if is_preference and firm.id in student.preferences:
-        pref_index = student.preferences.index(firm.id)
-        pref_score = (5 - pref_index) / 5.0  # 1. tercih = 1.0, 5. tercih = 0.2
-    else:
-        pref_score = 0
-
-    # Uygunluk skoru (basit: firma kapasitesi bazlı)
-    # Daha az dolu firmalar daha yüksek skor
-    fill_ratio = 1 - (firm.current_capacity / firm.capacity) if firm.capacity > 0 else 0
-    compat_score = 1 - fill_ratio  # Boş firmalar daha yüksek skor
-
-    if is_preference:
-        score = (gno_score * 0.4) + (pref_score * 0.3) + (compat_score * 0.3)
-    else:
-        score = (gno_score * 0.4) + (compat_score * 0.3)
-
-    return score
-
-def heuristic_algorithm(students, firms, log_callback=None):
-    """
-    Heuristic (Sezgisel) Algoritma
-    - Puanlama tabanlı yerleştirme
-    - En yüksek skorlu eşleşmeler öncelikli
-    """
-    reset_data(students, firms)
-
-    metrics = {
-        'total_iterations': 0,
-        'total_operations': 0,
-        'start_time': time.time(),
-        'phase_changes': [],
-        'rejections': 0
-    }
-
-    current_phase = 1
-    no_progress_count = 0
-
-    def log(msg):
-        if log_callback:
-            log_callback(msg)
-
-    log("=" * 50)
-    log("HEURİSTİC ALGORİTMASI BAŞLADI")
-    log("=" * 50)
-
-    while True:
-        unplaced = get_unplaced_students(students)
-
-        if not unplaced:
-            log("\nTüm öğrenciler yerleşti!")
-            break
-
-        metrics['total_iterations'] += 1
-        iteration = metrics['total_iterations']
-
-        placed_this_iteration = []
-
-        log(f"\n--- İterasyon {iteration} (Faz {current_phase}) ---")
-        log(f"Yerleşmemiş öğrenci sayısı: {len(unplaced)}")
-
-        # FAZ 1 ve FAZ 2: Skor bazlı yerleştirme
-        if current_phase <= 2:
-            # Tüm olası eşleşmeleri skorla
-            matches = []
-
-            for student in unplaced:
-                available = get_available_firms(firms)
-
-                if current_phase == 1:
-                    # Sadece tercih listesindeki firmalar
-                    candidate_firms = [f for f in student.preferences if f in available]
-                else:
-                    # Tüm firmalar
-                    candidate_firms = list(available.keys())
-
-                for firm_id in candidate_firms:
-                    metrics['total_operations'] += 1
-                    is_pref = firm_id in student.preferences
-                    score = calculate_match_score(student, firms[firm_id], firms, is_pref)
-                    matches.append((score, student, firms[firm_id]))
-
-            # Skorlara göre sırala (yüksekten düşüğe)
-            matches.sort(key=lambda x: x[0], reverse=True)
-
-            # En yüksek skorlu eşleşmeleri yap
-            placed_students = set()
-            used_firms = set()
-
-            for score, student, firm in matches:
-                if student.id in placed_students:
-                    continue
-                if firm.id in used_firms and firm.current_capacity <= 0:
-                    continue
-                if firms[firm.id].current_capacity <= 0:
-                    continue
-
-                place_student(student, firms[firm.id])
-                placed_this_iteration.append(student.id)
-                placed_students.add(student.id)
-
-                if firms[firm.id].current_capacity <= 0:
-                    used_firms.add(firm.id)
-
-        # FAZ 3: Zorunlu yerleştirme
-        elif current_phase == 3:
-            # GNO'ya göre sırala
-            unplaced.sort(key=lambda x: x.gno, reverse=True)
-
-            for student in unplaced:
-                available = get_available_firms(firms)
-                if available:
-                    metrics['total_operations'] += 1
-                    first_available = list(available.values())[0]
-                    place_student(student, first_available)
-                    placed_this_iteration.append(student.id)
-
-        log(f"Bu iterasyonda yerleşen: {len(placed_this_iteration)}")
-
-        # Firma reddetme (FAZ 3'te yok)
-        if current_phase < 3 and placed_this_iteration:
-            rejected = firm_rejection(students, firms, placed_this_iteration)
-            metrics['rejections'] += len(rejected)
-            if rejected:
-                log(f"Reddedilen öğrenci sayısı: {len(rejected)}")
-
-        # İlerleme kontrolü
-        if len(placed_this_iteration) == 0:
-            no_progress_count += 1
-        else:
-            no_progress_count = 0
-
-        # Faz geçişleri
-        if no_progress_count >= 5 and current_phase < 3:
-            current_phase += 1
-            no_progress_count = 0
-            metrics['phase_changes'].append((iteration, current_phase))
-            log(f"\n*** FAZ {current_phase}'e geçildi ***")
-
-    metrics['end_time'] = time.time()
-    metrics['total_time'] = metrics['end_time'] - metrics['start_time']
-    metrics['satisfaction_score'] = calculate_satisfaction_score(students)
-
-    log("\n" + "=" * 50)
-    log("HEURİSTİC SONUÇLARI")
-    log("=" * 50)
-    log(f"Toplam iterasyon: {metrics['total_iterations']}")
-    log(f"Toplam işlem: {metrics['total_operations']}")
-    log(f"Toplam süre: {metrics['total_time']:.4f} saniye")
-    log(f"Memnuniyet skoru: {metrics['satisfaction_score']}")
-    log(f"Toplam red sayısı: {metrics['rejections']}")
-
-    return metrics
-
-# ==================== SONUÇ GÖSTERME ====================
-
-def get_placement_details(students):
-    """Yerleştirme detaylarını döndür"""
-    details = []
-    for s in students:
-        if s.is_placed:
-            pref_info = ""
-            if s.assigned_firm in s.preferences:
-                pref_num = s.preferences.index(s.assigned_firm) + 1
-                pref_info = f"({pref_num}. tercih)"
-            else:
-                pref_info = "(tercih dışı)"
-            details.append(f"{s.id} -> {s.assigned_firm} {pref_info}")
-    return details
+
+from stajyer_core import (
+    LOG_DEBUG,
+    LOG_INFO,
+    LOG_OFF,
+    Student,
+    Firm,
+    PlacementState,
+    load_students,
+    load_firms,
+    load_store,
+    reset_data,
+    get_unplaced_students,
+    get_available_firms,
+    place_student,
+    firm_rejection,
+    calculate_satisfaction_score,
+    greedy_algorithm,
+    run_greedy,
+    calculate_match_score,
+    heuristic_algorithm,
+    run_heuristic,
+    deferred_algorithm,
+    run_deferred,
+    optimal_algorithm,
+    run_optimal,
+)
+from stajyer_progress import COLUMN_WIDTH, REDRAW_INTERVAL_MS, ProgressModel
 
 # ==================== GUI ====================
 
+# tkinter modülleri SimulatorGUI oluşturulurken yüklenir (_load_gui)
+tk = ttk = scrolledtext = None
+
+def _load_gui():
+    """tkinter, ttk ve scrolledtext'i ilk GUI oluşturulurken içe aktar"""
+    global tk, ttk, scrolledtext
+    if tk is None:
+        import tkinter
+        from tkinter import scrolledtext as tk_scrolledtext, ttk as tk_ttk
+        tk, ttk, scrolledtext = tkinter, tk_ttk, tk_scrolledtext
+
+LOG_QUEUE_SIZE = 10000      # Log kuyruğu sınırı; dolarsa yeni mesajlar atlanır
+LOG_DRAIN_INTERVAL_MS = 50  # Kuyruğun ekrana yazılma aralığı
+LOG_DRAIN_BATCH = 2000      # Bir seferde ekrana yazılan en fazla mesaj
+LOAD_POLL_INTERVAL_MS = 50  # Arka planda veri yüklemesinin kontrol aralığı
+HISTORY_RUNS_SHOWN = 200    # Karşılaştırma sekmesinde seçilebilen son çalıştırma sayısı
+DIFF_ROWS_SHOWN = 500       # Fark görünümünde listelenen en fazla öğrenci
+PROGRESS_TAB = 3            # İlerleme sekmesinin notebook sırası
+
+LOG_LEVELS = {
+    "Ayrıntılı": LOG_DEBUG,
+    "Özet": LOG_INFO,
+    "Kapalı": LOG_OFF,
+}
+
 class SimulatorGUI:
-    def __init__(self):
+    def __init__(self, students_path="students.csv", firms_path="firms.csv",
+                 history_path=None):
+        _load_gui()
         self.root = tk.Tk()
         self.root.title("Stajyer Yerleştirme Simülatörü")
         self.root.geometry("900x700")
 
-        # Verileri yükle
-        self.students = load_students()
-        self.firms = load_firms()
+        # Veriler arka planda yüklenir (değişmez depo + her çalıştırmada sıfırlanan durum);
+        # yükleme bitene kadar butonlar kapalıdır
+        self.store = None
+        self.state = None
+        self.load_error = None
+        self.loader = threading.Thread(target=self.load_data,
+                                       args=(students_path, firms_path, history_path),
+                                       daemon=True)
+
+        # Algoritmalar arka plan thread'inde çalışır; loglar sınırlı bir kuyruğa yazılır
+        # ve after() ile toplu olarak ekrana aktarılır
+        self.log_queue = queue.Queue(maxsize=LOG_QUEUE_SIZE)
+        self.dropped_logs = 0
+        self.reported_dropped_logs = 0
+        self.worker = None
+        self.worker_result = None
+
+        # İlerleme sekmesi: algoritma thread'i iterasyon kayıtlarını (IterationDelta)
+        # kuyruğa koyar; ana thread bunları modele uygular ve en fazla
+        # REDRAW_INTERVAL_MS'de bir çizer
+        self.progress_events = queue.SimpleQueue()
+        self.progress_model = None
+        self.progress_dirty = False
+        self.progress_drawn_at = 0.0
+        self.progress_bars = []     # Sütun dikdörtgenleri (çalıştırmalar arasında yeniden kullanılır)
+        self.progress_heights = []  # Son çizilen sütun yükseklikleri (değişmeyen çizilmez)
 
         # Sonuçları sakla
         self.greedy_metrics = None
         self.heuristic_metrics = None
         self.greedy_placements = None
         self.heuristic_placements = None
+        self.deferred_metrics = None
+        self.deferred_placements = None
+        self.optimal_metrics = None
+        self.optimal_placements = None
+
+        # Yerleştirme sekmesi: rapor ve gösterilen sayfa
+        self.placement_report = None
+        self.placement_title = ""
+        self.placement_page = 0
+
+        # Çalıştırma geçmişi (stajyer_history); yükleme thread'inde açılır. Verilmezse
+        # veri dosyalarının klasöründeki stajyer_history.db kullanılır (çalışma klasörü değil)
+        self.history = None
+        self.history_error = None
+        self.history_runs = {}  # Seçim listesindeki etiket -> çalıştırma no
 
         self.setup_ui()
+        self.loader.start()
+        self.root.after(LOAD_POLL_INTERVAL_MS, self.poll_loader)
+
+    # ---------- Veri yükleme ----------
+
+    def load_data(self, students_path, firms_path, history_path=None):
+        """Depoyu ve durumu oku (yükleme thread'i; tkinter'a dokunmaz)"""
+        try:
+            store = load_store(students_path, firms_path, cache=True)
+            self.state = PlacementState(store)
+            self.store = store
+        except Exception as e:
+            self.load_error = e
+            return
+        # Geçmiş açılamazsa simülatör geçmişsiz çalışır
+        try:
+            from stajyer_history import RunStore, default_history_path
+            if history_path is None:
+                history_path = default_history_path(students_path)
+            self.history = RunStore(history_path, check_same_thread=False)
+        except Exception as e:
+            self.history_error = e
+
+    def poll_loader(self):
+        """Yükleme bitince butonları aç ve veri özetini göster (ana thread, after() ile)"""
+        if self.loader.is_alive():
+            self.root.after(LOAD_POLL_INTERVAL_MS, self.poll_loader)
+            return
+        self.progress.stop()
+        self.progress.pack_forget()
+        if self.load_error is not None:
+            self.info_label.config(text=f"Veriler yüklenemedi: {self.load_error}")
+            return
+        self.info_label.config(
+            text=f"Toplam {self.store.n_students} öğrenci, {self.store.n_firms} firma"
+        )
+        self.set_buttons_state(tk.NORMAL)
+        if self.history_error is not None:
+            self.log_text.insert(tk.END, f"Çalıştırma geçmişi açılamadı: {self.history_error}\n")
+        self.refresh_history()
+
+    def set_buttons_state(self, state):
+        for button in (self.btn_greedy, self.btn_heuristic, self.btn_deferred, self.btn_optimal,
+                       self.btn_compare):
+            button.config(state=state)
 
     def setup_ui(self):
         # Üst frame - Butonlar
@@ -468,6 +192,24 @@ class SimulatorGUI:
         )
         self.btn_heuristic.pack(side=tk.LEFT, padx=10)
 
+        self.btn_deferred = tk.Button(
+            btn_frame,
+            text="Run Gale-Shapley",
+            command=self.run_deferred,
+            width=15,
+            height=2
+        )
+        self.btn_deferred.pack(side=tk.LEFT, padx=10)
+
+        self.btn_optimal = tk.Button(
+            btn_frame,
+            text="Run Optimal",
+            command=self.run_optimal,
+            width=15,
+            height=2
+        )
+        self.btn_optimal.pack(side=tk.LEFT, padx=10)
+
         self.btn_compare = tk.Button(
             btn_frame,
             text="Compare Results",
@@ -477,6 +219,16 @@ class SimulatorGUI:
         )
         self.btn_compare.pack(side=tk.LEFT, padx=10)
 
+        tk.Label(btn_frame, text="Log:").pack(side=tk.LEFT, padx=(10, 2))
+        self.log_level_var = tk.StringVar(value="Ayrıntılı")
+        ttk.Combobox(
+            btn_frame,
+            textvariable=self.log_level_var,
+            values=list(LOG_LEVELS),
+            state="readonly",
+            width=10
+        ).pack(side=tk.LEFT)
+
         # Notebook (sekmeli görünüm)
         self.notebook = ttk.Notebook(self.root)
         self.notebook.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
@@ -492,6 +244,21 @@ class SimulatorGUI:
         placement_frame = tk.Frame(self.notebook)
         self.notebook.add(placement_frame, text="Yerleştirmeler")
 
+        page_frame = tk.Frame(placement_frame)
+        page_frame.pack(fill=tk.X)
+        self.btn_prev_page = tk.Button(
+            page_frame, text="◀ Önceki", state=tk.DISABLED,
+            command=lambda: self.show_placement_page(self.placement_page - 1)
+        )
+        self.btn_prev_page.pack(side=tk.LEFT, padx=5, pady=2)
+        self.page_label = tk.Label(page_frame, text="")
+        self.page_label.pack(side=tk.LEFT, padx=5)
+        self.btn_next_page = tk.Button(
+            page_frame, text="Sonraki ▶", state=tk.DISABLED,
+            command=lambda: self.show_placement_page(self.placement_page + 1)
+        )
+        self.btn_next_page.pack(side=tk.LEFT, padx=5, pady=2)
+
         self.placement_text = scrolledtext.ScrolledText(placement_frame, wrap=tk.WORD)
         self.placement_text.pack(fill=tk.BOTH, expand=True)
 
@@ -499,65 +266,297 @@ class SimulatorGUI:
         compare_frame = tk.Frame(self.notebook)
         self.notebook.add(compare_frame, text="Karşılaştırma")
 
+        history_frame = tk.Frame(compare_frame)
+        history_frame.pack(fill=tk.X)
+        tk.Label(history_frame, text="Çalıştırma A:").pack(side=tk.LEFT, padx=(5, 2), pady=2)
+        self.history_a_var = tk.StringVar()
+        self.history_a = ttk.Combobox(history_frame, textvariable=self.history_a_var,
+                                      state="readonly", width=45)
+        self.history_a.pack(side=tk.LEFT)
+        tk.Label(history_frame, text="B:").pack(side=tk.LEFT, padx=(10, 2))
+        self.history_b_var = tk.StringVar()
+        self.history_b = ttk.Combobox(history_frame, textvariable=self.history_b_var,
+                                      state="readonly", width=45)
+        self.history_b.pack(side=tk.LEFT)
+        tk.Button(history_frame, text="Farkı Göster",
+                  command=self.show_history_diff).pack(side=tk.LEFT, padx=5)
+        tk.Button(history_frame, text="Geçmiş Özeti",
+                  command=self.show_history_summary).pack(side=tk.LEFT)
+
         self.compare_text = scrolledtext.ScrolledText(compare_frame, wrap=tk.WORD)
         self.compare_text.pack(fill=tk.BOTH, expand=True)
 
-        # Bilgi etiketi
-        info_label = tk.Label(
-            self.root,
-            text=f"Toplam {len(self.students)} öğrenci, {len(self.firms)} firma"
-        )
-        info_label.pack(pady=5)
+        # İlerleme sekmesi (firma doluluk sütunları; firmalar ekran genişliğine göre gruplanır)
+        progress_frame = tk.Frame(self.notebook)
+        self.notebook.add(progress_frame, text="İlerleme")
+
+        self.progress_label = tk.Label(progress_frame, text="Henüz çalıştırma yok", anchor=tk.W)
+        self.progress_label.pack(fill=tk.X, padx=5, pady=2)
+        self.progress_canvas = tk.Canvas(progress_frame, background="white",
+                                         highlightthickness=0)
+        self.progress_canvas.pack(fill=tk.BOTH, expand=True)
+        self.progress_canvas.bind("<Configure>", lambda event: self.draw_progress(relayout=True))
+
+        # Bilgi etiketi ve yükleme göstergesi (veriler gelince özet yazılır)
+        self.info_label = tk.Label(self.root, text="Veriler yükleniyor...")
+        self.info_label.pack(pady=5)
+        self.progress = ttk.Progressbar(self.root, mode='indeterminate', length=200)
+        self.progress.pack(pady=(0, 5))
+        self.progress.start()
+        self.set_buttons_state(tk.DISABLED)
 
     def log(self, message):
-        """Log mesajı ekle"""
-        self.log_text.insert(tk.END, message + "\n")
-        self.log_text.see(tk.END)
-        self.root.update()
+        """
+        Log mesajını kuyruğa ekle (algoritma thread'inden çağrılır)
+        Kuyruk doluysa mesaj atlanır; algoritma ekranın yetişmesini beklemez
+        """
+        try:
+            self.log_queue.put_nowait(message)
+        except queue.Full:
+            self.dropped_logs += 1
+
+    def drain_log(self):
+        """Kuyruktaki mesajları tek seferde ekrana yaz (ana thread, after() ile)"""
+        messages = []
+        try:
+            while len(messages) < LOG_DRAIN_BATCH:
+                messages.append(self.log_queue.get_nowait())
+        except queue.Empty:
+            pass
+
+        dropped = self.dropped_logs - self.reported_dropped_logs
+        if dropped:
+            self.reported_dropped_logs += dropped
+            messages.append(f"... {dropped} log mesajı atlandı (kuyruk dolu)")
+
+        if messages:
+            self.log_text.insert(tk.END, "\n".join(messages) + "\n")
+            self.log_text.see(tk.END)
+
+        self.drain_progress()
+
+        if self.worker.is_alive() or not self.log_queue.empty():
+            self.root.after(LOG_DRAIN_INTERVAL_MS, self.drain_log)
+        else:
+            self.drain_progress()
+            self.draw_progress()
+            self.finish_algorithm()
+
+    # ---------- Canlı ilerleme ----------
+
+    def drain_progress(self):
+        """Kuyruktaki iterasyon kayıtlarını modele uygula; çizim zamanı geldiyse çiz"""
+        model = self.progress_model
+        try:
+            while True:
+                model.apply(self.progress_events.get_nowait())
+                self.progress_dirty = True
+        except queue.Empty:
+            pass
+
+        now = time.perf_counter()
+        if self.progress_dirty and (now - self.progress_drawn_at) * 1000 >= REDRAW_INTERVAL_MS:
+            self.draw_progress()
+
+    def draw_progress(self, relayout=False):
+        """
+        Doluluk sütunlarını çiz (ana thread)
+        Dikdörtgenler sadece sütun sayısı değişince yeniden oluşturulur; diğer çizimlerde
+        yalnız yüksekliği değişen sütunların koordinatları güncellenir
+        """
+        model = self.progress_model
+        if model is None:
+            return
+        canvas = self.progress_canvas
+        width = max(canvas.winfo_width(), COLUMN_WIDTH)
+        height = max(canvas.winfo_height(), 1)
+        ratios = model.columns(width // COLUMN_WIDTH)
+        step = width / len(ratios)
+
+        if relayout or len(ratios) != len(self.progress_bars):
+            canvas.delete("all")
+            self.progress_bars = [
+                canvas.create_rectangle(i * step, height, (i + 1) * step, height,
+                                        fill="steelblue", width=0)
+                for i in range(len(ratios))
+            ]
+            self.progress_heights = [-1] * len(ratios)
+
+        for i, ratio in enumerate(ratios):
+            bar_height = int(min(ratio, 1.0) * height)
+            if bar_height != self.progress_heights[i]:
+                self.progress_heights[i] = bar_height
+                canvas.coords(self.progress_bars[i], i * step, height - bar_height,
+                              (i + 1) * step, height)
+                canvas.itemconfig(self.progress_bars[i],
+                                  fill="firebrick" if ratio >= 1.0 else "steelblue")
+
+        self.progress_label.config(text=model.status_line())
+        self.progress_dirty = False
+        self.progress_drawn_at = time.perf_counter()
+
+    def start_algorithm(self, name, run, title):
+        """Algoritmayı arka plan thread'inde başlat"""
+        if self.store is None or (self.worker is not None and self.worker.is_alive()):
+            return
 
-    def run_greedy(self):
-        """Greedy algoritmasını çalıştır"""
         self.log_text.delete(1.0, tk.END)
         self.placement_text.delete(1.0, tk.END)
+        self.placement_report = None
+        self.btn_prev_page.config(state=tk.DISABLED)
+        self.btn_next_page.config(state=tk.DISABLED)
+        self.page_label.config(text="")
+        self.set_buttons_state(tk.DISABLED)
+
+        log_level = LOG_LEVELS[self.log_level_var.get()]
+        log_callback = self.log if log_level < LOG_OFF else None
+        self.worker_result = None
+        # Loglar kapalıysa ilerleme sekmesine, değilse log sekmesine geç
+        self.notebook.select(PROGRESS_TAB if log_callback is None else 0)
+
+        self.progress_model = ProgressModel(self.store)
+        self.progress_dirty = True
+        self.progress_drawn_at = 0.0
+        self.draw_progress()
+        event_callback = self.progress_events.put
+
+        def work():
+            from stajyer_report import PlacementReport  # NumPy ilk çalıştırmada yüklenir
+
+            try:
+                # Depo paylaşılır, durum run_* içinde sıfırlanır (kopya gerekmez)
+                # Rapor atamaların kopyasını tutar; satırlar sayfa gösterilirken üretilir
+                metrics = run(self.store, self.state, log_callback, None, log_level,
+                              event_callback=event_callback)
+                report = PlacementReport(self.state)
+                self.worker_result = (name, title, metrics, report, None)
+            except Exception as e:
+                self.worker_result = (name, title, None, None, e)
+                return
+            if self.history is not None:
+                try:
+                    run_id = self.history.record(self.store, self.state, metrics, name,
+                                                 report=report)
+                    self.log(f"Geçmişe kaydedildi: çalıştırma #{run_id}")
+                except Exception as e:
+                    self.log(f"Geçmişe kaydedilemedi: {e}")
+
+        self.worker = threading.Thread(target=work, daemon=True)
+        self.worker.start()
+        self.root.after(LOG_DRAIN_INTERVAL_MS, self.drain_log)
+
+    def finish_algorithm(self):
+        """Algoritma bittiğinde sonuçları göster (ana thread)"""
+        self.set_buttons_state(tk.NORMAL)
+
+        name, title, metrics, placements, error = self.worker_result
+        if error is not None:
+            self.log_text.insert(tk.END, f"\nHATA: {error}\n")
+            self.log_text.see(tk.END)
+            return
 
-        # Verilerin yeni kopyasını al
-        students = deepcopy(self.students)
-        firms = deepcopy(self.firms)
+        # Yerleştirmeleri kaydet
+        if name == 'greedy':
+            self.greedy_metrics = metrics
+            self.greedy_placements = placements
+        elif name == 'heuristic':
+            self.heuristic_metrics = metrics
+            self.heuristic_placements = placements
+        elif name == 'deferred':
+            self.deferred_metrics = metrics
+            self.deferred_placements = placements
+        else:
+            self.optimal_metrics = metrics
+            self.optimal_placements = placements
+
+        # Yerleştirmeleri göster (ilk sayfa)
+        self.placement_report = placements
+        self.placement_title = title
+        self.show_placement_page(0)
+        self.refresh_history()
+
+    # ---------- Çalıştırma geçmişi ----------
+
+    def refresh_history(self):
+        """
+        Seçim listelerini bu veri setinin son çalıştırmalarıyla doldur (en yeni önce)
+        Varsayılan seçim: A = bir önceki çalıştırma, B = en son çalıştırma
+        """
+        if self.history is None:
+            return
+        from stajyer_history import run_label
+
+        runs = self.history.runs(self.store, limit=HISTORY_RUNS_SHOWN)
+        self.history_runs = {run_label(run): run['id'] for run in runs}
+        labels = list(self.history_runs)
+        for combo, var, default in ((self.history_a, self.history_a_var, 1),
+                                    (self.history_b, self.history_b_var, 0)):
+            combo.config(values=labels)
+            if labels:
+                var.set(labels[min(default, len(labels) - 1)])
+
+    def show_history_diff(self):
+        """Seçilen iki çalıştırmanın öğrenci bazında farkını göster"""
+        self.compare_text.delete(1.0, tk.END)
+        run_a = self.history_runs.get(self.history_a_var.get())
+        run_b = self.history_runs.get(self.history_b_var.get())
+        if run_a is None or run_b is None:
+            self.compare_text.insert(tk.END, "Önce karşılaştırılacak iki çalıştırmayı seçin!\n")
+            return
+        from stajyer_history import format_diff
 
-        self.greedy_metrics = greedy_algorithm(students, firms, self.log)
+        diff = self.history.diff(run_a, run_b, limit=DIFF_ROWS_SHOWN)
+        self.compare_text.insert(tk.END, "\n".join(format_diff(run_a, run_b, diff)) + "\n")
 
-        # Yerleştirmeleri kaydet
-        self.greedy_placements = get_placement_details(students)
+    def show_history_summary(self):
+        """Bu veri setinin tüm çalıştırmaları üzerinde algoritma bazında özet"""
+        self.compare_text.delete(1.0, tk.END)
+        if self.history is None:
+            self.compare_text.insert(tk.END, "Çalıştırma geçmişi kullanılamıyor.\n")
+            return
+        from stajyer_history import format_aggregate
 
-        # Yerleştirmeleri göster
-        self.placement_text.insert(tk.END, "GREEDY YERLEŞTİRMELERİ\n")
-        self.placement_text.insert(tk.END, "=" * 40 + "\n")
-        for p in self.greedy_placements:
-            self.placement_text.insert(tk.END, p + "\n")
+        rows = self.history.aggregate(self.store, by=('algorithm',))
+        self.compare_text.insert(tk.END, f"GEÇMİŞ ({self.history.path})\n")
+        self.compare_text.insert(tk.END, "\n".join(format_aggregate(rows, ('algorithm',))) + "\n")
 
-        self.notebook.select(0)  # Log sekmesine geç
+    def show_placement_page(self, page):
+        """Raporun özetini ve page. sayfasını göster (sayfa başına PAGE_SIZE satır)"""
+        from stajyer_report import PAGE_SIZE  # Rapor varsa modül zaten yüklüdür
 
-    def run_heuristic(self):
-        """Heuristic algoritmasını çalıştır"""
-        self.log_text.delete(1.0, tk.END)
+        report = self.placement_report
+        if report is None:
+            return
+        page_count = report.page_count(PAGE_SIZE)
+        page = max(0, min(page, page_count - 1))
+        self.placement_page = page
+
+        lines = [self.placement_title, "=" * 40]
+        lines.extend(report.summary_lines())
+        lines.append("=" * 40)
+        lines.extend(report.page(page, PAGE_SIZE))
         self.placement_text.delete(1.0, tk.END)
+        self.placement_text.insert(tk.END, "\n".join(lines) + "\n")
 
-        # Verilerin yeni kopyasını al
-        students = deepcopy(self.students)
-        firms = deepcopy(self.firms)
+        self.page_label.config(text=f"Sayfa {page + 1} / {page_count} ({report.placed} yerleşme)")
+        self.btn_prev_page.config(state=tk.NORMAL if page > 0 else tk.DISABLED)
+        self.btn_next_page.config(state=tk.NORMAL if page < page_count - 1 else tk.DISABLED)
 
-        self.heuristic_metrics = heuristic_algorithm(students, firms, self.log)
+    def run_greedy(self):
+        """Greedy algoritmasını çalıştır"""
+        self.start_algorithm('greedy', run_greedy, "GREEDY YERLEŞTİRMELERİ")
 
-        # Yerleştirmeleri kaydet
-        self.heuristic_placements = get_placement_details(students)
+    def run_heuristic(self):
+        """Heuristic algoritmasını çalıştır"""
+        self.start_algorithm('heuristic', run_heuristic, "HEURİSTİC YERLEŞTİRMELERİ")
 
-        # Yerleştirmeleri göster
-        self.placement_text.insert(tk.END, "HEURİSTİC YERLEŞTİRMELERİ\n")
-        self.placement_text.insert(tk.END, "=" * 40 + "\n")
-        for p in self.heuristic_placements:
-            self.placement_text.insert(tk.END, p + "\n")
+    def run_deferred(self):
+        """Ertelenmiş kabul (Gale-Shapley) algoritmasını çalıştır"""
+        self.start_algorithm('deferred', run_deferred, "ERTELENMİŞ KABUL YERLEŞTİRMELERİ")
 
-        self.notebook.select(0)  # Log sekmesine geç
+    def run_optimal(self):
+        """Optimal (min-cost flow) algoritmasını çalıştır"""
+        self.start_algorithm('optimal', run_optimal, "OPTİMAL YERLEŞTİRMELERİ")
 
     def compare_results(self):
         """İki algoritmanın sonuçlarını karşılaştır"""
@@ -632,6 +631,27 @@ class SimulatorGUI:
         else:
             self.compare_text.insert(tk.END, "- Memnuniyet: Eşit\n")
 
+        # Ertelenmiş kabul çalıştırıldıysa özetini ekle
+        if self.deferred_metrics:
+            self.compare_text.insert(
+                tk.END,
+                f"\nERTELENMİŞ KABUL: memnuniyet {self.deferred_metrics['satisfaction_score']}, "
+                f"iterasyon {self.deferred_metrics['total_iterations']}, "
+                f"süre {self.deferred_metrics['total_time']:.4f} sn\n"
+            )
+
+        # Optimal çalıştırıldıysa memnuniyet skorlarını optimal skora göre oranla
+        if self.optimal_metrics:
+            optimal_score = self.optimal_metrics['satisfaction_score']
+            self.compare_text.insert(tk.END, f"\nOPTİMAL MEMNUNİYET SKORU: {optimal_score}"
+                                             f" ({self.optimal_metrics['total_time']:.4f} sn)\n")
+            compared = [("Greedy", self.greedy_metrics), ("Heuristic", self.heuristic_metrics)]
+            if self.deferred_metrics:
+                compared.append(("Ertelenmiş kabul", self.deferred_metrics))
+            for label, metrics in compared:
+                ratio = metrics['satisfaction_score'] / optimal_score * 100 if optimal_score else 100.0
+                self.compare_text.insert(tk.END, f"- {label}: optimalin %{ratio:.1f}'i\n")
+
         self.notebook.select(2)  # Karşılaştırma sekmesine geç
 
     def run(self):
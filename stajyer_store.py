@@ -0,0 +1,276 @@
+"""
+Stajyer Yerleştirme Simülatörü - Kompakt Veri Deposu
+Öğrenci ve firma verilerinin dizi tabanlı (struct-of-arrays) tutulması
+"""
+
+import hashlib
+import sys
+from array import array
+
+NO_FIRM = -1          # Boş tercih hücresi / yerleşmemiş öğrenci
+PREFERENCE_WIDTH = 5  # Her öğrencinin tercih sayısı (sabit genişlikli satırlar)
+
+
+class CompactStore:
+    """
+    Dizi tabanlı veri deposu
+    - Firmalar tamsayı indeksle tutulur (firm_ids[i] -> id, firm_index[id] -> i)
+    - Tercihler n × width boyutlu düz bir int dizisidir; boş hücreler NO_FIRM
+    - GNO ve kapasiteler tipli dizilerdir (array('d'), array('i'))
+    Depo yüklendikten sonra değişmez (artımlı güncellemeler hariç, bkz. stajyer_incremental);
+    yerleştirme durumu PlacementState'te tutulur.
+    firms.csv'de olmayan tercihler NO_FIRM olarak saklanır (hiçbir zaman uygun değildir).
+    İkili önbellekten (stajyer_cache) açılan depolarda diziler salt okunur memoryview'lardır.
+    """
+
+    __slots__ = ('student_ids', 'gno', 'prefs', 'width',
+                 'firm_ids', 'firm_index', 'capacity', '_gno_order', '_gno_rank',
+                 '_interested', 'mapped_path')
+
+    def __init__(self, width=PREFERENCE_WIDTH):
+        self.student_ids = []
+        self.gno = array('d')
+        self.prefs = array('i')
+        self.width = width
+        self.firm_ids = []
+        self.firm_index = {}
+        self.capacity = array('i')
+        self._gno_order = None
+        self._gno_rank = None
+        self._interested = None
+        self.mapped_path = None  # Önbellek dosyasından eşlenmişse dosya yolu
+
+    def __reduce_ex__(self, protocol):
+        # Eşlenmiş depo diğer süreçlere dizileriyle değil dosya yoluyla gönderilir;
+        # alıcı süreç aynı dosyayı tekrar eşler ve bellek sayfaları paylaşılır
+        if self.mapped_path is not None:
+            return (_open_mapped, (self.mapped_path,))
+        return super().__reduce_ex__(protocol)
+
+    @property
+    def n_students(self):
+        return len(self.student_ids)
+
+    @property
+    def n_firms(self):
+        return len(self.firm_ids)
+
+    def add_firm(self, firm_id, capacity):
+        """Firma ekle; aynı id tekrar gelirse kapasite güncellenir (dict davranışı)"""
+        firm_id = sys.intern(firm_id)
+        index = self.firm_index.get(firm_id)
+        if index is None:
+            self.firm_index[firm_id] = len(self.firm_ids)
+            self.firm_ids.append(firm_id)
+            self.capacity.append(capacity)
+            self._interested = None
+        else:
+            self.capacity[index] = capacity
+
+    def add_student(self, student_id, preferences, gno):
+        """Öğrenci ekle; tercihler firma indekslerine çevrilir"""
+        if len(preferences) > self.width:
+            raise ValueError(
+                f"{student_id}: en fazla {self.width} tercih olabilir ({len(preferences)} verildi)"
+            )
+        row = [self.firm_index.get(fid, NO_FIRM) for fid in preferences]
+        row.extend([NO_FIRM] * (self.width - len(row)))
+        self.student_ids.append(student_id)
+        self.gno.append(gno)
+        self.prefs.extend(row)
+        self._gno_order = None
+        self._gno_rank = None
+        self._interested = None
+
+    def add_students(self, rows):
+        """
+        Öğrencileri toplu ekle; rows: (student_id, tercihler, gno) demetleri
+        add_student ile aynı sonucu verir, diziler parça başına bir kez genişletilir
+        """
+        width = self.width
+        index_get = self.firm_index.get
+        ids = []
+        gnos = []
+        flat = []
+        for student_id, preferences, gno in rows:
+            if len(preferences) > width:
+                raise ValueError(
+                    f"{student_id}: en fazla {width} tercih olabilir ({len(preferences)} verildi)"
+                )
+            ids.append(student_id)
+            gnos.append(gno)
+            flat.extend([index_get(fid, NO_FIRM) for fid in preferences])
+            if len(preferences) < width:
+                flat.extend([NO_FIRM] * (width - len(preferences)))
+        self.student_ids.extend(ids)
+        self.gno.extend(gnos)
+        self.prefs.extend(flat)
+        self._gno_order = None
+        self._gno_rank = None
+        self._interested = None
+
+    def set_preferences(self, student, preferences):
+        """Öğrencinin tercih satırını değiştir (add_student ile aynı dönüşüm)"""
+        if len(preferences) > self.width:
+            raise ValueError(
+                f"{self.student_ids[student]}: en fazla {self.width} tercih olabilir "
+                f"({len(preferences)} verildi)"
+            )
+        row = [self.firm_index.get(fid, NO_FIRM) for fid in preferences]
+        row.extend([NO_FIRM] * (self.width - len(row)))
+        start = student * self.width
+        self.prefs[start:start + self.width] = array('i', row)
+        self._interested = None
+
+    def copy(self):
+        """
+        Yazılabilir bağımsız kopya - O(n + m)
+        Önbellekten eşlenmiş (salt okunur) depolar değiştirilmeden önce kopyalanır
+        """
+        store = CompactStore(self.width)
+        store.student_ids = list(self.student_ids)
+        store.gno = array('d', self.gno)
+        store.prefs = array('i', self.prefs)
+        store.firm_ids = list(self.firm_ids)
+        store.firm_index = dict(self.firm_index)
+        store.capacity = array('i', self.capacity)
+        if self._gno_order is not None:
+            store._gno_order = array('i', self._gno_order)
+        if self._gno_rank is not None:
+            store._gno_rank = array('i', self._gno_rank)
+        return store
+
+    def with_capacity(self, changes):
+        """
+        Sadece kapasiteleri farklı bir depo - O(m)
+        changes: {firma indeksi: yeni kapasite}. Öğrenci dizileri, tercihler ve kapasiteye
+        bağlı olmayan indeksler (GNO sırası, ters indeks) paylaşılır; bunlar değiştirilmemelidir.
+        """
+        store = CompactStore(self.width)
+        store.student_ids = self.student_ids
+        store.gno = self.gno
+        store.prefs = self.prefs
+        store.firm_ids = self.firm_ids
+        store.firm_index = self.firm_index
+        store.capacity = array('i', self.capacity)
+        for firm, capacity in changes.items():
+            store.capacity[firm] = capacity
+        store._gno_order = self._gno_order
+        store._gno_rank = self._gno_rank
+        store._interested = self._interested
+        return store
+
+    def subset(self, students, firms):
+        """
+        Verilen öğrenci ve firma indekslerinden oluşan bağımsız alt depo
+        Göreli sıra korunur (indeksler artan sırada verilmelidir), böylece GNO eşitliklerinde
+        ve liste sırasında aynı öğrenci önce gelir. Alt kümede olmayan firmalara yapılan
+        tercihler NO_FIRM olur.
+        """
+        store = CompactStore(self.width)
+        new_index = {}
+        for firm in firms:
+            new_index[firm] = len(store.firm_ids)
+            store.firm_index[self.firm_ids[firm]] = len(store.firm_ids)
+            store.firm_ids.append(self.firm_ids[firm])
+            store.capacity.append(self.capacity[firm])
+        width = self.width
+        prefs = self.prefs
+        flat = []
+        for student in students:
+            start = student * width
+            flat.extend([new_index.get(firm, NO_FIRM) for firm in prefs[start:start + width]])
+        store.student_ids = [self.student_ids[student] for student in students]
+        store.gno = array('d', [self.gno[student] for student in students])
+        store.prefs = array('i', flat)
+        return store
+
+    def pref_row(self, student):
+        """Öğrencinin tercih satırı (firma indeksleri, NO_FIRM dahil)"""
+        start = student * self.width
+        return self.prefs[start:start + self.width]
+
+    def pref_rank(self, student, firm):
+        """Firmanın öğrencinin tercihlerindeki sırası (0 = 1. tercih), yoksa -1"""
+        start = student * self.width
+        prefs = self.prefs
+        for rank in range(self.width):
+            if prefs[start + rank] == firm:
+                return rank
+        return -1
+
+    def preferences(self, student):
+        """Öğrencinin tercihlerini firma id'leri olarak döndür"""
+        return [self.firm_ids[f] for f in self.pref_row(student) if f != NO_FIRM]
+
+    def gno_order(self):
+        """Öğrenci indeksleri, GNO'ya göre yüksekten düşüğe (eşitlikte liste sırası)"""
+        if self._gno_order is None:
+            gno = self.gno
+            self._gno_order = array('i', sorted(range(len(gno)), key=lambda i: -gno[i]))
+        return self._gno_order
+
+    def gno_rank(self):
+        """Öğrenci -> GNO sırasındaki konumu (gno_order'ın tersi)"""
+        if self._gno_rank is None:
+            rank = array('i', bytes(4 * self.n_students))
+            for position, student in enumerate(self.gno_order()):
+                rank[student] = position
+            self._gno_rank = rank
+        return self._gno_rank
+
+    def interested(self):
+        """
+        Firma -> onu tercih eden öğrenciler (ters indeks), her liste GNO sırasında
+        Tercih satırındaki her geçerli hücre için bir kayıt vardır
+        """
+        if self._interested is None:
+            lists = [array('i') for _ in range(self.n_firms)]
+            prefs = self.prefs
+            width = self.width
+            for student in self.gno_order():
+                start = student * width
+                for firm in prefs[start:start + width]:
+                    if firm != NO_FIRM:
+                        lists[firm].append(student)
+            self._interested = lists
+        return self._interested
+
+    @classmethod
+    def from_objects(cls, students, firms, width=None):
+        """Student listesi ve Firm sözlüğünden depo oluştur"""
+        if width is None:
+            width = max((len(s.preferences) for s in students), default=PREFERENCE_WIDTH)
+        store = cls(width)
+        for firm in firms.values():
+            store.add_firm(firm.id, firm.capacity)
+        for s in students:
+            store.add_student(s.id, s.preferences, s.gno)
+        return store
+
+    def nbytes(self):
+        """Deponun yaklaşık bellek kullanımı (byte)"""
+        total = sys.getsizeof(self.student_ids) + sum(map(sys.getsizeof, self.student_ids))
+        total += sys.getsizeof(self.firm_ids) + sum(map(sys.getsizeof, self.firm_ids))
+        total += sys.getsizeof(self.firm_index)
+        for arr in (self.gno, self.prefs, self.capacity):
+            total += arr.itemsize * len(arr)
+        return total
+
+
+def dataset_hash(store):
+    """Veri setinin içerik hash'i (kapasiteler, GNO'lar, tercihler ve id'ler)"""
+    h = hashlib.sha256()
+    h.update(f"{store.n_students},{store.n_firms},{store.width}".encode())
+    for buffer in (store.capacity, store.gno, store.prefs):
+        h.update(buffer)
+    for ids in (store.firm_ids, store.student_ids):
+        h.update("\0".join(ids).encode('utf-8'))
+        h.update(b"\1")
+    return h.hexdigest()
+
+
+def _open_mapped(path):
+    """Eşlenmiş depoyu başka bir süreçte tekrar aç (pickle için)"""
+    from stajyer_cache import open_cache
+    return open_cache(path)
@@ -0,0 +1,354 @@
+"""
+Stajyer Yerleştirme Simülatörü - Parametre Taraması
+Skor ağırlıkları (gno_weight, pref_weight, compat_weight) ve firma red olasılığı
+(rejection_probability) üzerinde ızgara veya rastgele arama
+
+Her (algoritma, parametreler, tohum) çalıştırması süreç havuzunda yapılır ve sonucu diskte
+(kaynak kod hash'i, veri seti hash'i, algoritma, parametreler, tohum) anahtarıyla
+saklanır; tekrarlanan veya çakışan taramalar biten işleri atlar. Greedy sadece red
+olasılığını kullandığı için anahtarında sadece o parametre bulunur: ağırlıkları farklı
+yapılandırmalar greedy için tek bir çalıştırmayı paylaşır. Önbellekten gelen sonuçların
+süresi ilk ölçülen süredir.
+
+Örnek:
+    python3 stajyer_sweep.py --grid gno_weight=0.2,0.4,0.6 rejection_probability=0,0.3 \\
+        --seeds 1 2 3
+    python3 stajyer_sweep.py --random 50 --range gno_weight=0:1 pref_weight=0:1 -j 4
+"""
+
+import argparse
+import csv
+import hashlib
+import itertools
+import json
+import math
+import os
+import random
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from stajyer_core import (
+    ALGORITHMS, DEFAULT_PARAMS, LOG_OFF, PlacementState, load_store, resolve_params,
+)
+from stajyer_store import dataset_hash
+
+# Algoritma -> kullandığı parametreler (önbellek anahtarına sadece bunlar girer)
+SWEEP_ALGORITHMS = {
+    'greedy': ('rejection_probability',),
+    'heuristic': tuple(DEFAULT_PARAMS),
+}
+CACHE_VERSION = 1                  # Sonuç biçimi değişirse artırılır
+# Sonuçları belirleyen kaynak dosyalar; içerikleri önbellek anahtarına girer, bu yüzden
+# algoritmalardaki her değişiklik eski sonuçları elle sürüm artırmadan geçersiz kılar.
+# stajyer_scoring: heuristic büyük verilerde (VECTORIZE_MIN_STUDENTS) NumPy skorlamasını kullanır
+ALGORITHM_SOURCES = ('stajyer_core.py', 'stajyer_store.py', 'stajyer_scoring.py',
+                     'stajyer_sweep.py')
+DEFAULT_CACHE_DIR = ".sweep_cache"
+RESULT_METRICS = ('satisfaction_score', 'total_time', 'total_iterations', 'rejections')
+
+
+# ==================== PARAMETRE UZAYI ====================
+
+def _parse_assignments(specs):
+    """'ad=değer' biçimindeki argümanları (ad, değer) çiftlerine ayır"""
+    pairs = []
+    for spec in specs:
+        name, sep, value = spec.partition('=')
+        if not sep or name not in DEFAULT_PARAMS:
+            raise ValueError(f"Geçersiz parametre: {spec!r} "
+                             f"(beklenen: {', '.join(DEFAULT_PARAMS)} = değer)")
+        pairs.append((name, value))
+    return pairs
+
+
+def parse_grid(specs):
+    """['gno_weight=0.2,0.4', ...] -> {'gno_weight': [0.2, 0.4], ...}"""
+    return {name: [float(v) for v in value.split(',')]
+            for name, value in _parse_assignments(specs)}
+
+
+def parse_ranges(specs):
+    """['gno_weight=0:1', ...] -> {'gno_weight': (0.0, 1.0), ...}"""
+    ranges = {}
+    for name, value in _parse_assignments(specs):
+        low, _, high = value.partition(':')
+        ranges[name] = (float(low), float(high))
+    return ranges
+
+
+def grid_configs(grid):
+    """Izgaradaki tüm kombinasyonlar (verilmeyen parametreler varsayılan kalır)"""
+    names = list(grid)
+    return [dict(zip(names, values)) for values in itertools.product(*grid.values())]
+
+
+def random_configs(ranges, count, seed=0):
+    """Aralıklardan düzgün dağılımla count yapılandırma (4 ondalık basamak)"""
+    rng = random.Random(seed)
+    return [{name: round(rng.uniform(low, high), 4) for name, (low, high) in ranges.items()}
+            for _ in range(count)]
+
+
+# ==================== ÖNBELLEK ====================
+
+def relevant_params(algorithm, params):
+    """Algoritmanın kullandığı parametreler, varsayılanlarla tamamlanmış"""
+    resolved = resolve_params(params)
+    return {name: resolved[name] for name in SWEEP_ALGORITHMS[algorithm]}
+
+
+_source_hash = None
+
+
+def source_hash():
+    """ALGORITHM_SOURCES dosyalarının içerik hash'i (süreç başına bir kez okunur)"""
+    global _source_hash
+    if _source_hash is None:
+        h = hashlib.sha256()
+        directory = os.path.dirname(os.path.abspath(__file__))
+        for name in ALGORITHM_SOURCES:
+            with open(os.path.join(directory, name), 'rb') as f:
+                h.update(f.read())
+            h.update(b"\0")
+        _source_hash = h.hexdigest()
+    return _source_hash
+
+
+def run_key(dataset, algorithm, params, seed):
+    """
+    (veri seti, algoritma, parametreler, tohum) anahtarının dosya adı olarak hash'i
+    Anahtara önbellek sürümü ve algoritma kaynaklarının hash'i (source_hash) de girer
+    """
+    key = json.dumps([CACHE_VERSION, source_hash(), dataset, algorithm,
+                      sorted(params.items()), seed])
+    return hashlib.sha256(key.encode('utf-8')).hexdigest()
+
+
+class ResultCache:
+    """
+    Çalıştırma sonuçlarının disk önbelleği: anahtar başına bir JSON dosyası
+    Yazma geçici dosya + os.replace ile atomiktir; yarıda kesilen tarama bitmiş işleri korur
+    """
+
+    def __init__(self, directory=DEFAULT_CACHE_DIR):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, key):
+        return os.path.join(self.directory, key[:2], key + ".json")
+
+    def get(self, key):
+        try:
+            with open(self._path(key), 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def put(self, key, record):
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(record, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+
+
+# ==================== İŞÇİ SÜREÇLER ====================
+
+# Her işçi süreçte bir kez kurulur (depo her görevde tekrar gönderilmez)
+_worker_store = None
+_worker_state = None
+
+
+def _init_worker(store):
+    global _worker_store, _worker_state
+    _worker_store = store
+    _worker_state = PlacementState(store)
+
+
+def run_task(task):
+    """Tek bir (algoritma, parametreler, tohum) çalıştırması"""
+    algorithm, params, seed = task
+    metrics = ALGORITHMS[algorithm](_worker_store, _worker_state, None, random.Random(seed),
+                                    LOG_OFF, params=params)
+    return {metric: metrics[metric] for metric in RESULT_METRICS}
+
+
+# ==================== TARAMA ====================
+
+def run_sweep(store, configs, algorithms=tuple(SWEEP_ALGORITHMS), seeds=(0,),
+              cache_dir=DEFAULT_CACHE_DIR, workers=None):
+    """
+    Her (algoritma, yapılandırma, tohum) için sonucu önbellekten al veya çalıştır
+    Aynı anahtara düşen işler (ör. greedy için sadece ağırlığı farklı yapılandırmalar)
+    bir kez çalıştırılır. workers: süreç sayısı (None = CPU sayısı, 1 = aynı süreçte)
+    Dönüş: (sıralı özet satırları, {'cached': n, 'run': n})
+    """
+    cache = ResultCache(cache_dir)
+    dataset = dataset_hash(store)
+
+    # (algoritma, ilgili parametreler) -> tohum başına anahtar
+    groups = {}
+    for algorithm in algorithms:
+        for config in configs:
+            params = relevant_params(algorithm, config)
+            group = (algorithm, tuple(sorted(params.items())))
+            if group not in groups:
+                groups[group] = {seed: run_key(dataset, algorithm, params, seed) for seed in seeds}
+
+    results = {}
+    pending = []
+    for (algorithm, params), keys in groups.items():
+        for seed, key in keys.items():
+            record = cache.get(key)
+            results[key] = record
+            if record is None:
+                pending.append((key, (algorithm, dict(params), seed)))
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if pending and (workers <= 1 or len(pending) == 1):
+        _init_worker(store)
+        for key, task in pending:
+            results[key] = run_task(task)
+            cache.put(key, results[key])
+    elif pending:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(store,)) as executor:
+            futures = {executor.submit(run_task, task): key for key, task in pending}
+            for future in as_completed(futures):
+                key = futures[future]
+                results[key] = future.result()
+                cache.put(key, results[key])
+
+    rows = []
+    for (algorithm, params), keys in groups.items():
+        runs = [results[key] for key in keys.values()]
+        scores = [run['satisfaction_score'] for run in runs]
+        mean_score = math.fsum(scores) / len(scores)
+        rows.append({
+            'algorithm': algorithm,
+            'params': dict(params),
+            'seeds': len(runs),
+            'satisfaction_mean': mean_score,
+            'satisfaction_std': (math.sqrt(math.fsum((s - mean_score) ** 2 for s in scores)
+                                           / (len(scores) - 1)) if len(scores) > 1 else 0.0),
+            'time_mean': math.fsum(run['total_time'] for run in runs) / len(runs),
+            'iterations_mean': math.fsum(run['total_iterations'] for run in runs) / len(runs),
+        })
+    mark_pareto(rows)
+    rows.sort(key=lambda row: (-row['satisfaction_mean'], row['time_mean']))
+    return rows, {'cached': len(results) - len(pending), 'run': len(pending)}
+
+
+def mark_pareto(rows):
+    """Daha yüksek memnuniyeti daha kısa sürede veren başka satır yoksa 'pareto' = True"""
+    for row in rows:
+        row['pareto'] = not any(
+            other['satisfaction_mean'] >= row['satisfaction_mean']
+            and other['time_mean'] <= row['time_mean']
+            and (other['satisfaction_mean'], other['time_mean'])
+            != (row['satisfaction_mean'], row['time_mean'])
+            for other in rows
+        )
+
+
+def format_params(params):
+    return " ".join(f"{name}={value:g}" for name, value in params.items())
+
+
+def write_csv(filepath, rows):
+    """Sıralı tabloyu CSV olarak yaz (parametre başına bir sütun)"""
+    with open(filepath, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(['rank', 'algorithm', *DEFAULT_PARAMS, 'seeds', 'satisfaction_mean',
+                         'satisfaction_std', 'time_mean', 'iterations_mean', 'pareto'])
+        for rank, row in enumerate(rows, 1):
+            writer.writerow([rank, row['algorithm'],
+                             *(row['params'].get(name, '') for name in DEFAULT_PARAMS),
+                             row['seeds'], f"{row['satisfaction_mean']:.3f}",
+                             f"{row['satisfaction_std']:.3f}", f"{row['time_mean']:.6f}",
+                             f"{row['iterations_mean']:.2f}", int(row['pareto'])])
+
+
+# ==================== KOMUT SATIRI ====================
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Skor ağırlıkları ve red olasılığı üzerinde parametre taraması"
+    )
+    parser.add_argument('-a', '--algorithms', nargs='+', default=sorted(SWEEP_ALGORITHMS),
+                        choices=sorted(SWEEP_ALGORITHMS), help="Taranacak algoritmalar")
+    parser.add_argument('--grid', nargs='+', default=[], metavar='AD=D1,D2,...',
+                        help="Izgara: parametre başına değer listesi")
+    parser.add_argument('--random', type=int, default=0, metavar='N',
+                        help="--range aralıklarından N rastgele yapılandırma")
+    parser.add_argument('--range', nargs='+', default=[], metavar='AD=ALT:ÜST',
+                        help="Rastgele arama aralıkları")
+    parser.add_argument('--search-seed', type=int, default=0,
+                        help="Rastgele aramanın tohumu (yapılandırmaları belirler)")
+    parser.add_argument('--seeds', nargs='+', type=int, default=[0],
+                        help="Her yapılandırma için çalıştırma tohumları")
+    parser.add_argument('--students', default="students.csv", help="Öğrenci CSV dosyası")
+    parser.add_argument('--firms', default="firms.csv", help="Firma CSV dosyası")
+    parser.add_argument('--no-cache', action='store_true',
+                        help="İkili veri önbelleğini kullanma, CSV'leri her seferinde oku")
+    parser.add_argument('--cache-dir', default=DEFAULT_CACHE_DIR,
+                        help="Sonuç önbelleği klasörü")
+    parser.add_argument('-j', '--workers', type=int, default=None,
+                        help="Süreç sayısı (varsayılan: CPU sayısı)")
+    parser.add_argument('--top', type=int, default=20, help="Gösterilecek satır sayısı")
+    parser.add_argument('-o', '--output', default=None, help="JSON çıktı dosyası")
+    parser.add_argument('--csv', default=None, help="CSV çıktı dosyası")
+    args = parser.parse_args(argv)
+    try:
+        args.grid = parse_grid(args.grid)
+        args.range = parse_ranges(args.range)
+    except ValueError as e:
+        parser.error(str(e))
+    if args.random and not args.range:
+        parser.error("--random için --range gerekli")
+    return args
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    configs = grid_configs(args.grid) if args.grid else []
+    configs += random_configs(args.range, args.random, args.search_seed)
+    if not configs:
+        configs = [{}]  # Sadece varsayılan parametreler
+    for config in configs:
+        try:
+            resolve_params(config)
+        except ValueError as e:
+            print(f"Hata: {e}", file=sys.stderr)
+            return 2
+
+    store = load_store(args.students, args.firms, cache=not args.no_cache)
+    start = time.perf_counter()
+    rows, counts = run_sweep(store, configs, args.algorithms, args.seeds,
+                             args.cache_dir, args.workers)
+    elapsed = time.perf_counter() - start
+
+    print(f"{'#':>3} {'algoritma':<10} {'memnuniyet':>10} {'std':>7} {'süre (ms)':>10}  "
+          f"parametreler")
+    for rank, row in enumerate(rows[:args.top], 1):
+        print(f"{rank:>3} {row['algorithm']:<10} {row['satisfaction_mean']:>10.2f} "
+              f"{row['satisfaction_std']:>7.2f} {row['time_mean'] * 1000:>10.2f}"
+              f"{'*' if row['pareto'] else ' '} {format_params(row['params'])}")
+    print(f"(* = memnuniyet/süre Pareto sınırı) {len(rows)} yapılandırma, "
+          f"{counts['run']} çalıştırma, {counts['cached']} önbellekten, {elapsed:.2f}sn")
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump({'seeds': args.seeds, 'elapsed': elapsed, 'counts': counts,
+                       'results': rows}, f, ensure_ascii=False, indent=2)
+    if args.csv:
+        write_csv(args.csv, rows)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,336 @@
+"""
+Stajyer Yerleştirme Simülatörü - Kapasite What-If Analizi
+"Firma X 2 kontenjan eklerse ne olur?" sorularını toplu ve hızlı yanıtlar
+
+Greedy bir kez, iterasyon başı kontrol noktaları kaydedilerek (GreedyTrace) çalıştırılır.
+Kapasitesi değişen bir firma, greedy'nin akışını ancak kalan kontenjanı belirli bir eşiğe
+indiğinde değiştirebilir:
+    kapasite artışı: firma dolduğunda (sonraki öğrenci artık boş kontenjan bulur)
+    kapasite azalışı (d): kalan kontenjan d'ye indiğinde (senaryoda firma o anda dolar)
+O ana kadar senaryo temel çalıştırmayla aynıdır: aynı yerleşmeler, aynı rastgele sayılar.
+Senaryo bu noktadan devam ettirilir (run_greedy(resume=...)): o iterasyonun kontrol noktası
+yüklenir, eşiğe kadarki yerleşmeler tekrar oynatılır ve rng durumu geri yüklenir. Firma
+hiç eşiğe inmiyorsa sonuç temel çalıştırmanın aynısıdır, greedy hiç çalışmaz.
+Senaryo depoları CompactStore.with_capacity ile kurulur; GNO sırası ve tercih ters indeksi
+tüm senaryolarda paylaşılır.
+
+Sonuçlar aynı tohumla bağımsız çalıştırmalarla birebir aynıdır (ortak rastgele sayılar);
+bu yüzden senaryolar arasındaki fark sadece kapasite değişikliğinden gelir. FAZ 2
+iterasyonlarında rastgele firma seçimi rng'yi eşleştirme sırasında kullandığı için devam
+noktası iterasyonun başıdır.
+
+Örnek:
+    whatif = CapacityWhatIf(store, seed=1)
+    whatif.evaluate([{'Google': 5}, {'Google': 5, 'Amazon': 0}])
+    for row in whatif.marginal_seats(seats=2):
+        print(row['firm'], row['marginal'])
+"""
+
+import argparse
+import random
+import sys
+import time
+from array import array
+
+from stajyer_core import LOG_OFF, PlacementState, load_store, run_greedy
+
+
+class GreedyTrace:
+    """
+    run_greedy(trace=...) kayıtçısı
+    Her iterasyon için: iterasyon no, faz, başlangıç durumu (assigned byte'ları, remaining),
+    boş firma listesinin sırası, rng durumu, GNO sırası, o ana kadarki red sayısı ve
+    eşleştirme adımında yerleşenler (sırayla, firmalarıyla)
+    """
+
+    def __init__(self):
+        self.checkpoints = []
+
+    def iteration_start(self, iteration, phase, state, rng, order, metrics):
+        self.checkpoints.append({
+            'iteration': iteration,
+            'phase': phase,
+            'assigned': state.assigned.tobytes(),
+            'remaining': array('i', state.remaining),
+            'available': list(state.available_list),
+            'rng': rng.getstate(),
+            'order': order,
+            'rejections': metrics['rejections'],
+            'placed': None,
+            'firms': None,
+            '_fills': None,
+        })
+
+    def matched(self, placed, state):
+        checkpoint = self.checkpoints[-1]
+        checkpoint['placed'] = array('i', placed)
+        checkpoint['firms'] = array('i', [state.assigned[student] for student in placed])
+
+    @staticmethod
+    def _fills(checkpoint):
+        """Firma -> iterasyonda o firmaya yapılan yerleşmelerin indeksleri (bir kez kurulur)"""
+        fills = checkpoint['_fills']
+        if fills is None:
+            fills = {}
+            for index, firm in enumerate(checkpoint['firms']):
+                fills.setdefault(firm, []).append(index)
+            checkpoint['_fills'] = fills
+        return fills
+
+    def divergence(self, firm, delta):
+        """
+        Kapasitesi delta kadar değişen firmanın akışı ilk değiştirebileceği nokta
+        (kontrol noktası indeksi, yerleşme indeksi) - yerleşme indeksi -1 ise iterasyonun
+        başı; hiç değiştirmiyorsa None
+        Temel çalıştırma hiç iterasyon yapmadıysa (kontenjan veya öğrenci yok) kapasite
+        artışı akışı baştan değiştirir: (0, -1)
+        """
+        if not self.checkpoints:
+            return (0, -1) if delta > 0 else None
+        threshold = max(0, -delta)
+        for index, checkpoint in enumerate(self.checkpoints):
+            start = checkpoint['remaining'][firm]
+            if start <= threshold:
+                return index, -1
+            fills = self._fills(checkpoint).get(firm, ())
+            if start - len(fills) <= threshold:
+                return index, fills[start - threshold - 1]
+        return None
+
+
+class CapacityWhatIf:
+    """
+    Kapasite senaryolarını tek bir temel greedy çalıştırmasını paylaşarak değerlendirir
+    store: CompactStore (değiştirilmez); seed: greedy rastgele tohumu; params: run_greedy
+    parametreleri (ör. {'rejection_probability': 0} ile deterministik)
+    """
+
+    def __init__(self, store, seed=None, params=None):
+        self.store = store
+        self.seed = seed
+        self.params = params
+        self.trace = GreedyTrace()
+        self.state = PlacementState(store)
+        start = time.perf_counter()
+        rng = random.Random(seed)
+        self.rng_state = rng.getstate()  # Kontrol noktası yoksa baştan çalıştırma için
+        self.metrics = run_greedy(store, self.state, rng=rng, log_level=LOG_OFF,
+                                  params=params, trace=self.trace)
+        self.baseline_time = time.perf_counter() - start
+
+    @property
+    def satisfaction_score(self):
+        return self.metrics['satisfaction_score']
+
+    def _changes(self, scenario):
+        """{firma_id: kapasite} -> {firma indeksi: kapasite}; değişmeyenler atlanır"""
+        store = self.store
+        changes = {}
+        for firm_id, capacity in scenario.items():
+            firm = store.firm_index.get(firm_id)
+            if firm is None:
+                raise ValueError(f"Bilinmeyen firma: {firm_id}")
+            if type(capacity) is not int or capacity < 0:  # bool (True/False) kabul edilmez
+                raise ValueError(f"{firm_id}: kapasite negatif olmayan bir tamsayı olmalı "
+                                 f"({capacity!r})")
+            if capacity != store.capacity[firm]:
+                changes[firm] = capacity
+        return changes
+
+    def _resume_point(self, changes):
+        """Değişen firmalar içinde en erken ayrılma noktası (bkz. GreedyTrace.divergence)"""
+        store = self.store
+        points = [self.trace.divergence(firm, capacity - store.capacity[firm])
+                  for firm, capacity in changes.items()]
+        points = [point for point in points if point is not None]
+        return min(points) if points else None
+
+    def run_scenario(self, scenario):
+        """
+        Tek senaryo: {firma_id: yeni kapasite}
+        Dönüş: changes, satisfaction_score, gain (temel skora göre), seats (toplam kapasite
+        farkı), resumed_at ((iterasyon, GNO sırasındaki konum); baştan çalıştıysa (1, 0),
+        temel sonuç kullanıldıysa None), time, metrics (greedy çalıştıysa; devam edilen
+        kısım) ve state (senaryonun yerleştirmesi)
+        """
+        start = time.perf_counter()
+        store = self.store
+        changes = self._changes(scenario)
+        seats = sum(capacity - store.capacity[firm] for firm, capacity in changes.items())
+        point = self._resume_point(changes)
+        scenario_store = store.with_capacity(changes)
+        metrics = None
+        resumed_at = None
+        if point is None:
+            # Akış hiç değişmez: temel yerleştirme, kalan kontenjanlar farkla
+            score = self.satisfaction_score
+            remaining = array('i', self.state.remaining)
+            for firm, capacity in changes.items():
+                remaining[firm] += capacity - store.capacity[firm]
+            state = PlacementState(scenario_store, array('i', self.state.assigned), remaining)
+        else:
+            index, fill = point
+            checkpoints = self.trace.checkpoints
+            checkpoint = checkpoints[index] if checkpoints else None
+            if checkpoint is not None and checkpoint['phase'] == 2:
+                fill = -1  # Rastgele seçimler rng'yi eşleştirme sırasında kullanır
+            if index == 0 and fill == -1:
+                # İlk iterasyonun başı: senaryo baştan çalışır
+                state = PlacementState(scenario_store)
+                rng = random.Random()
+                # seed=None iken de aynı rastgele sayılar
+                rng.setstate(checkpoint['rng'] if checkpoint is not None else self.rng_state)
+                metrics = run_greedy(scenario_store, state, rng=rng, log_level=LOG_OFF,
+                                     params=self.params)
+                resumed_at = (1, 0)
+            else:
+                assigned = array('i')
+                assigned.frombytes(checkpoint['assigned'])
+                remaining = array('i', checkpoint['remaining'])
+                for firm, capacity in changes.items():
+                    remaining[firm] += capacity - store.capacity[firm]
+                state = PlacementState(scenario_store, assigned, remaining)
+                state.set_available_order(checkpoint['available'])
+                placed = checkpoint['placed'][:fill + 1]
+                for student, firm in zip(placed, checkpoint['firms']):
+                    state.place(student, firm)
+                order = checkpoint['order']
+                position = order.index(placed[-1]) + 1 if len(placed) else 0
+                rng = random.Random()
+                rng.setstate(checkpoint['rng'])
+                metrics = run_greedy(scenario_store, state, rng=rng, log_level=LOG_OFF,
+                                     params=self.params,
+                                     resume={'iteration': checkpoint['iteration'],
+                                             'phase': checkpoint['phase'], 'order': order,
+                                             'position': position, 'placed': placed})
+                metrics['rejections'] += checkpoint['rejections']
+                resumed_at = (checkpoint['iteration'], position)
+            score = metrics['satisfaction_score']
+        return {
+            'changes': {store.firm_ids[firm]: capacity for firm, capacity in changes.items()},
+            'satisfaction_score': score,
+            'gain': score - self.satisfaction_score,
+            'seats': seats,
+            'resumed_at': resumed_at,
+            'time': time.perf_counter() - start,
+            'metrics': metrics,
+            'state': state,
+        }
+
+    def evaluate(self, scenarios):
+        """Senaryo listesini değerlendir (sonuçlarda metrics ve state tutulmaz)"""
+        results = []
+        for scenario in scenarios:
+            result = self.run_scenario(scenario)
+            del result['metrics'], result['state']
+            results.append(result)
+        return results
+
+    def marginal_seats(self, firms=None, seats=1):
+        """
+        Firma başına eklenen kontenjanların marjinal memnuniyeti
+        firms: firma id'leri (varsayılan tümü); her firma için 1..seats kontenjan eklenir
+        Dönüş (ortalama marjinale göre azalan): firm, capacity, seats, satisfaction_score,
+        gain, marginal (kontenjan başına ortalama kazanç), per_seat (k. kontenjanın kazancı)
+        """
+        store = self.store
+        firms = list(store.firm_ids) if firms is None else list(firms)
+        scenarios = [{firm_id: store.capacity[store.firm_index[firm_id]] + k}
+                     for firm_id in firms for k in range(1, seats + 1)]
+        results = self.evaluate(scenarios)
+        rows = []
+        for i, firm_id in enumerate(firms):
+            scores = [self.satisfaction_score] + [
+                result['satisfaction_score'] for result in results[i * seats:(i + 1) * seats]
+            ]
+            rows.append({
+                'firm': firm_id,
+                'capacity': store.capacity[store.firm_index[firm_id]],
+                'seats': seats,
+                'satisfaction_score': scores[-1],
+                'gain': scores[-1] - scores[0],
+                'marginal': (scores[-1] - scores[0]) / seats,
+                'per_seat': [scores[k] - scores[k - 1] for k in range(1, seats + 1)],
+            })
+        rows.sort(key=lambda row: -row['marginal'])
+        return rows
+
+
+# ==================== KOMUT SATIRI ====================
+
+def parse_capacity(items):
+    """FIRMA=KAPASITE listesini senaryo sözlüğüne çevir"""
+    scenario = {}
+    for item in items:
+        firm_id, sep, capacity = item.partition('=')
+        if not sep:
+            raise ValueError(f"FIRMA=KAPASITE biçiminde olmalı: {item}")
+        scenario[firm_id] = int(capacity)
+    return scenario
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Kapasite senaryolarını tek bir temel greedy çalıştırmasını paylaşarak "
+                    "değerlendir"
+    )
+    parser.add_argument('--seats', type=int, default=1,
+                        help="Firma başına eklenecek kontenjan sayısı (marjinal tablo)")
+    parser.add_argument('--firm', nargs='+', default=None, dest='firm_ids',
+                        help="Marjinal tabloda sadece bu firmalar (varsayılan tümü)")
+    parser.add_argument('--scenario', nargs='+', action='append', default=[],
+                        metavar='FIRMA=KAPASITE',
+                        help="Ayrıca değerlendirilecek senaryo (birden çok verilebilir)")
+    parser.add_argument('--top', type=int, default=20, help="Gösterilecek firma sayısı")
+    parser.add_argument('--seed', type=int, default=None, help="Rastgele tohum")
+    parser.add_argument('--no-rejection', action='store_true',
+                        help="Firma reddetmesini kapat (deterministik sonuç)")
+    parser.add_argument('--students', default="students.csv", help="Öğrenci CSV dosyası")
+    parser.add_argument('--firms', default="firms.csv", help="Firma CSV dosyası")
+    parser.add_argument('--no-cache', action='store_true',
+                        help="İkili veri önbelleğini kullanma, CSV'leri her seferinde oku")
+    args = parser.parse_args(argv)
+    if args.seats < 1:
+        parser.error("--seats en az 1 olmalı")
+    return args
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    store = load_store(args.students, args.firms, cache=not args.no_cache)
+    params = {'rejection_probability': 0} if args.no_rejection else None
+    try:
+        scenarios = [parse_capacity(items) for items in args.scenario]
+        if args.firm_ids:
+            unknown = [fid for fid in args.firm_ids if fid not in store.firm_index]
+            if unknown:
+                raise ValueError(f"Bilinmeyen firma: {', '.join(unknown)}")
+        whatif = CapacityWhatIf(store, args.seed, params)
+        print(f"Temel greedy: memnuniyet {whatif.satisfaction_score}, "
+              f"{whatif.baseline_time:.3f}sn")
+
+        for result in whatif.evaluate(scenarios):
+            changes = ", ".join(f"{fid}={cap}" for fid, cap in result['changes'].items())
+            print(f"{changes or '(değişiklik yok)'}: memnuniyet {result['satisfaction_score']} "
+                  f"({result['gain']:+d}), {result['time'] * 1000:.1f} ms")
+
+        start = time.perf_counter()
+        rows = whatif.marginal_seats(args.firm_ids, args.seats)
+        elapsed = time.perf_counter() - start
+    except ValueError as e:
+        print(f"Hata: {e}", file=sys.stderr)
+        return 2
+
+    print(f"\n{len(rows)} firma × {args.seats} kontenjan: {elapsed:.3f}sn")
+    per_seat = "  ".join(f"{k}.".rjust(5) for k in range(1, args.seats + 1))
+    print(f"{'Firma':<20} {'Kapasite':>8} {'Kazanç':>7} {'Marjinal':>9}  {per_seat}")
+    for row in rows[:args.top]:
+        seats = "  ".join(f"{gain:>5d}" for gain in row['per_seat'])
+        print(f"{row['firm']:<20} {row['capacity']:>8} {row['gain']:>+7d} "
+              f"{row['marginal']:>9.2f}  {seats}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())